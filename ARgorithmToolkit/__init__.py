@@ -5,15 +5,43 @@ Out of these modules, the utils modules is of upmost importance as the
 classes within the modules are neccessary for any Argorithm:
 
     >>> import ARgorithmToolkit
+
+Modules that need numpy are imported on first access, so importing the toolkit
+does not import numpy until an ARgorithm uses ``Array`` or a serializer:
+
+    >>> arr = ARgorithmToolkit.Array("arr",algo,data=[3,2,1])
 """
+import importlib
 from ARgorithmToolkit.utils import *
 from ARgorithmToolkit.vector import Vector
 from ARgorithmToolkit.stack import Stack
 from ARgorithmToolkit.queue import Queue
 from ARgorithmToolkit.priorityqueue import PriorityQueue
-from ARgorithmToolkit.array import Array
 from ARgorithmToolkit.string import String
 from ARgorithmToolkit.linkedlist import LinkedList,LinkedListNode,ForwardList
 from ARgorithmToolkit.doublylinkedlist import DoublyLinkedList,DoublyLinkedListNode,List
 from ARgorithmToolkit.map import Map
 from ARgorithmToolkit.set import Set
+from ARgorithmToolkit.streaming import StreamingStateSet
+from ARgorithmToolkit.timeline import Timeline
+
+_LAZY = {
+    "Array" : ("ARgorithmToolkit.array","Array"),
+    "array" : ("ARgorithmToolkit.array",None),
+    "serializers" : ("ARgorithmToolkit.serializers",None),
+}
+
+def __getattr__(name):
+    """Imports the modules in _LAZY when one of their attributes is first
+    accessed."""
+    if name not in _LAZY:
+        raise AttributeError(f"module 'ARgorithmToolkit' has no attribute '{name}'")
+    module_name,attribute = _LAZY[name]
+    module = importlib.import_module(module_name)
+    value = module if attribute is None else getattr(module,attribute)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    """Lists the attributes of the package including the lazy ones."""
+    return sorted(set(globals()) | set(_LAZY))
@@ -40,6 +40,9 @@ class ArrayState:
     """This class is used to generate states for various actions performed on
     the ``ARgorithmToolkit.array.Array`` object.
 
+    The body is stored in the state as given. ``Array`` passes read-only numpy
+    snapshots which are converted to lists only when the states are serialized.
+
     Attributes:
 
         name (str) : Name of the object for which the states are generated
@@ -64,7 +67,7 @@ class ArrayState:
         state_def = {
             "id": self._id,
             "variable_name" : self.name,
-            "body" : body.tolist()
+            "body" : body
         }
         return State(
             state_type=state_type,
@@ -90,7 +93,7 @@ class ArrayState:
         state_def = {
             "id" : self._id,
             "variable_name" : self.name,
-            "body" : body.tolist(),
+            "body" : body,
             "index" : index
         }
         if not (last_value is  None):
@@ -118,7 +121,7 @@ class ArrayState:
         state_def = {
             "id" : self._id,
             "variable_name" : self.name,
-            "body" : body.tolist(),
+            "body" : body,
             "index1" : indexes[0],
             "index2" : indexes[1]
         }
@@ -144,7 +147,7 @@ class ArrayState:
         state_def = {
             "id" : self._id,
             "variable_name" : self.name,
-            "body" : body.tolist(),
+            "body" : body,
             "index1" : indexes[0],
             "index2" : indexes[1]
         }
@@ -194,6 +197,12 @@ class Array(ARgorithmStructure):
     Raises:
         ARgorithmError: raised if name is not given or Stateset if not provided
 
+    Note:
+        States store a read-only copy of the array that is shared by all the
+        states generated until the array is modified. Modify the array through
+        the Array methods rather than ``body`` directly, otherwise the change
+        will not show up in the states.
+
     Examples:
         This is an example of array being declared using predefined values.
 
@@ -244,11 +253,12 @@ class Array(ARgorithmStructure):
         except Exception as ex:
             raise ARgorithmError("array structure needs a reference of template to store states") from ex
 
+        self._snapshot = None
         if data is not None:
             check_dimensions(data)
             self.body = np.array(data)
             self.dtype = self.body.dtype
-            state = self.state_generator.array_declare(self.body,comments)
+            state = self.state_generator.array_declare(self.snapshot(),comments)
             self.algo.add_state(state)
             return
 
@@ -256,9 +266,27 @@ class Array(ARgorithmStructure):
         self.dtype = dtype
         self.body = np.full(fill_value = fill, shape=shape, dtype=dtype)
 
-        state = self.state_generator.array_declare(self.body,comments)
+        state = self.state_generator.array_declare(self.snapshot(),comments)
         self.algo.add_state(state)
 
+    def snapshot(self):
+        """Returns a read-only copy of the array to be stored in states. The
+        copy is reused until the array is modified through ``__setitem__`` or
+        ``swap`` , so reading the array does not copy it again.
+
+        Returns:
+            numpy.ndarray: read-only copy of array
+
+        Example:
+            >>> arr.snapshot()
+            array([[1, 2, 3],
+                   [4, 5, 6]])
+        """
+        if self._snapshot is None:
+            self._snapshot = self.body.copy()
+            self._snapshot.flags.writeable = False
+        return self._snapshot
+
     def __len__(self):
         """returns length of array when processed by len() function.
 
@@ -307,19 +335,22 @@ class Array(ARgorithmStructure):
                 return Array(name=name , algo=self.algo , data=self.body[key] , comments=comments)
 
             if isinstance(key,int) and len(self.body.shape)==1:
-                state = self.state_generator.array_iter(body=self.body, index=key, comments=comments)
-                self.algo.add_state(state)
+                if self.algo.should_record("array_iter"):
+                    state = self.state_generator.array_iter(body=self.snapshot(), index=key, comments=comments)
+                    self.algo.add_state(state)
                 return self.body[key]
 
 
             if isinstance(key,int) or len(key) < len(self.shape()):
                 name = f"{self.state_generator.name}_sub"
-                state = self.state_generator.array_iter(body=self.body, index=key, comments=comments)
-                self.algo.add_state(state)
+                if self.algo.should_record("array_iter"):
+                    state = self.state_generator.array_iter(body=self.snapshot(), index=key, comments=comments)
+                    self.algo.add_state(state)
                 return Array(name=name, algo=self.algo, data=self.body[key], comments=comments)
 
-            state = self.state_generator.array_iter(body=self.body, index=key, comments=comments)
-            self.algo.add_state(state)
+            if self.algo.should_record("array_iter"):
+                state = self.state_generator.array_iter(body=self.snapshot(), index=key, comments=comments)
+                self.algo.add_state(state)
             return self.body[key]
         except Exception as ex:
             raise ARgorithmError(f"invalid index error : {str(ex)}") from ex
@@ -340,8 +371,10 @@ class Array(ARgorithmStructure):
         """
         last_value = self.body[key]
         self.body[key] = value
-        state = self.state_generator.array_iter(body=self.body, index=key, value=value, last_value=last_value, comments=f'Writing {value} at index {key}')
-        self.algo.add_state(state)
+        self._snapshot = None
+        if self.algo.should_record("array_iter"):
+            state = self.state_generator.array_iter(body=self.snapshot(), index=key, value=value, last_value=last_value, comments=f'Writing {value} at index {key}')
+            self.algo.add_state(state)
 
     def __iter__(self):
         """Generates a iterator object to iterate the array along its first
@@ -374,8 +407,9 @@ class Array(ARgorithmStructure):
         """
         item1 = self.body[index1]
         item2 = self.body[index2]
-        state = self.state_generator.array_compare(self.body,(index1,index2),comments)
-        self.algo.add_state(state)
+        if self.algo.should_record("array_compare"):
+            state = self.state_generator.array_compare(self.snapshot(),(index1,index2),comments)
+            self.algo.add_state(state)
         if func is None:
             def default_comparator(item1, item2):
                 return item1-item2
@@ -401,8 +435,10 @@ class Array(ARgorithmStructure):
             Do not try to swap subarrays in multidimensional arrays. It will lead to unexpected results
         """
         self.body[index1], self.body[index2] = self.body[index2], self.body[index1]
-        state = self.state_generator.array_swap(self.body, (index1, index2) ,comments)
-        self.algo.add_state(state)
+        self._snapshot = None
+        if self.algo.should_record("array_swap"):
+            state = self.state_generator.array_swap(self.snapshot(), (index1, index2) ,comments)
+            self.algo.add_state(state)
 
     def tolist(self):
         """Returns array as multidimensional list.
@@ -0,0 +1,187 @@
+"""The cache module stores the states generated by executions of ARgorithms on
+disk so that running the same code with the same config and parameters again
+does not import and execute the code again.
+
+Entries are content addressed. The key of an execution is a hash of the bytes
+of the code file, the config, the parameters, the StateSet defaults and limits
+it runs with and the toolkit itself, so any change to one of them results in a
+new entry instead of a stale result:
+
+    >>> cache = ARgorithmToolkit.cache.ExecutionCache("/tmp/executions")
+    >>> states = ARgorithmToolkit.security.execution_check(filename,configpath,parameters,cache=cache)
+
+Entries hold the states serialized by ``ARgorithmToolkit.serializers`` , so
+a server can send a cached payload without decoding it. ``get`` and ``put``
+store states in the binary format while ``load`` and ``store`` work on the
+payload of any format. Least recently used entries are removed once the cache
+holds more than ``max_entries`` entries or ``max_bytes`` bytes.
+"""
+import os
+import json
+import glob
+import struct
+import hashlib
+import tempfile
+from functools import lru_cache
+from ARgorithmToolkit.utils import ARgorithmError, State
+from ARgorithmToolkit.serializers import BinarySerializer, dumps
+
+SUFFIX = ".states"
+
+@lru_cache(maxsize=None)
+def toolkit_stamp():
+    """Hash of the names, sizes and modification times of the source files of
+    the installed toolkit. Changes whenever the toolkit is upgraded or edited.
+
+    Returns:
+        str: hex digest of the toolkit files
+    """
+    digest = hashlib.sha256()
+    for path in sorted(glob.glob(os.path.join(os.path.dirname(__file__),"*.py"))):
+        stat = os.stat(path)
+        digest.update(f"{os.path.basename(path)}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    return digest.hexdigest()
+
+def execution_key(code:bytes,config:dict,parameters:dict,options:dict=None):
+    """Computes the key of an execution.
+
+    Args:
+        code (bytes): The contents of the code file
+        config (dict): The config of the ARgorithm
+        parameters (dict): The parameters the ARgorithm is executed on
+        options (dict, optional): The StateSet defaults and limits the ARgorithm is executed with. Defaults to None.
+
+    Returns:
+        str: hex digest identifying the execution
+    """
+    digest = hashlib.sha256()
+    for part in [
+        code,
+        json.dumps(config,sort_keys=True,default=str).encode(),
+        json.dumps(parameters,sort_keys=True,default=str).encode(),
+        json.dumps(options,sort_keys=True,default=str).encode(),
+        toolkit_stamp().encode()
+    ]:
+        digest.update(len(part).to_bytes(8,"little"))
+        digest.update(part)
+    return digest.hexdigest()
+
+def _is_array_state(state_type):
+    """Whether states of given type hold the body of an Array, which
+    executions store as numpy arrays."""
+    return state_type.startswith("array_")
+
+class ExecutionCache:
+    """On-disk cache of serialized states keyed by ``execution_key``.
+
+    Attributes:
+        directory (str): The directory in which entries are stored. Created if it does not exist
+        max_entries (int, optional): Maximum number of entries kept. Defaults to 256.
+        max_bytes (int, optional): Maximum total size of entries kept. Defaults to 256 MB.
+
+    Example:
+        >>> cache = ARgorithmToolkit.cache.ExecutionCache(os.path.join(CACHE_DIR,"executions"))
+        >>> cache.put(key,algo.states)
+        >>> states = cache.get(key)
+    """
+    def __init__(self,directory:str,max_entries=256,max_bytes=256*2**20):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        os.makedirs(directory,exist_ok=True)
+
+    def _path(self,key,fmt):
+        """Path of the file of an entry."""
+        return os.path.join(self.directory,f"{key}.{fmt}{SUFFIX}")
+
+    def load(self,key:str,fmt="binary"):
+        """Returns the payload stored for key in given format and marks the
+        entry as recently used.
+
+        Args:
+            key (str): The key of the execution
+            fmt (str, optional): The format of the payload. Defaults to "binary".
+
+        Returns:
+            bytes: The serialized states, None if key is not cached
+        """
+        path = self._path(key,fmt)
+        try:
+            with open(path,'rb') as entry:
+                data = entry.read()
+            os.utime(path)
+        except OSError:
+            return None
+        return data
+
+    def store(self,key:str,data:bytes,fmt="binary"):
+        """Stores payload for key in given format and evicts least recently
+        used entries if the cache is over its limits.
+
+        Args:
+            key (str): The key of the execution
+            data (bytes): The serialized states
+            fmt (str, optional): The format of the payload. Defaults to "binary".
+        """
+        fd,tmp = tempfile.mkstemp(dir=self.directory,suffix=".tmp")
+        with os.fdopen(fd,'wb') as entry:
+            entry.write(data)
+        os.replace(tmp,self._path(key,fmt))
+        self.evict()
+
+    def get(self,key:str):
+        """Returns the states stored for key. Unreadable entries are removed.
+
+        Args:
+            key (str): The key of the execution
+
+        Returns:
+            list: list of ARgorithmToolkit.utils.State , None if key is not cached
+        """
+        data = self.load(key)
+        if data is None:
+            return None
+        try:
+            return [State(**x) for x in BinarySerializer(arrays=_is_array_state).loads(data)]
+        except (ARgorithmError,ValueError,IndexError,KeyError,struct.error):
+            self._remove(self._path(key,"binary"))
+            return None
+
+    def put(self,key:str,states:list):
+        """Stores states for key in the binary format.
+
+        Args:
+            key (str): The key of the execution
+            states (list): list of ARgorithmToolkit.utils.State
+        """
+        self.store(key,dumps(states,"binary"))
+
+    def evict(self):
+        """Removes least recently used entries until the cache is within
+        max_entries and max_bytes."""
+        entries = []
+        for path in glob.glob(os.path.join(self.directory,"*"+SUFFIX)):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime,stat.st_size,path))
+        entries.sort(reverse=True)
+        total = 0
+        for count,(_,size,path) in enumerate(entries):
+            total += size
+            if count >= self.max_entries or total > self.max_bytes:
+                self._remove(path)
+
+    def clear(self):
+        """Removes all entries."""
+        for path in glob.glob(os.path.join(self.directory,"*"+SUFFIX)):
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path):
+        """Removes file of an entry if it still exists."""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -1,8 +1,13 @@
 # pylint: disable=no-self-use
 # pylint: disable=too-many-statements
 # pylint: disable=raise-missing-from
+# pylint: disable=import-outside-toplevel
 """CLI tool for ARgorithm made using typer.
 
+Modules other than typer are imported by the commands that use them, so
+commands like ``--help`` start without importing numpy, requests or
+jsonschema.
+
 Example:
     $ ARgorithm --help
 """
@@ -11,19 +16,65 @@ import os
 import sys
 import re
 import json
+import time
+import base64
+import importlib
 import traceback
-import requests
+from bisect import bisect_left
+from functools import lru_cache
 import typer
-from halo import Halo
 import ARgorithmToolkit
-from ARgorithmToolkit.security import injection_check,execution_check
-from ARgorithmToolkit.parser import input_data,create,validateconfig,ValidationError
 
 CLOUD_URL = "https://argorithm.el.r.appspot.com"
 CACHE_DIR = typer.get_app_dir("ARgorithm")
+VERIFY_TTL = 600
+CATALOGUE_TTL = 300
+RETRIES = 3
+BACKOFF = 0.3
+COMPLETION_TIMEOUT = 0.5
 
 app = typer.Typer(help="ARgorithm CLI")
 
+class LazyModule():
+    """Stands in for a module and imports it on first attribute access."""
+    def __init__(self,name:str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self,attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module,attr)
+
+requests = LazyModule("requests")
+halo = LazyModule("halo")
+
+@lru_cache(maxsize=None)
+def session(retries:int=None):
+    """Returns the requests session shared by all commands. The session keeps
+    connections to the server open between requests and retries failed
+    connections and 502, 503 and 504 responses up to RETRIES times with
+    exponential backoff. A separate session is kept for every other number of
+    retries."""
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    retry = Retry(total=RETRIES if retries is None else retries,backoff_factor=BACKOFF,status_forcelist=(502,503,504),raise_on_status=False)
+    adapter = HTTPAdapter(max_retries=retry)
+    http = requests.Session()
+    http.mount("http://",adapter)
+    http.mount("https://",adapter)
+    return http
+
+def token_expiry(token:str):
+    """Reads the expiry of a JWT access token without verifying it. Returns
+    None if the token carries no expiry."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except (IndexError,ValueError,KeyError,TypeError):
+        return None
+
 class Messager():
     """Class for pretty printing messages using typer."""
     def msg(self,tag:str,title:str,message:str,color:str):
@@ -94,8 +145,8 @@ class Settings():
     def set_endpoint(self,url):
         """set up cloud endpoint."""
         try:
-            with Halo(text='Connecting', spinner='dots'):
-                rq = requests.get(url+"/argorithm")
+            with halo.Halo(text='Connecting', spinner='dots'):
+                rq = session().get(url+"/argorithm")
             if rq.status_code == 200:
                 msg.good("Connected",f"web requests will now go to {url}")
             else:
@@ -117,11 +168,71 @@ class Settings():
 app_settings = Settings()
 
 class AuthManager():
-    """Handles authentication."""
+    """Handles authentication.
+
+    The token is stored in credfile along with the time it was last verified
+    by the server and whether the server has authentication enabled. Both are
+    trusted for VERIFY_TTL seconds, so consecutive commands do not ask the
+    server again, and a token past the expiry it carries is not sent at all.
+    """
     def __init__(self):
         """sets up credfile to store credentials."""
         self.credfile = os.path.join(CACHE_DIR,".credentials")
 
+    def read(self):
+        """reads credentials cached for the current endpoint."""
+        try:
+            with open(self.credfile,'r') as cred:
+                text = cred.read()
+        except OSError:
+            return {}
+        try:
+            data = json.loads(text)
+        except ValueError:
+            data = None
+        if not isinstance(data,dict):
+            # credentials written by earlier versions only hold the token
+            data = {"token" : text}
+        if data.get("endpoint") != app_settings.get_endpoint():
+            data = {"token" : data.get("token")}
+        return data
+
+    def write(self,**values):
+        """updates credentials cached for the current endpoint."""
+        data = self.read()
+        data.update(values)
+        data["endpoint"] = app_settings.get_endpoint()
+        with open(self.credfile,'w+') as cred:
+            json.dump(data,cred)
+
+    def fresh(self,data:dict):
+        """checks whether cached token can be used without verifying it."""
+        token = data.get("token")
+        if not token:
+            return False
+        expiry = token_expiry(token)
+        now = time.time()
+        if expiry is not None and expiry <= now:
+            return False
+        return now - data.get("verified",0) < VERIFY_TTL
+
+    def verify(self,token:str):
+        """verifies token with server and caches the result."""
+        expiry = token_expiry(token)
+        if expiry is not None and expiry <= time.time():
+            return False
+        url = app_settings.get_endpoint()
+        try:
+            with halo.Halo(text='Connecting', spinner='dots'):
+                rq = session().post(f"{url}/programmers/verify" , headers = {"authorization" : "Bearer "+token})
+        except requests.RequestException as rqe:
+            msg.fail("Connection failed",str(rqe))
+            raise typer.Abort()
+        if rq.status_code == 200:
+            self.write(token=token,verified=time.time())
+            return True
+        return False
+
     def register(self):
         """registers account."""
         email = typer.prompt("Enter email address")
@@ -138,8 +249,8 @@ class AuthManager():
             "password" : password
         }
         try:
-            with Halo(text='Connecting', spinner='dots'):
-                rq = requests.post(url,data)
+            with halo.Halo(text='Connecting', spinner='dots'):
+                rq = session().post(url,data)
         except requests.RequestException as rqe:
             msg.fail("Connection failed",str(rqe))
             raise typer.Abort()
@@ -161,8 +272,8 @@ class AuthManager():
             "password" : password
         }
         try:
-            with Halo(text='Connecting', spinner='dots'):
-                rq = requests.post(url,data)
+            with halo.Halo(text='Connecting', spinner='dots'):
+                rq = session().post(url,data)
         except requests.RequestException as rqe:
             msg.fail("Connection failed",str(rqe))
             raise typer.Abort()
@@ -177,24 +288,16 @@ class AuthManager():
         elif rq.status_code == 200:
             msg.good("logged in successfully","credentials saved in cache")
             token = json.loads(rq.content)['access_token']
-            with open(self.credfile,'w+') as cred:
-                cred.write(token)
+            self.write(token=token,verified=time.time())
             return token
         raise typer.Exit(1)
 
     def get_token(self,flag=False):
         """returns valid authorization token."""
-        url = app_settings.get_endpoint()
-        if os.path.isfile(self.credfile):
-            with open(self.credfile,'r') as cred:
-                token = cred.read()
-            try:
-                with Halo(text='Connecting', spinner='dots'):
-                    rq = requests.post(f"{url}/programmers/verify" , headers = {"authorization" : "Bearer "+token})
-            except requests.RequestException as rqe:
-                msg.fail("Connection failed",str(rqe))
-                raise typer.Abort()
-            if rq.status_code == 200:
+        data = self.read()
+        token = data.get("token")
+        if token:
+            if self.fresh(data) or self.verify(token):
                 override = False
                 if flag:
                     override = typer.confirm("Found existing valid token. do you want to login again?")
@@ -202,10 +305,7 @@ class AuthManager():
                     return token
             else:
                 msg.warn("Valid credentials not found","Please enter login credentials again")
-        token = self.login_prompt()
-        with open(self.credfile,'w+') as cred:
-            cred.write(token)
-        return token
+        return self.login_prompt()
 
     def get_header(self):
         """Get authentication header."""
@@ -217,17 +317,19 @@ class AuthManager():
 
     def auth_check(self):
         """checks if AUTH is enabled on server."""
+        data = self.read()
+        if "auth" in data and time.time() - data.get("auth_checked",0) < VERIFY_TTL:
+            return data["auth"]
         try:
             url = app_settings.get_endpoint() + "/auth"
             try:
-                with Halo(text='Connecting', spinner='dots'):
-                    rq = requests.get(url)
+                with halo.Halo(text='Connecting', spinner='dots'):
+                    rq = session().get(url)
             except requests.RequestException as rqe:
                 msg.fail("Connection failed",str(rqe))
                 raise typer.Abort()
-            if rq.status_code == 200:
-                return True
-            return False
+            self.write(auth=rq.status_code == 200,auth_checked=time.time())
+            return rq.status_code == 200
         except Exception as ex:
             msg.warn("authentication error",str(ex))
             raise typer.Abort()
@@ -242,6 +344,126 @@ class AuthManager():
 
 authmanager = AuthManager()
 
+class Catalogue():
+    """Local copy of the list of argorithms on the server.
+
+    The list is stored in CACHE_DIR and used for CATALOGUE_TTL seconds. After
+    that it is revalidated with the ETag and Last-Modified headers of the last
+    response, so an unchanged list is not downloaded again. If the server
+    cannot be reached the stored list is used.
+    """
+    def __init__(self):
+        """sets up in-process copy of catalogue."""
+        self._data = None
+        self._index = None
+        self._mtime = None
+
+    def path(self):
+        """returns file the catalogue is stored in."""
+        return os.path.join(CACHE_DIR,"catalogue.json")
+
+    def mtime(self):
+        """returns modification time of stored catalogue."""
+        try:
+            return os.stat(self.path()).st_mtime_ns
+        except OSError:
+            return None
+
+    def load(self):
+        """returns catalogue stored for the current endpoint. The in-process
+        copy is read again if another process has stored the catalogue."""
+        mtime = self.mtime()
+        if self._data is None or mtime != self._mtime or self._data.get("endpoint") != app_settings.get_endpoint():
+            try:
+                with open(self.path(),'r') as stored:
+                    data = json.load(stored)
+            except (OSError,ValueError):
+                data = {}
+            if data.get("endpoint") != app_settings.get_endpoint():
+                data = {"endpoint" : app_settings.get_endpoint(), "items" : None}
+            self._data = data
+            self._index = None
+            self._mtime = mtime
+        return self._data
+
+    def save(self,data:dict):
+        """stores catalogue."""
+        self._data = data
+        self._index = None
+        with open(self.path(),'w') as stored:
+            json.dump(data,stored)
+        self._mtime = self.mtime()
+
+    def items(self,refresh:bool=True,timeout:float=None,retries:int=None):
+        """returns list of argorithms, revalidated with server if stale. The
+        request is retried RETRIES times unless retries is given.
+
+        Raises:
+            requests.RequestException: Raised if the server cannot be reached and no list is stored
+        """
+        data = self.load()
+        if data["items"] is not None and (not refresh or time.time() - data.get("fetched",0) < CATALOGUE_TTL):
+            return data["items"]
+        headers = {}
+        if data["items"] is not None:
+            if data.get("etag"):
+                headers["If-None-Match"] = data["etag"]
+            if data.get("last_modified"):
+                headers["If-Modified-Since"] = data["last_modified"]
+        try:
+            rq = session(retries).get(data["endpoint"]+"/argorithms/list",headers=headers,timeout=timeout)
+        except requests.RequestException:
+            if data["items"] is None:
+                raise
+            return data["items"]
+        if rq.status_code == 304:
+            data["fetched"] = time.time()
+        elif rq.status_code == 200:
+            data = {
+                "endpoint" : data["endpoint"],
+                "items" : json.loads(rq.content),
+                "etag" : rq.headers.get("ETag"),
+                "last_modified" : rq.headers.get("Last-Modified"),
+                "fetched" : time.time()
+            }
+        elif data["items"] is None:
+            raise requests.RequestException(f"server responded with {rq.status_code}")
+        else:
+            return data["items"]
+        self.save(data)
+        return data["items"]
+
+    def index(self,refresh:bool=True):
+        """returns argorithmIDs in sorted order and a dictionary of
+        argorithms by argorithmID, built once per version of catalogue."""
+        items = self.items(refresh=refresh)
+        if self._index is None:
+            by_id = {x["argorithmID"] : x for x in items}
+            self._index = (sorted(by_id),by_id)
+        return self._index
+
+    def get(self,argorithm_id:str,refresh:bool=True):
+        """returns argorithm with given argorithmID, None if not in catalogue."""
+        return self.index(refresh)[1].get(argorithm_id)
+
+    def prefix(self,incomplete:str):
+        """returns argorithmIDs starting with incomplete from stored catalogue."""
+        ids,_ = self.index(refresh=False)
+        start = bisect_left(ids,incomplete)
+        end = start
+        while end < len(ids) and ids[end].startswith(incomplete):
+            end += 1
+        return ids[start:end]
+
+    def invalidate(self):
+        """marks catalogue stale so that it is revalidated on next use."""
+        data = self.load()
+        if data["items"] is not None:
+            data["fetched"] = 0
+            self.save(data)
+
+catalogue = Catalogue()
+
 def name_check(value:str):
     """checks validity of argorithmID."""
     rules = r"^[A-Za-z_]+$"
@@ -267,6 +489,16 @@ def autocomplete(incomplete:str):
                 res.append(os.path.join(local_directory,filename))
     return res
 
+def autocomplete_id(incomplete:str):
+    """autocomplete function for argorithmIDs on server. Without a stored
+    catalogue it is fetched once without retries, so that an unreachable
+    server does not block the shell for longer than COMPLETION_TIMEOUT."""
+    try:
+        catalogue.items(refresh=False,timeout=COMPLETION_TIMEOUT,retries=0)
+        return catalogue.prefix(incomplete)
+    except requests.RequestException:
+        return []
+
 class CodeManager():
     """Handles file verification, testing and submissions."""
     def __init__(self,filename):
@@ -285,11 +517,25 @@ class CodeManager():
 
     def verify(self):
         """checks whether files are valid or not."""
-        injection_check(self.codepath)
+        from ARgorithmToolkit.security import injection_check,ARgorithmInjectionError
+        from ARgorithmToolkit.parser import validateconfig
+        try:
+            injection_check(self.codepath)
+        except ARgorithmInjectionError as aie:
+            msg.warn("Code file rejected","\n".join(f"{self.codepath}:{x}" for x in aie.diagnostics))
+            raise typer.Exit(1)
         validateconfig(self.configpath)
 
-    def test(self,prompt:bool=False):
-        """Execute code locally."""
+    def test(self,prompt:bool=False,use_cache:bool=False,timeout:float=None):
+        """Execute code locally and return the content of its states. If
+        use_cache is True, the JSON payload of the execution is cached in the
+        CACHE_DIR and a cached payload is returned without executing the code.
+        If timeout is given, the code is executed in a worker process that is
+        stopped after timeout seconds."""
+        from ARgorithmToolkit.security import execution_check,serialized_execution
+        from ARgorithmToolkit.cache import ExecutionCache
+        from ARgorithmToolkit.executor import Executor
+        from ARgorithmToolkit.parser import input_data
         try:
             with open(self.configpath,'r') as configfile:
                 config = json.load(configfile)
@@ -302,7 +548,16 @@ class CodeManager():
                 typer.echo("using parameters:")
                 for key in parameters:
                     typer.echo(f"- {key} : {parameters[key]}")
-            return execution_check(self.codepath,self.configpath,parameters)
+            cache = ExecutionCache(os.path.join(CACHE_DIR,"executions")) if use_cache else None
+            if timeout is not None:
+                with Executor(workers=1,timeout=timeout,cache=cache) as pool:
+                    return json.loads(pool.run(self.codepath,self.configpath,parameters))
+            if cache is not None:
+                return json.loads(serialized_execution(self.codepath,self.configpath,parameters,cache=cache))
+            return [x.content for x in execution_check(self.codepath,self.configpath,parameters)]
+        except ARgorithmToolkit.ARgorithmLimitError as ale:
+            msg.warn("Execution Failed",str(ale))
+            raise typer.Exit(1)
         except AssertionError:
             msg.warn("Execution Failed","execution should return ARgorithmToolkit.StateSet")
             raise typer.Exit(1)
@@ -328,13 +583,14 @@ class CodeManager():
         files,header = self.generate_submission()
         url = app_settings.get_endpoint()+"/argorithms/insert"
         try:
-            with Halo(text='Connecting', spinner='dots'):
-                rq = requests.post(url,files=files,headers=header)
+            with halo.Halo(text='Connecting', spinner='dots'):
+                rq = session().post(url,files=files,headers=header)
         except requests.RequestException as rqe:
             msg.fail("Connection failed",str(rqe))
             raise typer.Abort()
         if rq.status_code == 200:
             msg.good("Submitted")
+            catalogue.invalidate()
         elif rq.status_code == 409:
             msg.warn("Already exists","An argorithm with this name already exists,try another argorithm name")
         elif rq.status_code == 406:
@@ -349,13 +605,14 @@ class CodeManager():
         files,header = self.generate_submission()
         url = app_settings.get_endpoint()+"/argorithms/update"
         try:
-            with Halo(text='Connecting', spinner='dots'):
-                rq = requests.post(url,files=files,headers=header)
+            with halo.Halo(text='Connecting', spinner='dots'):
+                rq = session().post(url,files=files,headers=header)
         except requests.RequestException as rqe:
             msg.fail("Connection failed",str(rqe))
             raise typer.Abort()
         if rq.status_code == 200:
             msg.good("updated")
+            catalogue.invalidate()
         elif rq.status_code == 404:
             msg.warn("Not found","Try submit command to add argorithm to server")
         elif rq.status_code == 401:
@@ -405,6 +662,7 @@ def configure(
 
     More info at https://argorithm.github.io/toolkit/cli#configure
     """
+    from ARgorithmToolkit.parser import create,validateconfig,ValidationError
     directory,filename = os.path.split(filepath)
     name = filename[:-3]
     if not os.path.isfile(filepath):
@@ -452,10 +710,10 @@ def submit(
     More info at https://argorithm.github.io/toolkit/cli#submit
     """
     code = CodeManager(filename)
-    with Halo(text='Verifying', spinner='dots'):
+    with halo.Halo(text='Verifying', spinner='dots'):
         code.verify()
     msg.good("Files verified")
-    with Halo(text='Testing', spinner='dots'):
+    with halo.Halo(text='Testing', spinner='dots'):
         code.test(prompt=False)
     msg.good("Files verified")
     code.submit()
@@ -469,10 +727,10 @@ def update(
     More info at https://argorithm.github.io/toolkit/cli#update
     """
     code = CodeManager(filename)
-    with Halo(text='Verifying', spinner='dots'):
+    with halo.Halo(text='Verifying', spinner='dots'):
         code.verify()
     msg.good("Files verified")
-    with Halo(text='Testing', spinner='dots'):
+    with halo.Halo(text='Testing', spinner='dots'):
         code.test(prompt=False)
     msg.good("Files verified")
     code.update()
@@ -480,7 +738,7 @@ def update(
 
 @app.command()
 def delete(
-    argorithm_id:str = typer.Argument(... , help="argorithmID of function to be deleted.")
+    argorithm_id:str = typer.Argument(... , help="argorithmID of function to be deleted." , autocompletion=autocomplete_id)
     ):
     """Deletes argorithm from server.
 
@@ -498,24 +756,36 @@ def delete(
     }
     url = app_settings.get_endpoint()+"/argorithms/delete"
     try:
-        with Halo(text='Connecting', spinner='dots'):
-            rq = requests.post(url,json=data,headers=header)
+        with halo.Halo(text='Connecting', spinner='dots'):
+            rq = session().post(url,json=data,headers=header)
     except requests.RequestException as rqe:
         msg.fail("Connection failed",str(rqe))
         raise typer.Abort()
     if rq.status_code == 200:
         msg.info("Deleted successfully",)
+        catalogue.invalidate()
     elif rq.status_code == 401:
         msg.warn("Not authorized","only author of argorithm or admin can delete it")
     else:
         msg.fail("application error")
 
 def search(argid,show=True):
-    """Searches argorithm on server."""
+    """Searches argorithm in catalogue and on server if catalogue does not
+    have it."""
+    try:
+        with halo.Halo(text='Connecting', spinner='dots'):
+            data = catalogue.get(argid)
+    except requests.RequestException:
+        data = None
+    if data is not None and "example" in data:
+        if show:
+            typer.echo("Found argorithm")
+            msg.menuitem(data)
+        return data
     url = app_settings.get_endpoint()+"/argorithms/view/"+argid
     try:
-        with Halo(text='Connecting', spinner='dots'):
-            rq = requests.get(url)
+        with halo.Halo(text='Connecting', spinner='dots'):
+            rq = session().get(url)
     except requests.RequestException as rqe:
         msg.fail("Connection failed",str(rqe))
         raise typer.Abort()
@@ -537,24 +807,21 @@ def list_argorithms():
 
     More info at https://argorithm.github.io/toolkit/cli#list
     """
-    url = app_settings.get_endpoint()+"/argorithms/list"
     try:
-        with Halo(text='Connecting', spinner='dots'):
-            rq = requests.get(url)
+        with halo.Halo(text='Connecting', spinner='dots'):
+            menu = catalogue.items()
     except requests.RequestException as rqe:
         msg.fail("Connection failed",str(rqe))
         raise typer.Abort()
-    if rq.status_code == 200:
-        menu = json.loads(rq.content)
-        if len(menu) == 0:
-            msg.warn("No argorithms")
-            raise typer.Exit(1)
-        for item in menu:
-            msg.menuitem(item)
+    if len(menu) == 0:
+        msg.warn("No argorithms")
+        raise typer.Exit(1)
+    for item in menu:
+        msg.menuitem(item)
 
 @app.command()
 def test(
-    argorithm_id:str = typer.Argument(... , help="argorithmID of function to be called. If not passed then menu will be presented"),
+    argorithm_id:str = typer.Argument(... , help="argorithmID of function to be called. If not passed then menu will be presented" , autocompletion=autocomplete_id),
     output:bool = typer.Option(False,'--output','-o',help="print results in json format",show_default=False),
     user_input:bool = typer.Option(False,'--user-input','-u',help="if present, takes input from user",show_default=False),
     ):
@@ -562,6 +829,7 @@ def test(
 
     More info at https://argorithm.github.io/toolkit/cli#test
     """
+    from ARgorithmToolkit.parser import input_data
     params = search(argorithm_id,show=not output)
     header=authmanager.get_header()
 
@@ -573,8 +841,8 @@ def test(
         data["parameters"] = input_data(params["parameters"])
     url = app_settings.get_endpoint()+"/argorithms/run"
     try:
-        with Halo(text='Connecting', spinner='dots'):
-            rq = requests.post(url,json=data,headers=header)
+        with halo.Halo(text='Connecting', spinner='dots'):
+            rq = session().post(url,json=data,headers=header)
     except requests.RequestException as rqe:
         msg.fail("Connection failed",str(rqe))
         raise typer.Abort()
@@ -590,7 +858,9 @@ def test(
 
 @app.command()
 def execute(
-    filename:str=typer.Argument(... , help="The code file to be submitted" , autocompletion=autocomplete)
+    filename:str=typer.Argument(... , help="The code file to be submitted" , autocompletion=autocomplete),
+    use_cache:bool = typer.Option(False,'--cache/--no-cache',help="caches the states and returns those of an identical execution without executing the code again"),
+    timeout:float = typer.Option(None,'--timeout','-t',help="if present, executes the code in a separate process stopped after given seconds",show_default=False)
     ):
     """Execute locally stored ARgorithms.
 
@@ -598,7 +868,7 @@ def execute(
     """
     code = CodeManager(filename)
     code.verify()
-    states = [x.content for x in code.test(prompt=True)]
+    states = code.test(prompt=True,use_cache=use_cache,timeout=timeout)
     msg.state({"data" : states})
 
 
@@ -661,8 +931,8 @@ def grant(
     header=authmanager.get_header()
     url = app_settings.get_endpoint()+"/admin/grant"
     try:
-        with Halo(text='Connecting', spinner='dots'):
-            rq = requests.post(url,json=data,headers=header)
+        with halo.Halo(text='Connecting', spinner='dots'):
+            rq = session().post(url,json=data,headers=header)
     except requests.RequestException as rqe:
         msg.fail("Connection failed",str(rqe))
         raise typer.Abort()
@@ -691,8 +961,8 @@ def revoke(
     header=authmanager.get_header()
     url = app_settings.get_endpoint()+"/admin/revoke"
     try:
-        with Halo(text='Connecting', spinner='dots'):
-            rq = requests.post(url,json=data,headers=header)
+        with halo.Halo(text='Connecting', spinner='dots'):
+            rq = session().post(url,json=data,headers=header)
     except requests.RequestException as rqe:
         msg.fail("Connection failed",str(rqe))
         raise typer.Abort()
@@ -724,8 +994,8 @@ def account_delete(
     else:
         url = app_settings.get_endpoint()+"/admin/delete_programmer"
     try:
-        with Halo(text='Connecting', spinner='dots'):
-            rq = requests.post(url,json=data,headers=header)
+        with halo.Halo(text='Connecting', spinner='dots'):
+            rq = session().post(url,json=data,headers=header)
     except requests.RequestException as rqe:
         msg.fail("Connection failed",str(rqe))
         raise typer.Abort()
@@ -753,8 +1023,8 @@ def blacklist(
     header=authmanager.get_header()
     url = app_settings.get_endpoint()+"/admin/black_list"
     try:
-        with Halo(text='Connecting', spinner='dots'):
-            rq = requests.post(url,json=data,headers=header)
+        with halo.Halo(text='Connecting', spinner='dots'):
+            rq = session().post(url,json=data,headers=header)
     except requests.RequestException as rqe:
         msg.fail("Connection failed",str(rqe))
         raise typer.Abort()
@@ -782,8 +1052,8 @@ def whitelist(
     header=authmanager.get_header()
     url = app_settings.get_endpoint()+"/admin/white_list"
     try:
-        with Halo(text='Connecting', spinner='dots'):
-            rq = requests.post(url,json=data,headers=header)
+        with halo.Halo(text='Connecting', spinner='dots'):
+            rq = session().post(url,json=data,headers=header)
     except requests.RequestException as rqe:
         msg.fail("Connection failed",str(rqe))
         raise typer.Abort()
@@ -0,0 +1,188 @@
+"""The delta module provides the functions used by
+``ARgorithmToolkit.utils.StateSet`` to store state bodies as differences from
+the previous body of the same data structure instead of full snapshots.
+
+A delta is a dictionary stored under the ``body_delta`` key of the state
+definition in place of ``body``. It always has a ``base`` key holding the index
+of the previous state of the same data structure, along with one of the
+following operations:
+
+- ``set`` : list of ``[index, value]`` pairs for lists of unchanged length,
+  numpy arrays of unchanged shape (index is a list for multidimensional
+  arrays) or ``[key, value]`` pairs for dictionaries
+- ``remove`` : list of keys removed from a dictionary or set
+- ``add`` : list of keys added to a set
+- ``splice`` : ``[start, stop, items]`` for lists and strings whose length
+  changed, meaning ``body[start:stop] = items``
+
+    >>> delta = ARgorithmToolkit.delta.diff([1,2,3],[1,5,3])
+    >>> delta
+    {'set': [[1, 5]]}
+    >>> ARgorithmToolkit.delta.patch([1,2,3],delta)
+    [1, 5, 3]
+
+Persistent maps and sets from ``ARgorithmToolkit.persistent`` are compared by
+walking only the branches the two versions do not share.
+"""
+import sys
+from collections.abc import Sequence
+from ARgorithmToolkit.persistent import PersistentMap, PersistentSet
+
+BLOCK = 256
+
+def _prefix(prev,curr,limit):
+    """Length of common prefix of two sequences, skipping equal blocks with
+    slice comparison."""
+    start = 0
+    while start+BLOCK <= limit and prev[start:start+BLOCK] == curr[start:start+BLOCK]:
+        start += BLOCK
+    while start < limit and prev[start] == curr[start]:
+        start += 1
+    return start
+
+def _suffix(prev,curr,limit):
+    """Length of common suffix of two sequences, not exceeding limit."""
+    end = 0
+    p,c = len(prev),len(curr)
+    while end+BLOCK <= limit and prev[p-end-BLOCK:p-end] == curr[c-end-BLOCK:c-end]:
+        end += BLOCK
+    while end < limit and prev[p-end-1] == curr[c-end-1]:
+        end += 1
+    return end
+
+def _changes(prev,curr):
+    """Lists ``[index, value]`` pairs where two lists of same length differ."""
+    changes = []
+    for start in range(0,len(curr),BLOCK):
+        block = curr[start:start+BLOCK]
+        if prev[start:start+BLOCK] != block:
+            changes.extend([start+i,y] for i,(x,y) in enumerate(zip(prev[start:start+BLOCK],block)) if x != y)
+    return changes
+
+def _diff_sequence(prev,curr):
+    """Computes delta between two lists or two strings."""
+    if len(prev) == len(curr) and isinstance(curr,list):
+        return {"set" : _changes(prev,curr)}
+    limit = min(len(prev),len(curr))
+    start = _prefix(prev,curr,limit)
+    end = _suffix(prev,curr,limit-start)
+    return {"splice" : [start, len(prev)-end, curr[start:len(curr)-end]]}
+
+def _is_array(value):
+    """Checks whether value is a numpy array without importing numpy, which
+    is loaded only once an ARgorithm uses it."""
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(value,np.ndarray)
+
+def _diff_array(prev,curr):
+    """Computes delta between two numpy arrays of same shape."""
+    changed = (prev != curr).nonzero()
+    if curr.ndim == 1:
+        changes = [[int(i),curr[i].item()] for i in changed[0]]
+    else:
+        changes = [[[int(x) for x in index],curr[index].item()] for index in zip(*changed)]
+    return {"set" : changes}
+
+def _diff_mapping(prev,curr):
+    """Computes delta between two dictionaries."""
+    changes = [[k,v] for k,v in curr.items() if k not in prev or prev[k] != v]
+    removed = [k for k in prev if k not in curr]
+    return {"set" : changes , "remove" : removed}
+
+def _diff_set(prev,curr):
+    """Computes delta between two sets."""
+    return {"add" : list(curr - prev) , "remove" : list(prev - curr)}
+
+def _delta_size(delta):
+    """Number of elements carried by a delta."""
+    if "splice" in delta:
+        return len(delta["splice"][2])
+    return sum(len(x) for x in delta.values())
+
+def diff(prev,curr):
+    """Computes the delta that converts ``prev`` into ``curr``.
+
+    Args:
+        prev: The previous body of the data structure
+        curr: The current body of the data structure
+
+    Returns:
+        dict: The delta if both bodies are of a supported type, else None
+    """
+    if type(prev) is not type(curr):
+        return None
+    if isinstance(curr,Sequence) and not isinstance(curr,(list,str)):
+        prev,curr = list(prev),list(curr)
+    if isinstance(curr,PersistentMap):
+        changes,removed = prev.changes(curr)
+        delta = {"set" : changes , "remove" : removed}
+    elif isinstance(curr,PersistentSet):
+        added,removed = prev.changes(curr)
+        delta = {"add" : added , "remove" : removed}
+    elif _is_array(curr):
+        if prev.shape != curr.shape or curr.dtype.kind not in "biuf":
+            return None
+        delta = _diff_array(prev,curr)
+    elif isinstance(curr,(list,str)):
+        delta = _diff_sequence(prev,curr)
+    elif isinstance(curr,dict):
+        delta = _diff_mapping(prev,curr)
+    elif isinstance(curr,set):
+        delta = _diff_set(prev,curr)
+    else:
+        return None
+    size = curr.size if _is_array(curr) else len(curr)
+    if _delta_size(delta) * 2 > max(size,1):
+        return None
+    return delta
+
+def patch(body,delta):
+    """Applies a delta to a body and returns the new body. The body passed is
+    not modified.
+
+    Args:
+        body: The body to which delta is to be applied
+        delta (dict): The delta generated by ``diff``
+
+    Returns:
+        The body after applying the delta
+    """
+    if isinstance(body,Sequence) and not isinstance(body,(list,str)):
+        body = list(body)
+    if "splice" in delta:
+        start,stop,items = delta["splice"]
+        return body[:start] + items + body[stop:]
+    if _is_array(body):
+        body = body.copy()
+        for index,value in delta["set"]:
+            body[tuple(index) if isinstance(index,list) else index] = value
+        body.flags.writeable = False
+        return body
+    if isinstance(body,list):
+        body = list(body)
+        for index,value in delta["set"]:
+            body[index] = value
+        return body
+    if isinstance(body,PersistentMap):
+        for key in delta.get("remove",[]):
+            body = body.delete(key)
+        for key,value in delta.get("set",[]):
+            body = body.set(key,value)
+        return body
+    if isinstance(body,PersistentSet):
+        for key in delta.get("remove",[]):
+            body = body.remove(key)
+        for key in delta.get("add",[]):
+            body = body.add(key)
+        return body
+    if isinstance(body,dict):
+        body = dict(body)
+        for key in delta.get("remove",[]):
+            del body[key]
+        for key,value in delta.get("set",[]):
+            body[key] = value
+        return body
+    body = set(body)
+    body.difference_update(delta.get("remove",[]))
+    body.update(delta.get("add",[]))
+    return body
@@ -14,6 +14,7 @@ These three classes can be directly imported from the toolkit:
     >>> dl = ARgorithmToolkit.List("dl",algo)
 """
 
+import weakref
 from ARgorithmToolkit.utils import ARgorithmHashable, ARgorithmStructure, State, StateSet, ARgorithmError
 from ARgorithmToolkit.encoders import serialize
 
@@ -162,6 +163,15 @@ class DoublyLinkedListNodeState:
             comments=comments
         )
 
+def _node_deleted(algo,state_generator):
+    """Records the deletion of a node. Called by the finalizer of the node, so
+    it must not hold a reference to the node itself."""
+    if algo.should_record("dllnode_delete"):
+        state = state_generator.dllnode_delete(
+            "Node was deleted"
+        )
+        algo.add_state(state)
+
 @serialize
 class DoublyLinkedListNode(ARgorithmStructure, ARgorithmHashable):
     """The DoublyLinkedListNode class is an implementation of a Linked list
@@ -169,6 +179,10 @@ class DoublyLinkedListNode(ARgorithmStructure, ARgorithmHashable):
     which we have to give a name to the instance, we dont have to provide name
     in the DoublyLinkedListNode Class.
 
+    The ``dllnode_delete`` state is recorded when ``release`` is called by the
+    List that owns the node, or by a finalizer once a node that is not part
+    of a List is garbage collected, whichever comes first.
+
     Attributes:
         algo (ARgorithmToolkit.utils.StateSet): The stateset that will store the states generated by the instance of DoublyLinkedListNode Class
         value: The value stored in the node
@@ -208,6 +222,8 @@ class DoublyLinkedListNode(ARgorithmStructure, ARgorithmHashable):
             self.value,self.next,self.prev,comments
         )
         self.algo.add_state(state)
+        self._finalizer = weakref.finalize(self,_node_deleted,self.algo,self.state_generator)
+        self._finalizer.atexit = False
 
     def __setattr__(self,key,value):
         """The __setattr__ function is overriden to listen to state changes in
@@ -230,41 +246,47 @@ class DoublyLinkedListNode(ARgorithmStructure, ARgorithmHashable):
         self.__dict__[key] = value
         if key == 'prev' and self._flag:
             if last_prev or self.prev:
-                state = self.state_generator.dllnode_prev(
-                    value=self.value,
-                    next_node=self.next,
-                    prev_node=self.prev,
-                    last_prev=last_prev,
-                    comments="prev pointer updated"
-                )
-                self.algo.add_state(state)
+                if self.algo.should_record("dllnode_prev"):
+                    state = self.state_generator.dllnode_prev(
+                        value=self.value,
+                        next_node=self.next,
+                        prev_node=self.prev,
+                        last_prev=last_prev,
+                        comments="prev pointer updated"
+                    )
+                    self.algo.add_state(state)
         elif key == 'next' and self._flag:
             if last_next or self.next:
-                state = self.state_generator.dllnode_next(
+                if self.algo.should_record("dllnode_next"):
+                    state = self.state_generator.dllnode_next(
+                        value=self.value,
+                        next_node=self.next,
+                        prev_node=self.prev,
+                        last_next=last_next,
+                        comments="next pointer updated"
+                    )
+                    self.algo.add_state(state)
+        elif key == 'value' and self._flag:
+            if self.algo.should_record("dllnode_iter"):
+                state = self.state_generator.dllnode_iter(
                     value=self.value,
                     next_node=self.next,
                     prev_node=self.prev,
-                    last_next=last_next,
-                    comments="next pointer updated"
+                    last_value=last_value,
+                    comments="value updated"
                 )
                 self.algo.add_state(state)
-        elif key == 'value' and self._flag:
-            state = self.state_generator.dllnode_iter(
-                value=self.value,
-                next_node=self.next,
-                prev_node=self.prev,
-                last_value=last_value,
-                comments="value updated"
-            )
-            self.algo.add_state(state)
-
-    def __del__(self):
-        """The __del__ function is overriden is there to listen to node
-        deletion."""
-        state = self.state_generator.dllnode_delete(
-            "Node was deleted"
-        )
-        self.algo.add_state(state)
+
+    def release(self):
+        """Records the deletion of node now instead of when it is garbage
+        collected. Calling it again or collecting the node later records
+        nothing.
+
+        Example:
+
+            >>> lis.tail.release()
+        """
+        self._finalizer()
 
     def __str__(self):
         return f"DoublyLinkedListNode({self.value}) at {self.name}"
@@ -424,11 +446,13 @@ class DoublyLinkedList(ARgorithmStructure, ARgorithmHashable):
             last_tail = self.tail._id if self.tail else "none"
         self.__dict__[key] = value
         if key == 'head' and self._flag:
-            state = self.state_generator.dll_head(self.head,self.tail,last_head=last_head,comments="head pointer shifts")
-            self.algo.add_state(state)
+            if self.algo.should_record("dll_head"):
+                state = self.state_generator.dll_head(self.head,self.tail,last_head=last_head,comments="head pointer shifts")
+                self.algo.add_state(state)
         if key == 'tail' and self._flag:
-            state = self.state_generator.dll_tail(self.head,self.tail,last_tail=last_tail,comments="tail pointer shifts")
-            self.algo.add_state(state)
+            if self.algo.should_record("dll_tail"):
+                state = self.state_generator.dll_tail(self.head,self.tail,last_tail=last_tail,comments="tail pointer shifts")
+                self.algo.add_state(state)
 
     def __str__(self):
         return f"DoublyLinkedList(head at {self.head})"
@@ -437,9 +461,21 @@ class DoublyLinkedList(ARgorithmStructure, ARgorithmHashable):
         return f"DoublyLinkedList(head at {self.head})"
 
 
+def _release_nodes(attributes):
+    """Releases the nodes of a List that is garbage collected, starting from
+    its head, and unlinks their prev pointers without states so that the
+    nodes are freed without waiting for the garbage collector. Called by the
+    finalizer of the List with its attributes, so it must not hold a
+    reference to the List itself."""
+    curr = attributes.get("head")
+    while curr:
+        curr.__dict__["prev"] = None
+        curr.release()
+        curr = curr.next
+
 class ListIterator:
     """This class is a generator that is returned each time an List has to be
-    iterated.
+    iterated. If reverse is true the List is iterated from its tail.
 
     Yields:
         Value of List Node
@@ -447,14 +483,18 @@ class ListIterator:
     Raises:
         AssertionError: If not declared with an instance of ARgorithmToolkit.doublylinkedlist.List
     """
-    def __init__(self,doublylist):
+    def __init__(self,doublylist,reverse=False):
         assert isinstance(doublylist,List)
-        self._curr = doublylist.head
+        self._reverse = reverse
+        self._curr = doublylist.tail if reverse else doublylist.head
+
+    def __iter__(self):
+        return self
 
     def __next__(self):
         if self._curr:
             data = self._curr.value
-            self._curr = self._curr.next
+            self._curr = self._curr.prev if self._reverse else self._curr.next
             return data
         raise StopIteration
 
@@ -465,6 +505,9 @@ class List(DoublyLinkedList):
     is a ready implementation of singly linked list. In the DoublyLinkedList class the
     programmer will have to make their own methods.
 
+    The List owns its nodes. Nodes it removes are released right away and the
+    remaining nodes are released once the List itself is garbage collected.
+
     Attributes:
         name (str): The name given to the linked list
         algo (ARgorithmToolkit.utils.StateSet): The stateset that will store the states generated by the instance of List Class
@@ -485,6 +528,8 @@ class List(DoublyLinkedList):
     def __init__(self,name:str,algo:StateSet,comments=""):
         super().__init__(name,algo,comments="")
         self.size = 0
+        self._finalizer = weakref.finalize(self,_release_nodes,self.__dict__)
+        self._finalizer.atexit = False
 
     def __len__(self):
         """overloads the len() operator to return size of list.
@@ -498,9 +543,55 @@ class List(DoublyLinkedList):
         """
         return self.size
 
+    def _node(self,index):
+        """Returns the node at index, walking from the head or the tail
+        whichever is nearer.
+
+        Raises:
+            ARgorithmError: Raised if index is out of range
+        """
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise ARgorithmError("index out of range")
+        if index < self.size // 2:
+            curr = self.head
+            for _ in range(index):
+                curr = curr.next
+        else:
+            curr = self.tail
+            for _ in range(self.size-1-index):
+                curr = curr.prev
+        return curr
+
+    def __getitem__(self,index):
+        """Returns the value at index, walking from the head or the tail
+        whichever is nearer.
+
+        Args:
+            index (int): The index of value. Negative indexes count from the back
+
+        Raises:
+            ARgorithmError: Raised if index is out of range
+
+        Returns:
+            element: The value at index
+
+        Example:
+
+            >>> lis
+            List([1, 2, 3])
+            >>> lis[2]
+            3
+            >>> lis[-3]
+            1
+        """
+        return self._node(index).value
+
     def insert(self,value,index=None):
         """Insert node with given value at particular index. If index is not
-        given,insert at back.
+        given,insert at back. The node before index is found by walking from
+        the head or the tail whichever is nearer.
 
         Args:
             value : The value to be inserted
@@ -517,14 +608,10 @@ class List(DoublyLinkedList):
         """
         if self.size == 0 or index == 0:
             self.push_front(value)
-        elif index is None or self.size < index:
+        elif index is None or self.size <= index:
             self.push_back(value)
         else:
-            count = 1
-            temp = self.head
-            while index > count:
-                count += 1
-                temp = temp.next
+            temp = self._node(index-1)
             curr = DoublyLinkedListNode(self.algo,value)
             curr.next = temp.next
             curr.prev = temp
@@ -606,12 +693,14 @@ class List(DoublyLinkedList):
         """
         if self.head is None:
             raise ARgorithmError("Empty list")
-        data = self.head.value
+        temp = self.head
+        data = temp.value
         self.head = self.head.next
         if self.head:
             self.head.prev = None
         else:
             self.tail = None
+        temp.release()
         self.size -= 1
         return data
 
@@ -634,15 +723,54 @@ class List(DoublyLinkedList):
         """
         if self.head is None:
             raise ARgorithmError("Empty list")
-        data = self.tail.value
+        temp = self.tail
+        data = temp.value
         self.tail = self.tail.prev
         if self.tail:
             self.tail.next = None
         else:
             self.head = None
+        temp.release()
         self.size -= 1
         return data
 
+    def erase(self,index):
+        """Removes the node at index, walking from the head or the tail
+        whichever is nearer.
+
+        Args:
+            index (int): The index of node to be removed. Negative indexes count from the back
+
+        Raises:
+            ARgorithmError: Raised if index is out of range
+
+        Returns:
+            element: The value of removed node
+
+        Example:
+
+            >>> lis
+            List([1, 2, 3, 4])
+            >>> lis.erase(2)
+            3
+            >>> lis
+            List([1, 2, 4])
+        """
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise ARgorithmError("index out of range")
+        if index == 0:
+            return self.pop_front()
+        if index == self.size-1:
+            return self.pop_back()
+        curr = self._node(index)
+        curr.prev.next = curr.next
+        curr.next.prev = curr.prev
+        curr.release()
+        self.size -= 1
+        return curr.value
+
     def front(self):
         """Returns the first element of list.
 
@@ -700,6 +828,20 @@ class List(DoublyLinkedList):
         """
         return ListIterator(self)
 
+    def __reversed__(self):
+        """Returns the generator object to iterate through elements of List
+        from the back.
+
+        Returns:
+            ListIterator: Generator class for List
+
+        Example:
+
+            >>> [x for x in reversed(lis)]
+            [3, 3, 4, 4, 5, 3, 2]
+        """
+        return ListIterator(self,reverse=True)
+
     def remove(self,value):
         """Remove elements with given value from list.
 
@@ -723,9 +865,10 @@ class List(DoublyLinkedList):
         while curr:
             if curr.value == value:
                 self.size -= 1
-                if self.size == 1:
+                if self.size == 0:
                     self.head = None
                     self.tail = None
+                    curr.release()
                     break
                 if curr.prev:
                     curr.prev.next = curr.next
@@ -737,6 +880,7 @@ class List(DoublyLinkedList):
                 else:
                     self.tail = curr.prev
                     self.tail.next = None
+                curr.release()
             curr = curr.next
 
     def tolist(self):
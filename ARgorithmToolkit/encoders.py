@@ -1,11 +1,67 @@
 """For support of nested ARgorithm Classes, this module provides with a Encoder
 that stores the reference to ARgorithm Object whenever an ARgorithm Class
 object is serialized in the StateSet (which only happens when we nest one
-ARgorithm Class in another)"""
-import inspect
+ARgorithm Class in another)
+
+The encoder looks up how to serialize an object in a registry keyed by type.
+Classes decorated with ``serialize`` are added to the registry and other types
+can be added with ``register``:
+
+    >>> ARgorithmToolkit.encoders.register(complex, lambda o: [o.real, o.imag])
+"""
+import sys
 from json import JSONEncoder
-import numpy as np
-import ARgorithmToolkit
+from ARgorithmToolkit.utils import Variable
+from ARgorithmToolkit.persistent import PersistentMap, PersistentSet
+
+_HANDLERS = {}
+_RESOLVED = {}
+_LOADED = set()
+
+def register(cls,handler):
+    """Registers the function used to serialize objects of given class and its
+    subclasses.
+
+    Args:
+        cls (type): The class to be serialized
+        handler (function): Function that takes an object of cls and returns a JSON serializable value
+    """
+    _HANDLERS[cls] = handler
+    _RESOLVED.clear()
+
+def handler_for(cls):
+    """Returns the function used to serialize objects of given class.
+
+    The registry is first checked for the class itself and then for its base
+    classes in method resolution order. The result is cached so that each
+    class is resolved only once.
+
+    Args:
+        cls (type): The class of the object to be serialized
+
+    Returns:
+        function: The handler, None if class is not serializable
+    """
+    try:
+        return _RESOLVED[cls]
+    except KeyError:
+        pass
+    if "numpy" not in _LOADED and "numpy" in sys.modules:
+        _register_numpy()
+    handler = None
+    for base in cls.__mro__:
+        if base in _HANDLERS:
+            handler = _HANDLERS[base]
+            break
+    _RESOLVED[cls] = handler
+    return handler
+
+def _reference(o):
+    """Serializes ARgorithm class objects as references."""
+    try:
+        return o.to_json()
+    except Exception as ex:
+        raise TypeError("Unserializable ARgorithm class",) from ex
 
 def serialize(cls):
     """Decorator to make classes serializable."""
@@ -16,8 +72,39 @@ def serialize(cls):
         obj_id = id(self)
         return f"$ARgorithmToolkit.{class_name}:{obj_id}"
     setattr(cls,'to_json',to_json)
+    register(cls,_reference)
     return cls
 
+def numpy_handlers():
+    """Returns the handlers of numpy types.
+
+    Returns:
+        dict: Maps numpy types to their handlers
+    """
+    import numpy as np # pylint: disable=import-outside-toplevel
+    return {
+        np.integer : int,
+        np.floating : float,
+        np.complexfloating : lambda o: {'real': o.real, 'imag': o.imag},
+        np.ndarray : lambda o: o.tolist(),
+        np.bool_ : bool,
+        np.void : lambda o: None,
+    }
+
+def _register_numpy():
+    """Registers the handlers of numpy types. The toolkit does not import
+    numpy until an ARgorithm uses it, so numpy objects can only be met once
+    numpy is in ``sys.modules`` and registering them is put off until then."""
+    _LOADED.add("numpy")
+    for cls,handler in numpy_handlers().items():
+        register(cls,handler)
+
+register(Variable,lambda o: o.value)
+register(set,list)
+register(frozenset,list)
+register(PersistentMap,PersistentMap.to_dict)
+register(PersistentSet,PersistentSet.to_list)
+
 class StateEncoder(JSONEncoder):
     """The custon Encoder to be used to convert StateSet into JSON.
 
@@ -29,27 +116,7 @@ class StateEncoder(JSONEncoder):
         Args:
             o ([type]): The object to be serialized
         """
-        classes = inspect.getmembers(ARgorithmToolkit,inspect.isclass)
-        classes = tuple([x for _,x in classes])
-        if isinstance(ARgorithmToolkit.Variable,classes) :
-            return super().default(o.value)
-        if isinstance(o, classes):
-            try:
-                return o.to_json()
-            except Exception as ex:
-                raise TypeError("Unserializable ARgorithm class",) from ex
-        if isinstance(o, (np.int_, np.intc, np.intp, np.int8,
-                            np.int16, np.int32, np.int64, np.uint8,
-                            np.uint16, np.uint32, np.uint64)):
-            return int(o)
-        if isinstance(o, (np.float_, np.float16, np.float32, np.float64)):
-            return float(o)
-        if isinstance(o, (np.complex_, np.complex64, np.complex128)):
-            return {'real': o.real, 'imag': o.imag}
-        if isinstance(o, (np.ndarray,)):
-            return o.tolist()
-        if isinstance(o, (np.bool_)):
-            return bool(o)
-        if isinstance(o, (np.void)):
-            return None
-        return super().default(o)
+        handler = handler_for(type(o))
+        if handler is None:
+            return super().default(o)
+        return handler(o)
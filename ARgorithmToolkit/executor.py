@@ -0,0 +1,254 @@
+"""The executor module runs ARgorithms in a pool of worker processes instead of
+the calling process. Workers import ARgorithmToolkit and numpy when they start
+so requests do not pay for these imports, and several ARgorithms can run
+concurrently:
+
+    >>> with ARgorithmToolkit.executor.Executor(workers=4,timeout=10) as pool:
+    ...     data = pool.run("bubblesort.py","bubblesort.config.json",{"array" : [3,2,1]})
+    >>> states = ARgorithmToolkit.serializers.loads(data)
+
+Every run is subject to the limits of the executor:
+
+- ``timeout`` : wall-clock seconds. The worker is killed and replaced once it
+  is exceeded
+- ``cpu_time`` : CPU seconds used by the run
+- ``memory`` : bytes of address space the run may allocate on top of what the
+  worker uses when idle
+- ``max_states`` : number of states the ARgorithm may generate. The run stops
+  as soon as it is exceeded
+
+CPU and memory limits are set with the ``resource`` module and are only
+enforced on platforms that provide it. A run that exceeds a limit raises
+``ARgorithmToolkit.utils.ARgorithmLimitError`` , errors raised by the
+ARgorithm itself are raised again in the calling process.
+"""
+import os
+import json
+import threading
+import multiprocessing
+from queue import Queue
+from concurrent.futures import ThreadPoolExecutor
+from ARgorithmToolkit.utils import ARgorithmError, ARgorithmLimitError
+from ARgorithmToolkit.cache import execution_key
+from ARgorithmToolkit.security import execution_options
+
+try:
+    import resource
+except ImportError: # pragma: no cover
+    resource = None
+
+def _address_space():
+    """Current address space of the process in bytes, 0 if unknown."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError,ValueError,AttributeError):
+        return 0
+
+def _set_limits(cpu_time,memory):
+    """Lowers the CPU and address space limits of the worker for one run and
+    returns the previous limits."""
+    if resource is None:
+        return None
+    previous = (resource.getrlimit(resource.RLIMIT_CPU),resource.getrlimit(resource.RLIMIT_AS))
+    if cpu_time is not None:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        soft = int(usage.ru_utime + usage.ru_stime + cpu_time) + 1
+        resource.setrlimit(resource.RLIMIT_CPU,(soft,previous[0][1]))
+    if memory is not None:
+        resource.setrlimit(resource.RLIMIT_AS,(_address_space() + memory,previous[1][1]))
+    return previous
+
+def _reset_limits(previous):
+    """Restores limits returned by _set_limits."""
+    if previous is not None:
+        resource.setrlimit(resource.RLIMIT_CPU,previous[0])
+        resource.setrlimit(resource.RLIMIT_AS,previous[1])
+
+def _worker(conn):
+    """Main loop of a worker process. Receives runs from conn and sends back
+    the serialized states or the exception raised."""
+    import numpy # pylint: disable=import-outside-toplevel,unused-import
+    from ARgorithmToolkit import security # pylint: disable=import-outside-toplevel
+    conn.send("ready")
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        filename,configpath,parameters,fmt,limits = job
+        previous = _set_limits(limits["cpu_time"],limits["memory"])
+        try:
+            result = ("ok",security.serialized_execution(filename,configpath,parameters,fmt,limits={"max_states" : limits["max_states"]}))
+        except MemoryError:
+            result = ("error",ARgorithmLimitError("ARgorithm exceeded memory limit"))
+        except Exception as ex: # pylint: disable=broad-except
+            result = ("error",ex)
+        finally:
+            _reset_limits(previous)
+        try:
+            conn.send(result)
+        except Exception: # pylint: disable=broad-except
+            conn.send(("error",ARgorithmError(f"{type(result[1]).__name__}: {result[1]}")))
+
+class _Worker:
+    """Handle of a worker process."""
+
+    def __init__(self,context):
+        self.conn,child = context.Pipe()
+        self.process = context.Process(target=_worker,args=(child,),daemon=True)
+        self.process.start()
+        child.close()
+
+    def ready(self):
+        """Waits for the worker to finish importing."""
+        if self.conn.recv() != "ready":
+            raise ARgorithmError("worker failed to start")
+
+    def kill(self):
+        """Terminates the worker."""
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+class Executor:
+    """Pool of worker processes that run ARgorithms with limits.
+
+    Attributes:
+        workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+        timeout (float, optional): Wall-clock seconds a run may take. Defaults to None.
+        cpu_time (float, optional): CPU seconds a run may use. Defaults to None.
+        memory (int, optional): Bytes a run may allocate. Defaults to None.
+        max_states (int, optional): Number of states a run may generate. Defaults to None.
+        fmt (str, optional): Format in ``ARgorithmToolkit.serializers`` the states are returned in. Defaults to "json".
+        cache (ARgorithmToolkit.cache.ExecutionCache, optional): Cache checked before a run is sent to a worker. Defaults to None.
+
+    Example:
+        >>> pool = ARgorithmToolkit.executor.Executor(workers=2,timeout=5,max_states=100000)
+        >>> futures = [pool.submit(codepath,configpath,x) for x in inputs]
+        >>> payloads = [x.result() for x in futures]
+        >>> pool.close()
+    """
+    def __init__(self,workers=None,timeout=None,cpu_time=None,memory=None,max_states=None,fmt="json",cache=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.limits = {"cpu_time" : cpu_time, "memory" : memory, "max_states" : max_states}
+        self.fmt = fmt
+        self.cache = cache
+        self._context = multiprocessing.get_context("spawn")
+        self._idle = Queue()
+        self._threads = ThreadPoolExecutor(max_workers=self.workers)
+        self._lock = threading.Lock()
+        self._all = []
+        for worker in [self._spawn() for _ in range(self.workers)]:
+            worker.ready()
+            self._idle.put(worker)
+        self.closed = False
+
+    def _spawn(self):
+        """Starts a new worker."""
+        worker = _Worker(self._context)
+        with self._lock:
+            self._all.append(worker)
+        return worker
+
+    def _replace(self,worker):
+        """Kills a worker and puts a new one in its place."""
+        worker.kill()
+        with self._lock:
+            self._all.remove(worker)
+        worker = self._spawn()
+        worker.ready()
+        self._idle.put(worker)
+
+    def _run(self,filename,configpath,parameters):
+        """Sends a run to an idle worker and waits for its result."""
+        key = None
+        if self.cache is not None:
+            with open(filename,'rb') as codefile, open(configpath,'r') as configfile:
+                code,config = codefile.read(),json.load(configfile)
+            options = execution_options(config,{"max_states" : self.limits["max_states"]},self.fmt)
+            options.update(cpu_time=self.limits["cpu_time"],memory=self.limits["memory"])
+            key = execution_key(code,config,parameters,options)
+            data = self.cache.load(key,self.fmt)
+            if data is not None:
+                return data
+        worker = self._idle.get()
+        try:
+            worker.conn.send((filename,configpath,parameters,self.fmt,self.limits))
+            if not worker.conn.poll(self.timeout):
+                self._replace(worker)
+                raise ARgorithmLimitError(f"ARgorithm exceeded time limit of {self.timeout} seconds")
+            status,result = worker.conn.recv()
+        except (EOFError,OSError) as ex:
+            self._replace(worker)
+            raise ARgorithmLimitError("ARgorithm worker exited, CPU or memory limit exceeded") from ex
+        self._idle.put(worker)
+        if status != "ok":
+            raise result
+        if key is not None:
+            self.cache.store(key,result,self.fmt)
+        return result
+
+    def submit(self,filename:str,configpath:str,parameters:dict):
+        """Schedules a run of an ARgorithm.
+
+        Args:
+            filename (str): The file with the ARgorithm code
+            configpath (str): The config file of the ARgorithm
+            parameters (dict): The parameters the ARgorithm is executed on
+
+        Raises:
+            ARgorithmError: Raised if the executor is closed
+
+        Returns:
+            concurrent.futures.Future: Future resolving to the serialized states
+        """
+        if self.closed:
+            raise ARgorithmError("runs cannot be submitted to closed Executor")
+        return self._threads.submit(self._run,os.path.abspath(filename),os.path.abspath(configpath),parameters)
+
+    def run(self,filename:str,configpath:str,parameters:dict):
+        """Runs an ARgorithm and waits for it.
+
+        Args:
+            filename (str): The file with the ARgorithm code
+            configpath (str): The config file of the ARgorithm
+            parameters (dict): The parameters the ARgorithm is executed on
+
+        Raises:
+            ARgorithmLimitError: Raised if the run exceeded a limit
+
+        Returns:
+            bytes: The serialized states
+        """
+        return self.submit(filename,configpath,parameters).result()
+
+    def close(self):
+        """Waits for scheduled runs and stops the workers."""
+        if self.closed:
+            return
+        self.closed = True
+        self._threads.shutdown(wait=True)
+        with self._lock:
+            workers = list(self._all)
+            self._all.clear()
+        for worker in workers:
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+            worker.process.join(1)
+            if worker.process.is_alive():
+                worker.process.kill()
+            worker.conn.close()
+
+    def __enter__(self):
+        """Allows Executor to be used as a context manager."""
+        return self
+
+    def __exit__(self,*args):
+        """Closes the Executor on leaving the context."""
+        self.close()
@@ -14,6 +14,7 @@ These three classes can be directly imported from the toolkit:
     >>> fl = ARgorithmToolkit.ForwardList("fl",algo)
 """
 
+import weakref
 from ARgorithmToolkit.utils import ARgorithmHashable, ARgorithmStructure, State, StateSet, ARgorithmError
 from ARgorithmToolkit.encoders import serialize
 
@@ -127,6 +128,21 @@ class LinkedListNodeState:
             comments=comments
         )
 
+def _node_deleted(algo,state_generator):
+    """Records the deletion of a node. Called by the finalizer of the node, so
+    it must not hold a reference to the node itself."""
+    if algo.should_record("llnode_delete"):
+        state = state_generator.llnode_delete(
+            "Node was deleted"
+        )
+        algo.add_state(state)
+
+def _finalizer(node):
+    """Registers the finalizer recording the deletion of node."""
+    finalizer = weakref.finalize(node,_node_deleted,node.algo,node.state_generator)
+    finalizer.atexit = False
+    return finalizer
+
 @serialize
 class LinkedListNode(ARgorithmStructure, ARgorithmHashable):
     """The LinkedListNode class is an implementation of a Linked list Node for
@@ -134,6 +150,10 @@ class LinkedListNode(ARgorithmStructure, ARgorithmHashable):
     have to give a name to the instance, we dont have to provide name in the
     LinkedListNode Class.
 
+    The ``llnode_delete`` state is recorded by a finalizer as soon as the last
+    reference to the node is dropped, or when ``release`` is called by a list
+    that removes the node, whichever comes first.
+
     Attributes:
         algo (ARgorithmToolkit.utils.StateSet): The stateset that will store the states generated by the instance of LinkedListNode Class
         value: The value stored in the node
@@ -171,6 +191,7 @@ class LinkedListNode(ARgorithmStructure, ARgorithmHashable):
             self.value,self.next,comments
         )
         self.algo.add_state(state)
+        self._finalizer = _finalizer(self)
 
     def __setattr__(self,key,value):
         """The __setattr__ function is overriden to listen to state changes in
@@ -190,29 +211,60 @@ class LinkedListNode(ARgorithmStructure, ARgorithmHashable):
         self.__dict__[key] = value
         if key == 'next' and self._flag:
             if last_next or self.next:
-                state = self.state_generator.llnode_next(
+                if self.algo.should_record("llnode_next"):
+                    state = self.state_generator.llnode_next(
+                        value=self.value,
+                        _next=self.next,
+                        last_next=last_next,
+                        comments="next pointer updated"
+                    )
+                    self.algo.add_state(state)
+        elif key == 'value' and self._flag:
+            if self.algo.should_record("llnode_iter"):
+                state = self.state_generator.llnode_iter(
                     value=self.value,
                     _next=self.next,
-                    last_next=last_next,
-                    comments="next pointer updated"
+                    last_value=last_value,
+                    comments="value updated"
                 )
                 self.algo.add_state(state)
-        elif key == 'value' and self._flag:
-            state = self.state_generator.llnode_iter(
-                value=self.value,
-                _next=self.next,
-                last_value=last_value,
-                comments="value updated"
+
+    @classmethod
+    def _chain(cls,algo,values):
+        """Creates linked nodes holding values without generating states for
+        them. Used by bulk operations that record the nodes in a single state.
+
+        Returns:
+            list: The nodes in order, each pointing to the next one
+        """
+        nodes = []
+        for value in values:
+            node = cls.__new__(cls)
+            node.__dict__.update(
+                name=str(id(node)),
+                _id=str(id(node)),
+                algo=algo,
+                state_generator=LinkedListNodeState(str(id(node)),str(id(node))),
+                _flag=True,
+                value=value,
+                next=None
             )
-            self.algo.add_state(state)
+            node.__dict__["_finalizer"] = _finalizer(node)
+            if nodes:
+                nodes[-1].__dict__["next"] = node
+            nodes.append(node)
+        return nodes
 
-    def __del__(self):
-        """The __del__ function is overriden is there to listen to node
-        deletion."""
-        state = self.state_generator.llnode_delete(
-            "Node was deleted"
-        )
-        self.algo.add_state(state)
+    def release(self):
+        """Records the deletion of node now instead of when it is garbage
+        collected. Calling it again or collecting the node later records
+        nothing.
+
+        Example:
+
+            >>> fl.head.release()
+        """
+        self._finalizer()
 
     def __str__(self):
         return f"LinkedListNode({self.value}) at {self.name}"
@@ -279,6 +331,64 @@ class LinkedListState:
             comments=comments
         )
 
+    def ll_tail(self,head,tail,last_tail=None,comments=""):
+        """Generates the `ll_tail` state when forwardlist tail is changed.
+
+        Args:
+            head (LinkedListNode): The head pointer
+            tail (LinkedListNode): The tail pointer
+            comments (str, optional): Comments for descriptive purpose. Defaults to "".
+
+        Returns:
+            State: Returns the `ll_tail` state
+        """
+        state_type = "ll_tail"
+        state_def = {
+            "id" : self._id,
+            "variable_name" : self.name,
+            "head" : head.name if head else "none",
+            "tail" : tail.name if tail else "none"
+        }
+        if not (last_tail is None):
+            state_def["last_tail"] = last_tail
+        return State(
+            state_type=state_type,
+            state_def=state_def,
+            comments=comments
+        )
+
+    def ll_extend(self,head,tail,nodes,last_tail=None,comments=""):
+        """Generates the `ll_extend` state when multiple nodes are added to the
+        end of forwardlist.
+
+        Args:
+            head (LinkedListNode): The head pointer
+            tail (LinkedListNode): The tail pointer
+            nodes (list): The nodes that were added
+            comments (str, optional): Comments for descriptive purpose. Defaults to "".
+
+        Returns:
+            State: Returns the `ll_extend` state
+        """
+        state_type = "ll_extend"
+        state_def = {
+            "id" : self._id,
+            "variable_name" : self.name,
+            "head" : head.name if head else "none",
+            "tail" : tail.name if tail else "none",
+            "nodes" : [
+                {"id" : x.name, "value" : x.value, "next" : x.next.name if x.next else "none"}
+                for x in nodes
+            ]
+        }
+        if not (last_tail is None):
+            state_def["last_tail"] = last_tail
+        return State(
+            state_type=state_type,
+            state_def=state_def,
+            comments=comments
+        )
+
 @serialize
 class LinkedList(ARgorithmStructure, ARgorithmHashable):
     """The LinkedList class is used to just store the head of the linked list.
@@ -336,8 +446,9 @@ class LinkedList(ARgorithmStructure, ARgorithmHashable):
             last_head = self.head._id if self.head else "none"
         self.__dict__[key] = value
         if key == 'head' and self._flag:
-            state = self.state_generator.ll_head(self.head,last_head=last_head, comments="head pointer shifts")
-            self.algo.add_state(state)
+            if self.algo.should_record("ll_head"):
+                state = self.state_generator.ll_head(self.head,last_head=last_head, comments="head pointer shifts")
+                self.algo.add_state(state)
 
     def __str__(self):
         return f"LinkedList(head at {self.head})"
@@ -377,6 +488,7 @@ class ForwardList(LinkedList):
         name (str): The name given to the linkedlist
         algo (ARgorithmToolkit.utils.StateSet): The stateset that will store the states generated by the instance of ForwardList Class
         head (LinkedListNode): The referece to head of linkedlist
+        tail (LinkedListNode): The referece to last node of linkedlist
         size (int): Number of nodes i.e size of list
 
     Raises:
@@ -389,8 +501,31 @@ class ForwardList(LinkedList):
 
     def __init__(self,name:str,algo:StateSet,comments=""):
         super().__init__(name,algo,comments="")
+        self._flag = False
+        self.tail = None
+        self._flag = True
         self.size = 0
 
+    def __setattr__(self,key,value):
+        """The __setattr__ function is overriden to listen to state changes in
+        the head and the tail.
+
+        Raises:
+            ARgorithmError: Raised if head or tail pointer is not type None or LinkedListNode
+        """
+        if key != 'tail':
+            super().__setattr__(key,value)
+            return
+        if value:
+            assert isinstance(value,LinkedListNode) , ARgorithmError("tail should be of type None or LinkedListNode")
+        last_tail = None
+        if self._flag:
+            last_tail = self.tail._id if self.tail else "none"
+        self.__dict__[key] = value
+        if self._flag and self.algo.should_record("ll_tail"):
+            state = self.state_generator.ll_tail(self.head,self.tail,last_tail=last_tail,comments="tail pointer shifts")
+            self.algo.add_state(state)
+
     def __len__(self):
         """overloads the len() operator to return size of list.
 
@@ -425,13 +560,8 @@ class ForwardList(LinkedList):
         """
         if self.size == 0 or index == 0:
             self.push_front(value)
-        elif self.size < index:
-            temp = self.head
-            while temp.next:
-                temp = temp.next
-            curr = LinkedListNode(self.algo,value)
-            temp.next = curr
-            self.size += 1
+        elif self.size <= index:
+            self.push_back(value)
         else:
             count = 1
             temp = self.head
@@ -464,8 +594,60 @@ class ForwardList(LinkedList):
         else:
             curr.next = None
             self.head = curr
+            self.tail = curr
         self.size+=1
 
+    def push_back(self,value):
+        """Pushes value to back using the tail pointer.
+
+        Args:
+            value : Value to be appended to back
+
+        Example:
+            >>> fl
+            ForwardList([1])
+            >>> fl.push_back(2)
+            >>> fl
+            ForwardList([1, 2])
+        """
+        curr = LinkedListNode(self.algo,value)
+        if self.tail:
+            self.tail.next = curr
+            self.tail = curr
+        else:
+            self.head = curr
+            self.tail = curr
+        self.size += 1
+
+    def extend(self,values,comments=""):
+        """Appends values to back with a single ``ll_extend`` state holding
+        the new nodes instead of the states of every node.
+
+        Args:
+            values (iterable): Values to be appended to back
+            comments (str, optional): Comments for descriptive purpose. Defaults to "".
+
+        Example:
+            >>> fl
+            ForwardList([1])
+            >>> fl.extend([2, 3])
+            >>> fl
+            ForwardList([1, 2, 3])
+        """
+        nodes = LinkedListNode._chain(self.algo,values)
+        if not nodes:
+            return
+        last_tail = self.tail._id if self.tail else "none"
+        if self.tail:
+            self.tail.__dict__["next"] = nodes[0]
+        else:
+            self.__dict__["head"] = nodes[0]
+        self.__dict__["tail"] = nodes[-1]
+        self.size += len(nodes)
+        if self.algo.should_record("ll_extend"):
+            state = self.state_generator.ll_extend(self.head,self.tail,nodes,last_tail=last_tail,comments=comments)
+            self.algo.add_state(state)
+
     def pop_front(self):
         """Pops first element of forwardlist.
 
@@ -487,7 +669,9 @@ class ForwardList(LinkedList):
         data = self.head.value
         temp = self.head
         self.head = self.head.next
-        del temp
+        if self.head is None:
+            self.tail = None
+        temp.release()
         self.size -= 1
         return data
 
@@ -547,9 +731,10 @@ class ForwardList(LinkedList):
         while value == self.head.value:
             temp = self.head
             self.head = self.head.next
-            del temp
+            temp.release()
             self.size -= 1
             if self.head is None:
+                self.tail = None
                 return
         curr = self.head
         while curr:
@@ -557,7 +742,9 @@ class ForwardList(LinkedList):
                 if curr.next.value == value:
                     temp = curr.next
                     curr.next = curr.next.next
-                    del temp
+                    if curr.next is None:
+                        self.tail = curr
+                    temp.release()
                     self.size -= 1
                     continue
             curr = curr.next
@@ -11,6 +11,7 @@ ARgorithmToolkit library without having to import from the map module :
 
 from ARgorithmToolkit.utils import ARgorithmHashable, State, StateSet, ARgorithmError, ARgorithmStructure
 from ARgorithmToolkit.encoders import serialize
+from ARgorithmToolkit.persistent import PersistentMap
 
 class MapState:
     """This class is used to generate states for various actions performed on
@@ -169,6 +170,11 @@ class Map(ARgorithmStructure):
     Raises:
         ARgorithmError: raised if name is not given or Stateset if not provided
 
+    Note:
+        The body sent along with states is a ``ARgorithmToolkit.persistent.PersistentMap``
+        so every state shares the unchanged entries with the previous one
+        instead of storing a copy of the whole map.
+
     Examples:
         This is an example of map being declared
 
@@ -208,10 +214,11 @@ class Map(ARgorithmStructure):
         except Exception as ex:
             raise ARgorithmError("Map structure needs a reference of template to store states") from ex
 
-        self.body = {}
+        self.body = PersistentMap()
+        self._version = 0
         self.__working_dict = {}
         state = self.state_generator.map_declare(self.body,comments)
-        self.algo.add_state(state)
+        self.algo.add_state(state,version=self._version)
 
 
     def __len__(self) -> int:
@@ -250,8 +257,9 @@ class Map(ARgorithmStructure):
                 value = self.body[key.to_json()]
             else:
                 value = self.body[key]
-            state = self.state_generator.map_get(body=self.body, key=key, value=value, comments="")
-            self.algo.add_state(state)
+            if self.algo.should_record("map_get"):
+                state = self.state_generator.map_get(body=self.body, key=key, value=value, comments="")
+                self.algo.add_state(state,version=self._version)
             return _value
         except Exception as e:
             raise ARgorithmError(f"Invalid Key Error : {str(e)}") from e
@@ -277,12 +285,14 @@ class Map(ARgorithmStructure):
         """
         try:
             _value = self.__working_dict[key]
-            state = self.state_generator.map_get(body=self.body, key=key, value=_value, comments=comments)
-            self.algo.add_state(state)
+            if self.algo.should_record("map_get"):
+                state = self.state_generator.map_get(body=self.body, key=key, value=_value, comments=comments)
+                self.algo.add_state(state,version=self._version)
             return _value
         except KeyError:
-            state = self.state_generator.map_get(body=self.body, key=key, value=default if default else "none", comments=f"key not found. value efaulted to {default}")
-            self.algo.add_state(state)
+            if self.algo.should_record("map_get"):
+                state = self.state_generator.map_get(body=self.body, key=key, value=default if default else "none", comments=f"key not found. value efaulted to {default}")
+                self.algo.add_state(state,version=self._version)
             return default
 
     def set(self, key, value, comments=""):
@@ -306,16 +316,17 @@ class Map(ARgorithmStructure):
         last_value = self.body.get(key, "none")
         self.__working_dict[key] = value
         if isinstance(key, (str, int, float, bool)) and isinstance(value, (str, int, float, bool)):
-            self.body[key] = value
+            self.body = self.body.set(key,value)
         elif isinstance(key, (str, int, float, bool)):
-            self.body[key] = value.to_json()
+            self.body = self.body.set(key,value.to_json())
         elif isinstance(value, (str, int, float, bool)):
-            self.body[key.to_json()] = value
+            self.body = self.body.set(key.to_json(),value)
         else:
-            self.body[key.to_json()] = value.to_json()
-
-        state = self.state_generator.map_set(body=self.body, key=key, value=value, last_value=last_value, comments=comments)
-        self.algo.add_state(state)
+            self.body = self.body.set(key.to_json(),value.to_json())
+        self._version += 1
+        if self.algo.should_record("map_set"):
+            state = self.state_generator.map_set(body=self.body, key=key, value=value, last_value=last_value, comments=comments)
+            self.algo.add_state(state,version=self._version)
 
 
     def __setitem__(self, key, value, comments=""):
@@ -339,16 +350,17 @@ class Map(ARgorithmStructure):
         last_value = self.body.get(key, "none")
         self.__working_dict[key] = value
         if isinstance(key, (str, int, float, bool)) and isinstance(value, (str, int, float, bool)):
-            self.body[key] = value
+            self.body = self.body.set(key,value)
         elif isinstance(key, (str, int, float, bool)):
-            self.body[key] = value.to_json()
+            self.body = self.body.set(key,value.to_json())
         elif isinstance(value, (str, int, float, bool)):
-            self.body[key.to_json()] = value
+            self.body = self.body.set(key.to_json(),value)
         else:
-            self.body[key.to_json()] = value.to_json()
-
-        state = self.state_generator.map_set(body=self.body, key=key, value=value, last_value=last_value, comments="")
-        self.algo.add_state(state)
+            self.body = self.body.set(key.to_json(),value.to_json())
+        self._version += 1
+        if self.algo.should_record("map_set"):
+            state = self.state_generator.map_set(body=self.body, key=key, value=value, last_value=last_value, comments="")
+            self.algo.add_state(state,version=self._version)
 
     def __iter__(self):
         """Generates a iterator object to iterate the map key/value pairs.
@@ -381,14 +393,16 @@ class Map(ARgorithmStructure):
             value = None
             if isinstance(key, ARgorithmHashable):
                 value = self.body[key.to_json()]
-                del self.body[key.to_json()]
+                self.body = self.body.delete(key.to_json())
             else:
                 value = self.body[key]
-                del self.body[key]
+                self.body = self.body.delete(key)
 
             del self.__working_dict[key]
-            state = self.state_generator.map_remove(self.body, key, value, "")
-            self.algo.add_state(state)
+            self._version += 1
+            if self.algo.should_record("map_remove"):
+                state = self.state_generator.map_remove(self.body, key, value, "")
+                self.algo.add_state(state,version=self._version)
 
         except Exception as e:
             raise ARgorithmError(f"Invalid Key Error : {str(e)}") from e
@@ -413,18 +427,21 @@ class Map(ARgorithmStructure):
             value = None
             if isinstance(key, ARgorithmHashable):
                 value = self.body[key.to_json()]
-                del self.body[key.to_json()]
+                self.body = self.body.delete(key.to_json())
             else:
                 value = self.body[key]
-                del self.body[key]
+                self.body = self.body.delete(key)
 
             del self.__working_dict[key]
-            state = self.state_generator.map_remove(self.body, key, value, comments)
-            self.algo.add_state(state)
+            self._version += 1
+            if self.algo.should_record("map_remove"):
+                state = self.state_generator.map_remove(self.body, key, value, comments)
+                self.algo.add_state(state,version=self._version)
 
         except KeyError:
-            state = self.state_generator.map_remove(self.body, key, "none", "key not found, nothing removed.")
-            self.algo.add_state(state)
+            if self.algo.should_record("map_remove"):
+                state = self.state_generator.map_remove(self.body, key, "none", "key not found, nothing removed.")
+                self.algo.add_state(state,version=self._version)
             return
 
     def __repr__(self) -> str:
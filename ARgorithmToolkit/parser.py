@@ -5,14 +5,16 @@ import json
 import re
 import math
 import inspect
+from functools import lru_cache
 import typer
 from jsonschema import Draft7Validator
 from jsonschema.exceptions import ValidationError
 
-import ARgorithmToolkit
-
-with open(os.path.join(ARgorithmToolkit.__path__[0],'data/config.schema.json')) as schema:
-    CONFIG_SCHEMA = json.load(schema)
+@lru_cache(maxsize=None)
+def config_validator():
+    """Loads the schema of .config.json files on first use."""
+    with open(os.path.join(os.path.dirname(__file__),'data/config.schema.json')) as schema:
+        return Draft7Validator(json.load(schema))
 
 config_cli_heading ="""
     +-----------------------------+
@@ -172,7 +174,7 @@ def find_parameters(filename,function):
 
 def validateconfig(filepath):
     """Validates and stores argorithm config."""
-    validator = Draft7Validator(CONFIG_SCHEMA)
+    validator = config_validator()
     if os.path.isfile(filepath):
         with open(filepath,'r') as configfile:
             data = json.load(configfile)
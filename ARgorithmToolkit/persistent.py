@@ -0,0 +1,413 @@
+"""The persistent module provides immutable maps and sets that are used as the
+bodies of ``ARgorithmToolkit.map.Map`` and ``ARgorithmToolkit.set.Set``.
+
+Both are hash array mapped tries. Adding or removing a key returns a new
+object that shares every unchanged branch of the trie with the old one, so
+consecutive states of a Map or Set only cost the few nodes on the path to the
+key that changed instead of a full copy of the body:
+
+    >>> body = ARgorithmToolkit.persistent.PersistentMap()
+    >>> new_body = body.set("a",1)
+    >>> body , new_body
+    (PersistentMap({}), PersistentMap({'a': 1}))
+
+Entries remember the order in which their keys were first added, which is the
+order used when the body is iterated or converted to a dictionary for
+serialization. Nothing is cached on a version, so serializing every state of
+a Map keeps no more memory alive than the tries themselves.
+"""
+from collections.abc import Mapping, Set
+
+BITS = 5
+MASK = (1 << BITS) - 1
+HASH_BITS = 64
+
+def _key_hash(key):
+    """Hash of key as an unsigned 64 bit integer."""
+    return hash(key) & ((1 << HASH_BITS) - 1)
+
+class _Entry:
+    """A key value pair stored in the trie along with its insertion order."""
+    __slots__ = ('hash','key','value','order')
+
+    def __init__(self,_hash,key,value,order):
+        self.hash = _hash
+        self.key = key
+        self.value = value
+        self.order = order
+
+class _Collision:
+    """Entries whose keys have the same hash."""
+    __slots__ = ('hash','entries')
+
+    def __init__(self,_hash,entries):
+        self.hash = _hash
+        self.entries = entries
+
+class _Bitmap:
+    """Trie node with up to 32 children, bitmap marks the occupied slots."""
+    __slots__ = ('bitmap','children')
+
+    def __init__(self,bitmap,children):
+        self.bitmap = bitmap
+        self.children = children
+
+EMPTY = _Bitmap(0,())
+
+def _slot(node,bit):
+    """Index of child for given bit in a bitmap node."""
+    return bin(node.bitmap & (bit - 1)).count("1")
+
+def _merge(first,second,shift):
+    """Builds the smallest subtree holding two entries or collisions."""
+    if first.hash == second.hash:
+        entries = first.entries if isinstance(first,_Collision) else (first,)
+        return _Collision(first.hash,entries + (second,))
+    bit1 = 1 << ((first.hash >> shift) & MASK)
+    bit2 = 1 << ((second.hash >> shift) & MASK)
+    if bit1 == bit2:
+        return _Bitmap(bit1,(_merge(first,second,shift+BITS),))
+    children = (first,second) if bit1 < bit2 else (second,first)
+    return _Bitmap(bit1 | bit2,children)
+
+def _find(node,shift,_hash,key):
+    """Returns entry of key or None."""
+    while True:
+        if isinstance(node,_Bitmap):
+            bit = 1 << ((_hash >> shift) & MASK)
+            if not node.bitmap & bit:
+                return None
+            node = node.children[_slot(node,bit)]
+            shift += BITS
+        elif isinstance(node,_Entry):
+            if node.hash == _hash and node.key == key:
+                return node
+            return None
+        else:
+            if node.hash != _hash:
+                return None
+            for entry in node.entries:
+                if entry.key == key:
+                    return entry
+            return None
+
+def _assoc(node,shift,entry):
+    """Returns node with entry added, replacing the entry of the same key."""
+    if isinstance(node,_Bitmap):
+        bit = 1 << ((entry.hash >> shift) & MASK)
+        index = _slot(node,bit)
+        children = node.children
+        if not node.bitmap & bit:
+            return _Bitmap(node.bitmap | bit,children[:index] + (entry,) + children[index:])
+        child = _assoc(children[index],shift+BITS,entry)
+        return _Bitmap(node.bitmap,children[:index] + (child,) + children[index+1:])
+    if isinstance(node,_Entry):
+        if node.hash == entry.hash and node.key == entry.key:
+            return entry
+        return _merge(node,entry,shift)
+    if node.hash != entry.hash:
+        return _assoc(_Bitmap(1 << ((node.hash >> shift) & MASK),(node,)),shift,entry)
+    entries = tuple(x for x in node.entries if x.key != entry.key)
+    return _Collision(node.hash,entries + (entry,))
+
+def _dissoc(node,shift,_hash,key):
+    """Returns node with key removed. Returns None if node becomes empty."""
+    if isinstance(node,_Bitmap):
+        bit = 1 << ((_hash >> shift) & MASK)
+        index = _slot(node,bit)
+        child = _dissoc(node.children[index],shift+BITS,_hash,key)
+        children = node.children[:index] + node.children[index+1:]
+        if child is None:
+            if not children:
+                return None
+            if len(children) == 1 and shift and not isinstance(children[0],_Bitmap):
+                return children[0]
+            return _Bitmap(node.bitmap ^ bit,children)
+        if len(children) == 0 and shift and not isinstance(child,_Bitmap):
+            return child
+        return _Bitmap(node.bitmap,children[:index] + (child,) + children[index:])
+    if isinstance(node,_Entry):
+        return None
+    entries = tuple(x for x in node.entries if x.key != key)
+    if len(entries) == 1:
+        return entries[0]
+    return _Collision(node.hash,entries)
+
+def _entries(node):
+    """Yields all entries under node, walking the trie without recursion."""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node,_Entry):
+            yield node
+        elif isinstance(node,_Collision):
+            yield from node.entries
+        else:
+            stack.extend(node.children)
+
+def _ordered(node):
+    """Returns all entries under node sorted by insertion."""
+    return sorted(_entries(node),key=lambda x: x.order)
+
+def _changes(prev,curr,shift):
+    """Yields entries that differ between two nodes as pairs of old and new
+    entry. Branches shared by both nodes are skipped."""
+    if prev is curr:
+        return
+    if isinstance(prev,_Bitmap) and isinstance(curr,_Bitmap):
+        for i in range(1 << BITS):
+            bit = 1 << i
+            old = prev.children[_slot(prev,bit)] if prev.bitmap & bit else None
+            new = curr.children[_slot(curr,bit)] if curr.bitmap & bit else None
+            if old is None and new is None:
+                continue
+            if old is None:
+                for entry in _entries(new):
+                    yield None,entry
+            elif new is None:
+                for entry in _entries(old):
+                    yield entry,None
+            else:
+                yield from _changes(old,new,shift+BITS)
+        return
+    old = {x.key : x for x in _entries(prev)}
+    for entry in _entries(curr):
+        last = old.pop(entry.key,None)
+        if last is not entry:
+            yield last,entry
+    for entry in old.values():
+        yield entry,None
+
+class PersistentMap(Mapping):
+    """Immutable mapping that shares structure between versions.
+
+    Attributes:
+        data (dict, optional): Initial contents of the map. Defaults to None.
+
+    Example:
+        >>> body = ARgorithmToolkit.persistent.PersistentMap({"a" : 1})
+        >>> body.set("b",2).delete("a")
+        PersistentMap({'b': 2})
+    """
+    __slots__ = ('_root','_size','_order')
+
+    def __init__(self,data=None):
+        self._root = EMPTY
+        self._size = 0
+        self._order = 0
+        if data:
+            for key,value in data.items():
+                self._root,added = self._with(key,value)
+                self._size += added
+                self._order += 1
+
+    @classmethod
+    def _make(cls,root,size,order):
+        """Creates map from its fields."""
+        result = cls.__new__(cls)
+        result._root = root
+        result._size = size
+        result._order = order
+        return result
+
+    def _with(self,key,value):
+        """Returns new root with key set and whether the key is new."""
+        _hash = _key_hash(key)
+        entry = _find(self._root,0,_hash,key)
+        if entry is None:
+            return _assoc(self._root,0,_Entry(_hash,key,value,self._order)),True
+        if entry.value is value:
+            return self._root,False
+        return _assoc(self._root,0,_Entry(_hash,key,value,entry.order)),False
+
+    def set(self,key,value):
+        """Returns new map with key mapped to value. Position of the key is
+        kept if it was already present.
+
+        Args:
+            key: The key
+            value: The value for the key
+
+        Returns:
+            PersistentMap: The updated map
+        """
+        root,added = self._with(key,value)
+        if root is self._root:
+            return self
+        return self._make(root,self._size+added,self._order+added)
+
+    def delete(self,key):
+        """Returns new map without key.
+
+        Args:
+            key: The key to be removed
+
+        Raises:
+            KeyError: Raised if key is not present
+
+        Returns:
+            PersistentMap: The updated map
+        """
+        _hash = _key_hash(key)
+        if _find(self._root,0,_hash,key) is None:
+            raise KeyError(key)
+        root = _dissoc(self._root,0,_hash,key)
+        return self._make(EMPTY if root is None else root,self._size-1,self._order)
+
+    def __getitem__(self,key):
+        entry = _find(self._root,0,_key_hash(key),key)
+        if entry is None:
+            raise KeyError(key)
+        return entry.value
+
+    def __contains__(self,key):
+        return _find(self._root,0,_key_hash(key),key) is not None
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        for entry in _ordered(self._root):
+            yield entry.key
+
+    def copy(self):
+        """Returns the map itself as it cannot be modified."""
+        return self
+
+    def walk(self):
+        """Yields the key value pairs in the order of the trie, not of
+        insertion. Unlike iteration it does not look at every entry before
+        yielding the first one.
+
+        Yields:
+            tuple: key and value
+        """
+        for entry in _entries(self._root):
+            yield entry.key,entry.value
+
+    def to_dict(self):
+        """Returns the contents as a new dictionary ordered by insertion.
+
+        Returns:
+            dict: The contents of the map
+        """
+        return {x.key : x.value for x in _ordered(self._root)}
+
+    def changes(self,other):
+        """Compares with another version of the map, skipping everything the
+        two versions share.
+
+        Args:
+            other (PersistentMap): The newer version of the map
+
+        Returns:
+            tuple: list of ``[key, value]`` pairs set in other and list of keys removed from it
+        """
+        changed = []
+        removed = []
+        for old,new in _changes(self._root,other._root,0):
+            if new is None:
+                removed.append(old.key)
+            elif old is None or old.value != new.value:
+                changed.append([new.key,new.value])
+        return changed,removed
+
+    def __repr__(self):
+        return f"PersistentMap({self.to_dict()!r})"
+
+class PersistentSet(Set):
+    """Immutable set that shares structure between versions.
+
+    Attributes:
+        data (iterable, optional): Initial contents of the set. Defaults to None.
+
+    Example:
+        >>> body = ARgorithmToolkit.persistent.PersistentSet([1,2])
+        >>> body.add(3).remove(1)
+        PersistentSet({2, 3})
+    """
+    __slots__ = ('_map',)
+
+    def __init__(self,data=None):
+        self._map = PersistentMap(dict.fromkeys(data) if data else None)
+
+    @classmethod
+    def _make(cls,_map):
+        """Creates set from its map."""
+        result = cls.__new__(cls)
+        result._map = _map
+        return result
+
+    def add(self,key):
+        """Returns new set with key added.
+
+        Args:
+            key: The key to be added
+
+        Returns:
+            PersistentSet: The updated set
+        """
+        if key in self._map:
+            return self
+        return self._make(self._map.set(key,None))
+
+    def remove(self,key):
+        """Returns new set without key.
+
+        Args:
+            key: The key to be removed
+
+        Raises:
+            KeyError: Raised if key is not present
+
+        Returns:
+            PersistentSet: The updated set
+        """
+        return self._make(self._map.delete(key))
+
+    def __contains__(self,key):
+        return key in self._map
+
+    def __len__(self):
+        return len(self._map)
+
+    def __iter__(self):
+        return iter(self._map)
+
+    def copy(self):
+        """Returns the set itself as it cannot be modified."""
+        return self
+
+    def walk(self):
+        """Yields the keys in the order of the trie, not of insertion. Unlike
+        iteration it does not look at every key before yielding the first one.
+
+        Yields:
+            key
+        """
+        for entry in _entries(self._map._root):
+            yield entry.key
+
+    def to_list(self):
+        """Returns the keys as a list ordered by insertion.
+
+        Returns:
+            list: The contents of the set
+        """
+        return list(self._map)
+
+    def changes(self,other):
+        """Compares with another version of the set, skipping everything the
+        two versions share.
+
+        Args:
+            other (PersistentSet): The newer version of the set
+
+        Returns:
+            tuple: list of keys added in other and list of keys removed from it
+        """
+        changed,removed = self._map.changes(other._map)
+        return [key for key,_ in changed],removed
+
+    def __repr__(self):
+        return f"PersistentSet({set(self._map.to_dict())!r})"
@@ -9,7 +9,7 @@ module:
     >>> pq = ARgorithmToolkit.PriorityQueue(name="pq",algo=algo)
 """
 import heapq
-from ARgorithmToolkit.utils import State, StateSet, ARgorithmError, ARgorithmStructure
+from ARgorithmToolkit.utils import State, StateSet, ARgorithmError, ARgorithmStructure, state_body
 from ARgorithmToolkit.encoders import serialize
 
 class PriorityQueueState():
@@ -25,13 +25,13 @@ class PriorityQueueState():
         self.name = name
         self._id = _id
 
-    def priorityqueue_declare(self,comments=""):
+    def priorityqueue_declare(self,comments="",body=()):
         """Generates the `priorityqueue_declare` state when an instance of
         PriorityQueue is created.
 
         Args:
-            body: The contents of the PriorityQueue that are to be sent along with the state
             comments (optional): The comments that are supposed to rendered with the state for descriptive purpose. Defaults to "".
+            body (optional): The contents of the PriorityQueue that are to be sent along with the state. Defaults to an empty PriorityQueue.
 
         Returns:
             ARgorithmToolkit.utils.State: returns the ``priorityqueue_declare`` state for the respective PriorityQueue mentioned
@@ -40,7 +40,7 @@ class PriorityQueueState():
         state_def = {
             "id" : self._id,
             "variable_name" : self.name,
-            "body" : []
+            "body" : list(body)
         }
         return State(
             state_type=state_type,
@@ -73,6 +73,109 @@ class PriorityQueueState():
             comments=comments
         )
 
+    def priorityqueue_offer_many(self,body,elements,comments=""):
+        """Generates the `priorityqueue_offer_many` state when multiple
+        elements are added to priority queue at once.
+
+        Args:
+            body: The contents of the PriorityQueue that are to be sent along with the state
+            elements: The elements that were added
+            comments (optional): The comments that are supposed to rendered with the state for descriptive purpose. Defaults to "".
+
+        Returns:
+            ARgorithmToolkit.utils.State: returns the ``priorityqueue_offer_many`` state for the respective PriorityQueue mentioned
+        """
+        state_type = "priorityqueue_offer_many"
+        state_def = {
+            "id" : self._id,
+            "variable_name" : self.name,
+            "body" : list(body),
+            "elements" : list(elements)
+        }
+        return State(
+            state_type=state_type,
+            state_def=state_def,
+            comments=comments
+        )
+
+    def priorityqueue_sift(self,body,indexes,comments=""):
+        """Generates the `priorityqueue_sift` state when an element is swapped
+        with its smaller child while heapifying the priority queue.
+
+        Args:
+            body: The contents of the PriorityQueue that are to be sent along with the state
+            indexes: The index of the parent and the index of the child that were swapped
+            comments (optional): The comments that are supposed to rendered with the state for descriptive purpose. Defaults to "".
+
+        Returns:
+            ARgorithmToolkit.utils.State: returns the ``priorityqueue_sift`` state for the respective PriorityQueue mentioned
+        """
+        state_type = "priorityqueue_sift"
+        state_def = {
+            "id" : self._id,
+            "variable_name" : self.name,
+            "body" : list(body),
+            "index1" : indexes[0],
+            "index2" : indexes[1]
+        }
+        return State(
+            state_type=state_type,
+            state_def=state_def,
+            comments=comments
+        )
+
+    def priorityqueue_update(self,body,element,index,comments=""):
+        """Generates the `priorityqueue_update` state when the priority of an
+        element in priority queue is changed.
+
+        Args:
+            body: The contents of the PriorityQueue that are to be sent along with the state
+            element: The element whose priority was changed
+            index (int): The position of element in body after the operation
+            comments (optional): The comments that are supposed to rendered with the state for descriptive purpose. Defaults to "".
+
+        Returns:
+            ARgorithmToolkit.utils.State: returns the ``priorityqueue_update`` state for the respective PriorityQueue mentioned
+        """
+        state_type = "priorityqueue_update"
+        state_def = {
+            "id" : self._id,
+            "variable_name" : self.name,
+            "body" : list(body),
+            "element" : element,
+            "index" : index
+        }
+        return State(
+            state_type=state_type,
+            state_def=state_def,
+            comments=comments
+        )
+
+    def priorityqueue_remove(self,body,element,comments=""):
+        """Generates the `priorityqueue_remove` state when an element is
+        removed from priority queue.
+
+        Args:
+            body: The contents of the PriorityQueue that are to be sent along with the state
+            element: The element that was removed
+            comments (optional): The comments that are supposed to rendered with the state for descriptive purpose. Defaults to "".
+
+        Returns:
+            ARgorithmToolkit.utils.State: returns the ``priorityqueue_remove`` state for the respective PriorityQueue mentioned
+        """
+        state_type = "priorityqueue_remove"
+        state_def = {
+            "id" : self._id,
+            "variable_name" : self.name,
+            "body" : list(body),
+            "element" : element
+        }
+        return State(
+            state_type=state_type,
+            state_def=state_def,
+            comments=comments
+        )
+
     def priorityqueue_poll(self,body,element,comments=""):
         """Generates the `priorityqueue_offer` when an element is popped from
         priority queue.
@@ -103,7 +206,7 @@ class PriorityQueueState():
         queue is accessed.
 
         Args:
-            body: The contents of the PriorityQueue that are to be sent along with the state
+            body: The contents of the PriorityQueue that are to be sent along with the state, or the SharedBody recorded for them
             comments (optional): The comments that are supposed to rendered with the state for descriptive purpose. Defaults to "".
 
         Returns:
@@ -113,7 +216,7 @@ class PriorityQueueState():
         state_def = {
             "id" : self._id,
             "variable_name" : self.name,
-            "body" : list(body),
+            "body" : state_body(body,list),
         }
         return State(
             state_type=state_type,
@@ -127,20 +230,39 @@ class PriorityQueue(ARgorithmStructure):
     states in its stateset which later are used to make dynamic Augmented
     reality visualizations.
 
+    By default elements are compared with each other. If ``key`` is given the
+    priority of an element is ``key(element)`` , computed when the element is
+    added and again when ``update`` or ``decrease_key`` is called for it. If
+    ``indexed`` is true the queue keeps the position of every element in the
+    heap, so that ``update`` , ``decrease_key`` , ``remove`` and ``in`` find
+    an element in constant time instead of searching the heap. Elements of an
+    indexed priority queue have to be hashable and unique.
+
     Attributes:
         name (str): name given to the rendered block in augmented reality. Essential. Should not be altered after initialisation
         algo (ARgorithmToolkit.utils.StateSet): The stateset that will store the states generated by the instance of PriorityQueue Class
         comments (str, optional): Comments for descriptive format. Defaults to "".
+        data (iterable, optional): Initial elements of the priority queue, keyword only. They are heapified in linear time and sent with the ``priorityqueue_declare`` state. Defaults to None.
+        trace (bool, optional): If true, a ``priorityqueue_sift`` state is generated for every swap made while heapifying data, keyword only. Defaults to False.
+        key (callable, optional): Function returning the priority of an element, keyword only. Defaults to None.
+        indexed (bool, optional): If true, positions of elements are kept for constant time lookups, keyword only. Defaults to False.
 
     Raises:
-        ARgorithmError: raised if name is not given or Stateset if not provided
+        ARgorithmError: raised if name is not given or Stateset if not provided, or if data of an indexed priority queue has duplicates
 
     Examples:
         >>> algo = ARgorithmToolkit.StateSet()
         >>> pq = ARgorithmToolkit.PriorityQueue(name="pq",algo=algo)
+        >>> pq = ARgorithmToolkit.PriorityQueue(name="pq",algo=algo,data=[5, 3, 4, 1])
+        >>> pq
+        PriorityQueue([1, 3, 4, 5])
+        >>> dist = {"a" : 0, "b" : 7, "c" : 3}
+        >>> pq = ARgorithmToolkit.PriorityQueue(name="pq",algo=algo,data=dist,key=dist.get,indexed=True)
+        >>> pq
+        PriorityQueue(['a', 'b', 'c'])
     """
 
-    def __init__(self, name:str, algo:StateSet, comments:str = ""):
+    def __init__(self, name:str, algo:StateSet, comments:str = "", *, data=None, trace:bool = False, key=None, indexed:bool = False):
         try:
             assert isinstance(name,str)
             self._id = str(id(self))
@@ -152,9 +274,22 @@ class PriorityQueue(ARgorithmStructure):
             self.algo = algo
         except AssertionError as e:
             raise ARgorithmError("Queue structure needs a reference of template to store states") from e
+        self.key = key
+        self.indexed = indexed
         self.body = []
-        state = self.state_generator.priorityqueue_declare(comments)
-        self.algo.add_state(state)
+        self._keys = [] if key is not None else None
+        self._positions = {} if indexed else None
+        self._version = 0
+        elements = [] if data is None else list(data)
+        self._append(elements)
+        if trace:
+            state = self.state_generator.priorityqueue_declare(comments,self.body)
+            self.algo.add_state(state,version=self._version)
+            self._heapify(trace=True)
+        else:
+            self._heapify()
+            state = self.state_generator.priorityqueue_declare(comments,self.body)
+            self.algo.add_state(state,version=self._version)
 
     def __len__(self):
         """returns length of PriorityQueue when processed by len() function.
@@ -168,6 +303,22 @@ class PriorityQueue(ARgorithmStructure):
         """
         return len(self.body)
 
+    def __contains__(self,element):
+        """Checks whether element is in PriorityQueue when processed by the in
+        operator. Takes constant time for an indexed PriorityQueue.
+
+        Returns:
+            bool: flag that is true if element is in PriorityQueue
+
+        Example:
+            >>> pq.offer(4)
+            >>> 4 in pq
+            True
+        """
+        if self._positions is not None:
+            return element in self._positions
+        return element in self.body
+
     def empty(self):
         """Checks whether PriorityQueue is empty or not.
 
@@ -184,6 +335,108 @@ class PriorityQueue(ARgorithmStructure):
         """
         return len(self)==0
 
+    def _managed(self):
+        """Whether heap operations have to keep keys or positions in sync
+        with the body instead of being left to heapq."""
+        return self._keys is not None or self._positions is not None
+
+    def _append(self,elements):
+        """Appends elements to the end of body with their keys and positions
+        without restoring the heap property."""
+        if self._positions is not None:
+            positions = self._positions
+            if len(set(elements)) != len(elements) or any(x in positions for x in elements):
+                raise ARgorithmError("elements of indexed priority queue have to be unique")
+            for i,element in enumerate(elements,len(self.body)):
+                positions[element] = i
+        if self._keys is not None:
+            self._keys.extend(self.key(x) for x in elements)
+        self.body.extend(elements)
+
+    def _less(self,i,j):
+        """Whether element at index i has a lower priority than the element at
+        index j."""
+        if self._keys is not None:
+            return self._keys[i] < self._keys[j]
+        return self.body[i] < self.body[j]
+
+    def _swap(self,i,j):
+        """Swaps elements at index i and index j."""
+        body = self.body
+        body[i],body[j] = body[j],body[i]
+        if self._keys is not None:
+            self._keys[i],self._keys[j] = self._keys[j],self._keys[i]
+        if self._positions is not None:
+            self._positions[body[i]] = i
+            self._positions[body[j]] = j
+
+    def _sift_up(self,index):
+        """Moves element at index towards the root until its parent has a
+        lower priority and returns its new index."""
+        while index > 0:
+            parent = (index-1) // 2
+            if not self._less(index,parent):
+                break
+            self._swap(index,parent)
+            index = parent
+        return index
+
+    def _sift_down(self,index,trace=False):
+        """Moves element at index towards the leaves until its children have a
+        higher priority and returns its new index. If trace is true a
+        ``priorityqueue_sift`` state is generated for every swap."""
+        size = len(self.body)
+        child = 2*index + 1
+        while child < size:
+            if child + 1 < size and self._less(child+1,child):
+                child += 1
+            if not self._less(child,index):
+                break
+            self._swap(index,child)
+            if trace:
+                self._version += 1
+                if self.algo.should_record("priorityqueue_sift"):
+                    state = self.state_generator.priorityqueue_sift(self.body,(index,child))
+                    self.algo.add_state(state,version=self._version)
+            index = child
+            child = 2*index + 1
+        return index
+
+    def _heapify(self,trace=False):
+        """Restores the heap property of body in linear time by sifting down
+        every parent from the last one."""
+        if not trace and not self._managed():
+            heapq.heapify(self.body)
+            return
+        for index in reversed(range(len(self.body)//2)):
+            self._sift_down(index,trace)
+
+    def _pop(self,index):
+        """Removes element at index and restores the heap property."""
+        last = len(self.body)-1
+        if index != last:
+            self._swap(index,last)
+        element = self.body.pop()
+        if self._keys is not None:
+            self._keys.pop()
+        if self._positions is not None:
+            del self._positions[element]
+        if index < last and self._sift_up(index) == index:
+            self._sift_down(index)
+        return element
+
+    def _index(self,element):
+        """Returns the index of element in body."""
+        if self._positions is not None:
+            index = self._positions.get(element)
+            if index is None:
+                raise ARgorithmError('element not in priority queue')
+            return index
+        try:
+            return self.body.index(element)
+        except ValueError as e:
+            raise ARgorithmError('element not in priority queue') from e
+
     def offer(self,element,comments=""):
         """Add element to priority queue.
 
@@ -191,6 +444,9 @@ class PriorityQueue(ARgorithmStructure):
             element : element to be added to priority queue
             comments (str, optional): Comments for descriptive format. Defaults to "".
 
+        Raises:
+            ARgorithmError: If element is already in an indexed priority queue
+
         Example:
             >>> pq.offer(4)
             >>> pq.offer(3)
@@ -198,9 +454,127 @@ class PriorityQueue(ARgorithmStructure):
             >>> pq
             PriorityQueue([3, 4, 5])
         """
-        heapq.heappush(self.body, element)
-        state = self.state_generator.priorityqueue_offer(self.body,element,comments)
-        self.algo.add_state(state)
+        if self._managed():
+            self._append([element])
+            self._sift_up(len(self.body)-1)
+        else:
+            heapq.heappush(self.body, element)
+        self._version += 1
+        if self.algo.should_record("priorityqueue_offer"):
+            state = self.state_generator.priorityqueue_offer(self.body,element,comments)
+            self.algo.add_state(state,version=self._version)
+
+    def offer_many(self,elements,comments="",trace=False):
+        """Add multiple elements to priority queue with a single state. The
+        heap is rebuilt in linear time instead of pushing elements one by one.
+
+        Args:
+            elements (iterable): elements to be added to priority queue
+            comments (str, optional): Comments for descriptive format. Defaults to "".
+            trace (bool, optional): If true, the ``priorityqueue_offer_many`` state holds the elements before heapifying and a ``priorityqueue_sift`` state is generated for every swap made while heapifying. Defaults to False.
+
+        Raises:
+            ARgorithmError: If elements are duplicates or already in an indexed priority queue
+
+        Example:
+            >>> pq.offer(4)
+            >>> pq.offer_many([6, 2, 5])
+            >>> pq
+            PriorityQueue([2, 4, 5, 6])
+        """
+        elements = list(elements)
+        if not elements:
+            return
+        self._append(elements)
+        self._version += 1
+        if trace:
+            if self.algo.should_record("priorityqueue_offer_many"):
+                state = self.state_generator.priorityqueue_offer_many(self.body,elements,comments)
+                self.algo.add_state(state,version=self._version)
+            self._heapify(trace=True)
+            return
+        self._heapify()
+        if self.algo.should_record("priorityqueue_offer_many"):
+            state = self.state_generator.priorityqueue_offer_many(self.body,elements,comments)
+            self.algo.add_state(state,version=self._version)
+
+    def update(self,element,comments=""):
+        """Moves element to its place after its priority changed. The new
+        priority is computed with ``key`` .
+
+        Args:
+            element : element whose priority changed
+            comments (str, optional): Comments for descriptive format. Defaults to "".
+
+        Raises:
+            ARgorithmError: If element is not in priority queue
+
+        Example:
+            >>> dist = {"a" : 4, "b" : 7}
+            >>> pq = ARgorithmToolkit.PriorityQueue(name="pq",algo=algo,data=dist,key=dist.get,indexed=True)
+            >>> dist["b"] = 1
+            >>> pq.update("b")
+            >>> pq.peek()
+            'b'
+        """
+        index = self._index(element)
+        if self._keys is not None:
+            self._keys[index] = self.key(element)
+        moved = self._sift_up(index)
+        index = self._sift_down(index) if moved == index else moved
+        self._version += 1
+        if self.algo.should_record("priorityqueue_update"):
+            state = self.state_generator.priorityqueue_update(self.body,element,index,comments)
+            self.algo.add_state(state,version=self._version)
+
+    def decrease_key(self,element,comments=""):
+        """Moves element towards the front after its priority decreased. The
+        new priority is computed with ``key`` .
+
+        Args:
+            element : element whose priority decreased
+            comments (str, optional): Comments for descriptive format. Defaults to "".
+
+        Raises:
+            ARgorithmError: If element is not in priority queue or its priority increased
+
+        Example:
+            >>> dist[v] = dist[u] + weight
+            >>> pq.decrease_key(v)
+        """
+        index = self._index(element)
+        if self._keys is not None:
+            priority = self.key(element)
+            if self._keys[index] < priority:
+                raise ARgorithmError('priority of element increased, use update')
+            self._keys[index] = priority
+        index = self._sift_up(index)
+        self._version += 1
+        if self.algo.should_record("priorityqueue_update"):
+            state = self.state_generator.priorityqueue_update(self.body,element,index,comments)
+            self.algo.add_state(state,version=self._version)
+
+    def remove(self,element,comments=""):
+        """Removes element from priority queue.
+
+        Args:
+            element : element to be removed
+            comments (str, optional): Comments for descriptive format. Defaults to "".
+
+        Raises:
+            ARgorithmError: If element is not in priority queue
+
+        Example:
+            >>> pq.offer_many([3, 1, 2])
+            >>> pq.remove(2)
+            >>> pq
+            PriorityQueue([1, 3])
+        """
+        element = self._pop(self._index(element))
+        self._version += 1
+        if self.algo.should_record("priorityqueue_remove"):
+            state = self.state_generator.priorityqueue_remove(self.body,element,comments)
+            self.algo.add_state(state,version=self._version)
 
     def poll(self,comments=""):
         """pops first element from priority queue.
@@ -227,9 +601,14 @@ class PriorityQueue(ARgorithmStructure):
         """
         if self.empty():
             raise ARgorithmError('queue is empty')
-        item = heapq.heappop(self.body)
-        state = self.state_generator.priorityqueue_poll(body=self.body,element=item,comments=comments)
-        self.algo.add_state(state)
+        if self._managed():
+            item = self._pop(0)
+        else:
+            item = heapq.heappop(self.body)
+        self._version += 1
+        if self.algo.should_record("priorityqueue_poll"):
+            state = self.state_generator.priorityqueue_poll(body=self.body,element=item,comments=comments)
+            self.algo.add_state(state,version=self._version)
         return item
 
     def peek(self,comments=""):
@@ -256,8 +635,10 @@ class PriorityQueue(ARgorithmStructure):
         if self.empty():
             raise ARgorithmError('queue is empty')
         item = self.body[0]
-        state = self.state_generator.priorityqueue_peek(self.body,comments)
-        self.algo.add_state(state)
+        if self.algo.should_record("priorityqueue_peek"):
+            body = self.algo.shared_body(self._id,self._version)
+            state = self.state_generator.priorityqueue_peek(body or self.body,comments)
+            self.algo.add_state(state,version=self._version)
         return item
 
     def __str__(self):
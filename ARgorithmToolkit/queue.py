@@ -7,8 +7,56 @@ library without having to import from the queue module:
     >>> q = ARgorithmToolkit.Queue(name="q",algo=algo)
 """
 
+from collections.abc import Sequence
+from itertools import islice
 from ARgorithmToolkit.utils import State, StateSet, ARgorithmError, ARgorithmStructure
-from ARgorithmToolkit.encoders import serialize
+from ARgorithmToolkit.encoders import serialize, register
+
+class QueueBody(Sequence):
+    """Read-only view of the elements of a queue when a state was generated.
+
+    The Queue class stores every pushed element in an append-only list and
+    keeps the index of its front. The body of the queue is always a window of
+    that list, so states store the window instead of copying the elements.
+    Elements that are popped are never overwritten, which keeps older views
+    valid.
+
+    Attributes:
+        log (list): The list in which the queue stores its elements
+        start (int): Index of the front of queue in log
+        stop (int): Index after the back of queue in log
+    """
+    __slots__ = ('log','start','stop')
+
+    def __init__(self,log,start,stop):
+        self.log = log
+        self.start = start
+        self.stop = stop
+
+    def __len__(self):
+        return self.stop - self.start
+
+    def __getitem__(self,key):
+        if isinstance(key,slice):
+            return [self.log[i] for i in range(self.start,self.stop)[key]]
+        return self.log[range(self.start,self.stop)[key]]
+
+    def __iter__(self):
+        return islice(self.log,self.start,self.stop)
+
+    def __eq__(self,other):
+        if isinstance(other,Sequence) and not isinstance(other,str):
+            return len(self) == len(other) and all(x == y for x,y in zip(self,other))
+        return NotImplemented
+
+    def tolist(self):
+        """Returns the elements as a list."""
+        return self.log[self.start:self.stop]
+
+    def __repr__(self):
+        return self.tolist().__repr__()
+
+register(QueueBody,QueueBody.tolist)
 
 class QueueState():
     """This class is used to generate states for various actions performed on
@@ -49,7 +97,7 @@ class QueueState():
         """Generates the `queue_push` state when an element is added to queue.
 
         Args:
-            body (list): Body of queue
+            body (QueueBody): Body of queue
             element: Element to be added to back of queue
             comments (str, optional): Comments for descriptive purpose. Defaults to "".
 
@@ -60,7 +108,7 @@ class QueueState():
         state_def = {
             "id" : self._id,
             "variable_name" : self.name,
-            "body" : list(body),
+            "body" : body,
             "element" : element
         }
         return State(
@@ -74,7 +122,7 @@ class QueueState():
         queue.
 
         Args:
-            body (list): Body of queue
+            body (QueueBody): Body of queue
             comments (str, optional): Comments for descriptive purpose. Defaults to "".
             element : element that was popped from the queue.
 
@@ -85,7 +133,7 @@ class QueueState():
         state_def = {
             "id" : self._id,
             "variable_name" : self.name,
-            "body" : list(body),
+            "body" : body,
             "element" : element,
         }
         return State(
@@ -98,7 +146,7 @@ class QueueState():
         """Generates the `queue_front` state when front of queue is accessed.
 
         Args:
-            body (list): Body of queue
+            body (QueueBody): Body of queue
             comments (str, optional): Comments for descriptive purpose. Defaults to "".
 
         Returns:
@@ -108,7 +156,7 @@ class QueueState():
         state_def = {
             "id" : self._id,
             "variable_name" : self.name,
-            "body" : list(body),
+            "body" : body,
         }
         return State(
             state_type=state_type,
@@ -120,7 +168,7 @@ class QueueState():
         """Generates the `queue_back` state when back of queue is accessed.
 
         Args:
-            body (list): Body of queue
+            body (QueueBody): Body of queue
             comments (str, optional): Comments for descriptive purpose. Defaults to "".
 
         Returns:
@@ -130,7 +178,7 @@ class QueueState():
         state_def = {
             "id" : self._id,
             "variable_name" : self.name,
-            "body" : list(body),
+            "body" : body,
         }
         return State(
             state_type=state_type,
@@ -154,7 +202,16 @@ class Queue(ARgorithmStructure):
     Example:
         >>> algo = ARgorithmToolkit.StateSet()
         >>> q = ARgorithmToolkit.queue.Queue(name="q",algo=algo)
+
+    Note:
+        The elements are stored in an append-only list along with the index of
+        the front of queue so that push and pop take constant time and states
+        store a ``QueueBody`` view instead of a copy of the queue. The list is
+        compacted once more than half of it has been popped. ``body`` returns
+        the same read-only view, so code that changed ``q.body`` in place has
+        to push and pop or assign a new body instead.
     """
+    COMPACT_SIZE = 1024
 
     def __init__(self, name:str, algo:StateSet, comments:str = ""):
         try:
@@ -168,9 +225,39 @@ class Queue(ARgorithmStructure):
             self.algo = algo
         except AssertionError as e:
             raise ARgorithmError("Queue structure needs a reference of template to store states") from e
-        self.body = []
+        self._log = []
+        self._head = 0
+        self._version = 0
         state = self.state_generator.queue_declare(comments)
-        self.algo.add_state(state)
+        self.algo.add_state(state,version=self._version)
+
+    @property
+    def body(self):
+        """The elements of queue from front to back. The body is a read-only
+        view, changing it in place raises instead of being silently lost. Use
+        push and pop, or assign a new body.
+
+        Returns:
+            QueueBody: read-only view of the elements of queue
+
+        Example:
+            >>> q.body
+            [3, 5, 4]
+            >>> q.body.append(1)
+            Traceback (most recent call last):
+            AttributeError: 'QueueBody' object has no attribute 'append'
+        """
+        return self._view()
+
+    @body.setter
+    def body(self,value):
+        self._log = list(value)
+        self._head = 0
+        self._version += 1
+
+    def _view(self):
+        """Returns the current body as a QueueBody to be stored in states."""
+        return QueueBody(self._log,self._head,len(self._log))
 
     def __len__(self):
         """The operator overload for len() function that returns size of queue.
@@ -182,7 +269,7 @@ class Queue(ARgorithmStructure):
             >>> len(q)
             0
         """
-        return len(self.body)
+        return len(self._log) - self._head
 
     def empty(self):
         """Checks whether queue is empty or not.
@@ -214,9 +301,11 @@ class Queue(ARgorithmStructure):
             >>> q
             Queue([3, 5, 4])
         """
-        self.body.append(element)
-        state = self.state_generator.queue_push(self.body,element,comments)
-        self.algo.add_state(state)
+        self._log.append(element)
+        self._version += 1
+        if self.algo.should_record("queue_push"):
+            state = self.state_generator.queue_push(self._view(),element,comments)
+            self.algo.add_state(state,version=self._version)
 
     def pop(self,comments=""):
         """Removes element from front of queue and returns it.
@@ -242,10 +331,15 @@ class Queue(ARgorithmStructure):
         """
         if self.empty():
             raise ARgorithmError('queue is empty')
-        item = self.body[0]
-        self.body = self.body[1:]
-        state = self.state_generator.queue_pop(body=self.body,element=item, comments=comments)
-        self.algo.add_state(state)
+        item = self._log[self._head]
+        self._head += 1
+        self._version += 1
+        if self._head >= self.COMPACT_SIZE and 2*self._head >= len(self._log):
+            self._log = self._log[self._head:]
+            self._head = 0
+        if self.algo.should_record("queue_pop"):
+            state = self.state_generator.queue_pop(body=self._view(),element=item, comments=comments)
+            self.algo.add_state(state,version=self._version)
         return item
 
     def front(self,comments=""):
@@ -268,9 +362,10 @@ class Queue(ARgorithmStructure):
         """
         if self.empty():
             raise ARgorithmError('queue is empty')
-        item = self.body[0]
-        state = self.state_generator.queue_front(self.body,comments)
-        self.algo.add_state(state)
+        item = self._log[self._head]
+        if self.algo.should_record("queue_front"):
+            state = self.state_generator.queue_front(self._view(),comments)
+            self.algo.add_state(state,version=self._version)
         return item
 
     def back(self,comments=""):
@@ -293,9 +388,10 @@ class Queue(ARgorithmStructure):
         """
         if self.empty():
             raise ARgorithmError('queue is empty')
-        item = self.body[-1]
-        state = self.state_generator.queue_back(self.body,comments)
-        self.algo.add_state(state)
+        item = self._log[-1]
+        if self.algo.should_record("queue_back"):
+            state = self.state_generator.queue_back(self._view(),comments)
+            self.algo.add_state(state,version=self._version)
         return item
 
     def __str__(self):
@@ -1,10 +1,13 @@
 """Security module contains functions to secure code files and prevent harmful
 code injection at server side."""
-import re
+import ast
 import json
+import hashlib
 import importlib
-from pyflakes import checker
-from ARgorithmToolkit import ARgorithmError,StateSet
+from ARgorithmToolkit import ARgorithmError,StateSet,stateset_defaults
+from ARgorithmToolkit.utils import _DEFAULTS
+from ARgorithmToolkit.cache import execution_key
+from ARgorithmToolkit.serializers import get_serializer
 
 FORBIDDEN = [
     'STORAGE_FOLDER','config',
@@ -12,6 +15,152 @@ FORBIDDEN = [
     'eval','exec'
 ]
 
+FORBIDDEN_ATTRIBUTES = [
+    '__import__','__builtins__','__globals__','__subclasses__',
+    '__bases__','__mro__','__code__','__closure__','__dict__',
+    '__getattribute__','__loader__','__spec__',
+    'f_globals','f_locals','f_back','gi_frame','tb_frame'
+]
+
+_FORBIDDEN_NAMES = frozenset(FORBIDDEN) | frozenset(FORBIDDEN_ATTRIBUTES)
+_MAX_VERDICTS = 1024
+_VERDICTS = {}
+
+class Diagnostic:
+    """A problem found in a code file by the injection check.
+
+    Attributes:
+        line (int): The line of the problem, starting from 1
+        column (int): The column of the problem, starting from 0
+        code (str): The kind of problem, one of ``no-toolkit``, ``invalid-import``, ``forbidden-name``, ``forbidden-attribute`` and ``syntax-error``
+        message (str): The description of the problem
+    """
+    __slots__ = ('line','column','code','message')
+
+    def __init__(self,line:int,column:int,code:str,message:str):
+        self.line = line
+        self.column = column
+        self.code = code
+        self.message = message
+
+    def __eq__(self,other):
+        return isinstance(other,Diagnostic) and (self.line,self.column,self.code,self.message) == (other.line,other.column,other.code,other.message)
+
+    def __repr__(self):
+        return f"Diagnostic({self.line},{self.column},{self.code!r},{self.message!r})"
+
+    def __str__(self):
+        return f"{self.line}:{self.column}: {self.code} {self.message}"
+
+class ARgorithmInjectionError(ARgorithmError):
+    """The error class raised by ``injection_check`` when a code file is
+    possibly harmful.
+
+    Attributes:
+        diagnostics (list): list of Diagnostic found in the code file
+    """
+    def __init__(self,diagnostics:list):
+        super().__init__("\n".join(str(x) for x in diagnostics))
+        self.diagnostics = diagnostics
+
+def _toolkit(module):
+    """Checks whether module is ARgorithmToolkit or one of its modules."""
+    return module == "ARgorithmToolkit" or module.startswith("ARgorithmToolkit.")
+
+def _identifiers(node):
+    """Returns the identifiers declared or used by an AST node other than an
+    attribute access."""
+    if isinstance(node,ast.Name):
+        return (node.id,)
+    if isinstance(node,(ast.FunctionDef,ast.AsyncFunctionDef,ast.ClassDef)):
+        return (node.name,)
+    if isinstance(node,ast.arg):
+        return (node.arg,)
+    if isinstance(node,ast.keyword):
+        return (node.arg,) if node.arg else ()
+    if isinstance(node,ast.alias):
+        return (node.name,node.asname) if node.asname else (node.name,)
+    if isinstance(node,(ast.Global,ast.Nonlocal)):
+        return node.names
+    if isinstance(node,ast.ExceptHandler):
+        return (node.name,) if node.name else ()
+    return ()
+
+def inspect_code(source:str):
+    """Checks code for harmful code in a single walk of its syntax tree. The
+    code must import ARgorithmToolkit, must not import any other module and
+    must not use the names in ``FORBIDDEN`` or the attributes in
+    ``FORBIDDEN_ATTRIBUTES``.
+
+    Args:
+        source (str): The code to check
+
+    Returns:
+        list: list of Diagnostic ordered by position, empty if the code is safe
+
+    Example:
+        >>> ARgorithmToolkit.security.inspect_code("import os")
+        [Diagnostic(1,0,'no-toolkit','ARgorithmToolkit not imported'), Diagnostic(1,0,'invalid-import','invalid module imported: os')]
+    """
+    try:
+        tree = ast.parse(source)
+    except SyntaxError as ex:
+        return [Diagnostic(ex.lineno or 1,ex.offset or 0,"syntax-error",ex.msg)]
+    diagnostics = []
+    imported = False
+    for node in ast.walk(tree):
+        if isinstance(node,ast.Import):
+            for alias in node.names:
+                if _toolkit(alias.name):
+                    imported = True
+                else:
+                    diagnostics.append(Diagnostic(node.lineno,node.col_offset,"invalid-import",f"invalid module imported: {alias.name}"))
+        elif isinstance(node,ast.ImportFrom):
+            module = "." * node.level + (node.module or "")
+            if node.level == 0 and _toolkit(module):
+                imported = True
+            else:
+                diagnostics.append(Diagnostic(node.lineno,node.col_offset,"invalid-import",f"invalid module imported: {module}"))
+        elif isinstance(node,ast.Attribute):
+            if node.attr in _FORBIDDEN_NAMES:
+                diagnostics.append(Diagnostic(node.lineno,node.col_offset,"forbidden-attribute",f"possible code injection: {node.attr}"))
+            continue
+        for name in _identifiers(node):
+            if name in _FORBIDDEN_NAMES:
+                diagnostics.append(Diagnostic(getattr(node,"lineno",1),getattr(node,"col_offset",0),"forbidden-name",f"possible code injection: {name}"))
+    if not imported:
+        diagnostics.insert(0,Diagnostic(1,0,"no-toolkit","ARgorithmToolkit not imported"))
+    diagnostics.sort(key=lambda x: (x.line,x.column))
+    return diagnostics
+
+def check_file(filename:str):
+    """Checks a code file with ``inspect_code`` . Verdicts are cached by the
+    hash of the contents of the file, so checking an unchanged file again
+    does not parse it again. A file that is not valid utf-8 gets a
+    ``syntax-error`` diagnostic at the first invalid byte.
+
+    Args:
+        filename (str): the code file to check
+
+    Returns:
+        list: list of Diagnostic ordered by position, empty if the code is safe
+    """
+    with open(filename,'rb') as codefile:
+        code = codefile.read()
+    key = hashlib.sha256(code).digest()
+    verdict = _VERDICTS.get(key)
+    if verdict is None:
+        try:
+            verdict = tuple(inspect_code(code.decode()))
+        except UnicodeDecodeError as ex:
+            line = code.count(b"\n",0,ex.start) + 1
+            column = ex.start - code.rfind(b"\n",0,ex.start) - 1
+            verdict = (Diagnostic(line,column,"syntax-error",f"invalid utf-8 byte 0x{code[ex.start]:02x}: {ex.reason}"),)
+        if len(_VERDICTS) >= _MAX_VERDICTS:
+            del _VERDICTS[next(iter(_VERDICTS))]
+        _VERDICTS[key] = verdict
+    return list(verdict)
+
 def injection_check(filename:str):
     """Checks whether given code file does not contain harmful code to server
     operation.
@@ -20,49 +169,114 @@ def injection_check(filename:str):
         filename (str): the code file to check
 
     Raises:
-        ARgorithmError: Raised if possible harmful code injection
+        ARgorithmInjectionError: Raised if possible harmful code injection, with the diagnostics found
     """
-    count = 0
-    with open(filename,'r') as f:
-        lines = f.readlines()
-        for line in lines:
-            if "import ARgorithmToolkit" in line or "from ARgorithmToolkit" in line:
-                count +=1
-        if count == 0:
-            raise ARgorithmError("ARgorithmToolkit not imported")
-
-        for line in lines:
-            if line.startswith("from"):
-                if not re.search(r"^from\s+ARgorithmToolkit", line):
-                    raise ARgorithmError("invalid module imported")
-
-        for line in lines:
-            if line.startswith("import"):
-                if not re.search(r"^import\s+ARgorithmToolkit", line):
-                    raise ARgorithmError("invalid module imported")
-
-        text = '\n'.join(lines)
-        file_tokens = checker.make_tokens(text)
-        tokens = [token[1] for token in file_tokens if token[0] == 1]
-        not_allowed = list(set(tokens) & set(FORBIDDEN))
-        if len(not_allowed) > 0:
-            raise ARgorithmError('possible code injection')
-
-def execution_check(filename:str,configpath:str,parameters:dict):
-    """Executes the file on kwargs provided by programmer in the config file's
-    `example` key.
+    diagnostics = check_file(filename)
+    if diagnostics:
+        raise ARgorithmInjectionError(diagnostics)
+
+def _limits(config:dict,limits:dict):
+    """Combines the limits declared in config with the limits of the caller,
+    keeping the lower of the two for every limit."""
+    combined = dict(config.get("limits") or {})
+    for key,value in (limits or {}).items():
+        if value is not None and (combined.get(key) is None or value < combined[key]):
+            combined[key] = value
+    return combined or None
+
+def execution_options(config:dict,limits:dict=None,fmt="json"):
+    """Returns the StateSet defaults an ARgorithm with given config is executed
+    with. They change the states generated, so they are part of the cache key
+    of the execution. Bodies shared between states count as a reference
+    towards the limits only if the format writes them once.
 
     Args:
-        filename (str): The file with the ARgorithm code to be checked
-        config (dict): The config file for ARgorithm
+        config (dict): The config of the ARgorithm
+        limits (dict, optional): Keyword arguments of ``StateLimits`` enforced on top of the limits in config. Defaults to None.
+        fmt (str, optional): The name of the format the states are serialized in. Defaults to "json".
+
+    Returns:
+        dict: The StateSet defaults
     """
+    combined = _limits(config,limits)
+    if combined is not None and getattr(get_serializer(fmt),"refs",False):
+        combined["shared_bodies"] = True
+    return dict(_DEFAULTS,policy=config.get("policy"),limits=combined)
+
+def _execute(filename:str,config:dict,parameters:dict,limits=None,fmt="json"):
+    """Imports the code file and calls the function declared in config. The
+    defaults apply to StateSets created while importing the file as well."""
     module_name = filename.split('/')[-1][:-3]
     spec = importlib.util.spec_from_file_location(module_name,filename)
     module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+    options = execution_options(config,limits,fmt)
+    with stateset_defaults(policy=options["policy"],limits=options["limits"]):
+        spec.loader.exec_module(module)
+        func = getattr(module , config["function"])
+        output = func(**parameters)
+    assert isinstance(output,StateSet)
+    return output
+
+def _key(filename:str,config:dict,parameters:dict,limits=None,fmt="json"):
+    """Computes the cache key of an execution."""
+    with open(filename,'rb') as codefile:
+        return execution_key(codefile.read(),config,parameters,execution_options(config,limits,fmt))
+
+def execution_check(filename:str,configpath:str,parameters:dict,cache=None,limits=None):
+    """Executes the file on kwargs provided by programmer in the config file's
+    `example` key. The recording policy declared in the config file's `policy`
+    key and the limits declared in its `limits` key are applied to the
+    StateSet created by the ARgorithm.
+
+    If a cache is given, the states of an earlier execution of the same code
+    with the same config, parameters and limits are returned from it without
+    executing the code.
+
+    Args:
+        filename (str): The file with the ARgorithm code to be checked
+        config (dict): The config file for ARgorithm
+        parameters (dict): The parameters the ARgorithm is executed on
+        cache (ARgorithmToolkit.cache.ExecutionCache, optional): The cache of executions. Defaults to None.
+        limits (dict, optional): Keyword arguments of ``StateLimits`` enforced on top of the limits in config. Defaults to None.
+
+    Raises:
+        ARgorithmLimitError: Raised if the ARgorithm exceeds a limit
+    """
     with open(configpath,'r') as configfile:
         config = json.load(configfile)
-    func = getattr(module , config["function"])
-    output = func(**parameters)
-    assert isinstance(output,StateSet)
-    return output.states
+    if cache is None:
+        return _execute(filename,config,parameters,limits).states
+    key = _key(filename,config,parameters,limits)
+    states = cache.get(key)
+    if states is None:
+        states = _execute(filename,config,parameters,limits).states
+        cache.put(key,states)
+    return states
+
+def serialized_execution(filename:str,configpath:str,parameters:dict,fmt="json",cache=None,limits=None):
+    """Executes the file like ``execution_check`` and returns the states
+    serialized in given format. If a cache is given, the payload of an
+    earlier execution is returned from it without executing the code or
+    serializing the states.
+
+    Args:
+        filename (str): The file with the ARgorithm code to be checked
+        config (dict): The config file for ARgorithm
+        parameters (dict): The parameters the ARgorithm is executed on
+        fmt (str, optional): The name of the format in ``ARgorithmToolkit.serializers``. Defaults to "json".
+        cache (ARgorithmToolkit.cache.ExecutionCache, optional): The cache of executions. Defaults to None.
+        limits (dict, optional): Keyword arguments of ``StateLimits`` enforced on top of the limits in config. Defaults to None.
+
+    Returns:
+        bytes: The serialized states
+    """
+    with open(configpath,'r') as configfile:
+        config = json.load(configfile)
+    if cache is None:
+        return _execute(filename,config,parameters,limits,fmt).dumps(fmt)
+    key = _key(filename,config,parameters,limits,fmt)
+    data = cache.load(key,fmt)
+    if data is None:
+        data = _execute(filename,config,parameters,limits,fmt).dumps(fmt)
+        cache.store(key,data,fmt)
+    return data
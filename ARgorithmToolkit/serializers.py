@@ -0,0 +1,502 @@
+"""The serializers module converts the states of a StateSet to bytes and back.
+Three formats are provided:
+
+- ``json`` : the JSON list of state dictionaries produced by ``StateEncoder``
+- ``json_refs`` : JSON in which a body that is the same object as the body of
+  an earlier state is left out and the ``state_def`` holds ``"body_ref": k``
+  in place of ``"body"`` , k being the index of that state. The key is set by
+  the toolkit next to ``body`` like ``body_delta`` , so it cannot collide with
+  the contents of a body. ``loads`` expands the references again, so clients
+  that do not understand them can be served the expanded states
+- ``binary`` : a compact length-prefixed format in which numeric bodies are
+  stored as raw typed buffers instead of text
+
+Serializers can be accessed by name and new formats can be registered:
+
+    >>> data = algo.dumps("binary")
+    >>> states = ARgorithmToolkit.serializers.loads(data)
+    >>> ARgorithmToolkit.serializers.register_serializer("custom",CustomSerializer())
+
+Binary format:
+    The payload starts with the magic bytes ``ARGS`` , a version byte and the
+    number of states. Every state is stored as its byte length followed by the
+    encoded state dictionary. Values are encoded as a one byte tag followed by
+    the data of the value:
+
+    - ``N`` , ``T`` , ``F`` : None , True , False
+    - ``b`` , ``h`` , ``i`` , ``q`` : 8 , 16 , 32 and 64 bit signed integers
+    - ``j`` : integer outside 64 bit range stored as decimal text
+    - ``d`` : 64 bit float
+    - ``s`` : length followed by utf-8 text
+    - ``r`` : index of a short string that already appeared in the payload
+    - ``l`` : count followed by the values
+    - ``m`` : count followed by key value pairs
+    - ``a`` : typed buffer. numpy dtype string , dimensions , shape and raw bytes
+    - ``R`` : index of an earlier state whose body is repeated
+
+    Keys of maps are converted to strings the way JSON converts them, so
+    a payload loads to the same states in every format.
+
+    Counts, lengths and indexes are unsigned LEB128 varints. Integer buffers
+    are stored in the smallest dtype that holds their values. Strings of at
+    most 64 bytes are added to a string table in order of appearance so that
+    repeated keys like ``state_def`` are written once. Bodies shared between
+    states, like those of consecutive read-only states, are written once as
+    well.
+
+All fixed width numbers in the format are little endian.
+"""
+import json
+import struct
+from itertools import chain
+import numpy as np
+from ARgorithmToolkit.utils import ARgorithmError
+from ARgorithmToolkit.encoders import StateEncoder, handler_for
+
+MAGIC = b"ARGS"
+VERSION = 1
+SHORT_STRING = 64
+
+_INTS = [
+    (b"b",struct.Struct("<b"),-(1 << 7),(1 << 7)-1),
+    (b"h",struct.Struct("<h"),-(1 << 15),(1 << 15)-1),
+    (b"i",struct.Struct("<i"),-(1 << 31),(1 << 31)-1),
+    (b"q",struct.Struct("<q"),-(1 << 63),(1 << 63)-1),
+]
+_INT_TAGS = {tag[0]:packer for tag,packer,_,_ in _INTS}
+_FLOAT = struct.Struct("<d")
+_DTYPES = [np.int8,np.int16,np.int32,np.int64]
+
+class _BodyRef:
+    """Stands in for a body that is the same object as the body of the state
+    at index."""
+    __slots__ = ('index',)
+
+    def __init__(self,index):
+        self.index = index
+
+def _replace(state_def,old,new,value):
+    """Returns copy of state_def in which key old is replaced by key new with
+    given value, keeping the order of keys."""
+    return {(new if k == old else k):(value if k == old else v) for k,v in state_def.items()}
+
+def _contents(states,refs=True,key=None):
+    """Yields the content of each state. If refs is True, bodies that are the
+    same object as the body of an earlier state are replaced by a _BodyRef to
+    the first state holding it, or by the index of that state stored under
+    key in place of ``body`` if key is given."""
+    seen = {}
+    for index,state in enumerate(states):
+        content = state.content
+        state_def = content["state_def"]
+        if refs and isinstance(state_def,dict) and state_def.get("body") is not None:
+            body = id(state_def["body"])
+            if body in seen:
+                if key is None:
+                    state_def = dict(state_def,body=_BodyRef(seen[body]))
+                else:
+                    state_def = _replace(state_def,"body",key,seen[body])
+                content["state_def"] = state_def
+            else:
+                seen[body] = index
+        yield content
+
+def expand_refs(states):
+    """Replaces the ``body_ref`` of states loaded from the ``json_refs`` format
+    by the body of the state it refers to.
+
+    Args:
+        states (list): list of state metadata
+
+    Returns:
+        list: The same list with all bodies expanded
+    """
+    for state in states:
+        state_def = state["state_def"]
+        if isinstance(state_def,dict) and "body_ref" in state_def:
+            body = states[state_def["body_ref"]]["state_def"]["body"]
+            state["state_def"] = _replace(state_def,"body_ref","body",body)
+    return states
+
+class JSONSerializer:
+    """Serializes states as a JSON list using
+    ``ARgorithmToolkit.encoders.StateEncoder``.
+
+    Attributes:
+        refs (bool, optional): If True, repeated bodies are written as references to the earlier state. Defaults to False.
+    """
+
+    def __init__(self,refs=False):
+        self.refs = refs
+
+    def dumps(self,states):
+        """Converts states to bytes.
+
+        Args:
+            states (list): list of ARgorithmToolkit.utils.State
+
+        Returns:
+            bytes: utf-8 encoded JSON
+        """
+        return json.dumps(list(_contents(states,self.refs,"body_ref")),cls=StateEncoder).encode()
+
+    def loads(self,data):
+        """Converts bytes generated by dumps to list of state dictionaries.
+
+        Args:
+            data (bytes): The serialized states
+
+        Returns:
+            list: list of state metadata
+        """
+        states = json.loads(data)
+        if self.refs:
+            expand_refs(states)
+        return states
+
+class BinarySerializer:
+    """Serializes states in the binary format described in the module
+    documentation.
+
+    Attributes:
+        arrays (bool or callable, optional): If True, loads returns typed buffers as numpy arrays instead of lists. If callable, it is called with the type of every state and only typed buffers of states for which it returns True are returned as numpy arrays. Defaults to False.
+        refs (bool): Always True, repeated bodies are written as references to the earlier state
+    """
+    refs = True
+
+    def __init__(self,arrays=False):
+        self.arrays = arrays
+
+    def dumps(self,states):
+        """Converts states to bytes.
+
+        Args:
+            states (list): list of ARgorithmToolkit.utils.State
+
+        Returns:
+            bytes: binary encoded states
+        """
+        writer = _BinaryWriter()
+        out = bytearray(MAGIC)
+        out.append(VERSION)
+        _write_varint(out,len(states))
+        for content in _contents(states):
+            record = writer.encode(content)
+            _write_varint(out,len(record))
+            out += record
+        return bytes(out)
+
+    def loads(self,data):
+        """Converts bytes generated by dumps to list of state dictionaries.
+
+        Args:
+            data (bytes): The serialized states
+
+        Raises:
+            ARgorithmError: Raised if data is not in binary format
+
+        Returns:
+            list: list of state metadata
+        """
+        data = memoryview(data)
+        if len(data) < 6 or bytes(data[:4]) != MAGIC or data[4] != VERSION:
+            raise ARgorithmError("data is not in ARgorithm binary format")
+        states = []
+        reader = _BinaryReader(data,self.arrays,states)
+        count,offset = _read_varint(data,5)
+        for _ in range(count):
+            size,offset = _read_varint(data,offset)
+            value,_ = reader.decode_state(offset)
+            offset += size
+            states.append(value)
+        return states
+
+def _write_varint(out,value):
+    """Appends unsigned LEB128 varint to out."""
+    while value >= 0x80:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def _read_varint(data,offset):
+    """Reads unsigned LEB128 varint at offset and returns it along with offset
+    of the next value."""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return value,offset
+        shift += 7
+
+class _BinaryWriter:
+    """Encodes values of a single payload, holding its string table."""
+
+    def __init__(self):
+        self.strings = {}
+
+    def encode(self,value):
+        """Returns value encoded as bytes."""
+        out = bytearray()
+        self._encode(out,value)
+        return out
+
+    def _encode(self,out,value):
+        """Appends encoded value to out."""
+        kind = type(value)
+        if kind is str:
+            index = self.strings.get(value)
+            if index is not None:
+                out += b"r"
+                _write_varint(out,index)
+                return
+            text = value.encode()
+            if len(text) <= SHORT_STRING:
+                self.strings[value] = len(self.strings)
+            out += b"s"
+            _write_varint(out,len(text))
+            out += text
+        elif value is None:
+            out += b"N"
+        elif kind is bool:
+            out += b"T" if value else b"F"
+        elif kind is int:
+            for tag,packer,low,high in _INTS:
+                if low <= value <= high:
+                    out += tag
+                    out += packer.pack(value)
+                    return
+            text = str(value).encode()
+            out += b"j"
+            _write_varint(out,len(text))
+            out += text
+        elif kind is float:
+            out += b"d"
+            out += _FLOAT.pack(value)
+        elif kind in (list,tuple):
+            buffer = _typed_buffer(value)
+            if buffer is not None:
+                self._encode_buffer(out,buffer)
+                return
+            out += b"l"
+            _write_varint(out,len(value))
+            for x in value:
+                self._encode(out,x)
+        elif kind is dict:
+            out += b"m"
+            _write_varint(out,len(value))
+            for k,v in value.items():
+                self._encode(out,k if type(k) is str else _json_key(k))
+                self._encode(out,v)
+        elif isinstance(value,np.ndarray) and value.dtype.kind in "biuf":
+            self._encode_buffer(out,value)
+        elif kind is _BodyRef:
+            out += b"R"
+            _write_varint(out,value.index)
+        else:
+            handler = handler_for(kind)
+            if handler is None:
+                raise TypeError(f"Object of type {kind.__name__} is not serializable")
+            self._encode(out,handler(value))
+
+    def _encode_buffer(self,out,array):
+        """Appends numpy array as typed buffer to out."""
+        array = _narrow(np.ascontiguousarray(array))
+        dtype = array.dtype.newbyteorder("<")
+        name = dtype.str.encode()
+        out += b"a"
+        out.append(len(name))
+        out += name
+        out.append(array.ndim)
+        for dim in array.shape:
+            _write_varint(out,dim)
+        out += array.astype(dtype,copy=False).tobytes()
+
+class _BinaryReader:
+    """Decodes values of a single payload, holding its string table."""
+
+    def __init__(self,data,arrays,states):
+        self.data = data
+        self.arrays = arrays
+        self.current = False if callable(arrays) else bool(arrays)
+        self.states = states
+        self.strings = []
+
+    def decode_state(self,offset):
+        """Decodes state at offset. If arrays is callable, decides whether
+        typed buffers of the state are returned as numpy arrays from its
+        state type before decoding the rest of it."""
+        if not callable(self.arrays) or self.data[offset] != 0x6d:
+            return self.decode(offset)
+        count,offset = _read_varint(self.data,offset+1)
+        self.current = False
+        items = {}
+        for _ in range(count):
+            key,offset = self.decode(offset)
+            items[key],offset = self.decode(offset)
+            if key == "state_type":
+                self.current = bool(self.arrays(items[key]))
+        return items,offset
+
+    def decode(self,offset):
+        """Decodes value at offset and returns it along with the offset of the
+        next value."""
+        data = self.data
+        tag = data[offset]
+        offset += 1
+        if tag == 0x72:
+            if data[offset] < 0x80:
+                return self.strings[data[offset]],offset+1
+            index,offset = _read_varint(data,offset)
+            return self.strings[index],offset
+        if tag == 0x73:
+            size,offset = _read_varint(data,offset)
+            text = str(data[offset:offset+size],"utf-8")
+            if size <= SHORT_STRING:
+                self.strings.append(text)
+            return text,offset+size
+        if tag in _INT_TAGS:
+            packer = _INT_TAGS[tag]
+            return packer.unpack_from(data,offset)[0],offset+packer.size
+        if tag == 0x4e:
+            return None,offset
+        if tag == 0x54:
+            return True,offset
+        if tag == 0x46:
+            return False,offset
+        if tag == 0x64:
+            return _FLOAT.unpack_from(data,offset)[0],offset+8
+        if tag == 0x6a:
+            size,offset = _read_varint(data,offset)
+            return int(str(data[offset:offset+size],"ascii")),offset+size
+        if tag == 0x6c:
+            count,offset = _read_varint(data,offset)
+            items = []
+            for _ in range(count):
+                item,offset = self.decode(offset)
+                items.append(item)
+            return items,offset
+        if tag == 0x6d:
+            count,offset = _read_varint(data,offset)
+            items = {}
+            for _ in range(count):
+                key,offset = self.decode(offset)
+                items[key],offset = self.decode(offset)
+            return items,offset
+        if tag == 0x52:
+            index,offset = _read_varint(data,offset)
+            return self.states[index]["state_def"]["body"],offset
+        if tag == 0x61:
+            size = data[offset]
+            dtype = np.dtype(str(data[offset+1:offset+1+size],"ascii"))
+            offset += 1+size
+            ndim = data[offset]
+            offset += 1
+            shape = []
+            length = dtype.itemsize
+            for _ in range(ndim):
+                dim,offset = _read_varint(data,offset)
+                shape.append(dim)
+                length *= dim
+            array = np.frombuffer(data[offset:offset+length],dtype=dtype).reshape(shape)
+            return (array.copy() if self.current else array.tolist()),offset+length
+        raise ARgorithmError(f"invalid tag {chr(tag)} in binary data")
+
+def _json_key(key):
+    """Returns key of a map converted to string the way JSON converts it."""
+    if key is None or isinstance(key,(bool,int,float)):
+        return json.dumps(key)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+def _narrow(array):
+    """Returns integer array in the smallest signed dtype that holds its
+    values."""
+    if array.dtype.kind not in "iu" or array.size == 0:
+        return array
+    low,high = int(array.min()),int(array.max())
+    for dtype in _DTYPES:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return array.astype(dtype,copy=False)
+    return array
+
+def _typed_buffer(value):
+    """Returns list as numpy array if it is a one or two dimensional list of
+    only ints or only floats, otherwise None."""
+    if len(value) < 4:
+        return None
+    types = set(map(type,value))
+    if types == {list} or types == {tuple}:
+        if len(set(map(len,value))) != 1:
+            return None
+        types = set(map(type,chain.from_iterable(value)))
+    if types != {int} and types != {float}:
+        return None
+    try:
+        array = np.array(value)
+    except OverflowError:
+        return None
+    if array.dtype.kind not in "if":
+        return None
+    return array
+
+SERIALIZERS = {
+    "json" : JSONSerializer(),
+    "json_refs" : JSONSerializer(refs=True),
+    "binary" : BinarySerializer(),
+}
+
+def register_serializer(name,serializer):
+    """Registers a serializer under given name.
+
+    Args:
+        name (str): The name of the format
+        serializer: Object with ``dumps(states)`` and ``loads(data)`` methods
+    """
+    SERIALIZERS[name] = serializer
+
+def get_serializer(name):
+    """Returns serializer registered under given name.
+
+    Args:
+        name (str): The name of the format
+
+    Raises:
+        ARgorithmError: Raised if no serializer is registered for the name
+
+    Returns:
+        The serializer object
+    """
+    try:
+        return SERIALIZERS[name]
+    except KeyError as e:
+        raise ARgorithmError(f"no serializer registered for format {name}") from e
+
+def dumps(states,fmt="json"):
+    """Serializes list of states in given format.
+
+    Args:
+        states (list): list of ARgorithmToolkit.utils.State
+        fmt (str, optional): The name of the format. Defaults to "json".
+
+    Returns:
+        bytes: The serialized states
+    """
+    return get_serializer(fmt).dumps(states)
+
+def loads(data,fmt=None):
+    """Deserializes states. If format is not given, binary data is detected by
+    its magic bytes and everything else is treated as JSON.
+
+    Args:
+        data (bytes): The serialized states
+        fmt (str, optional): The name of the format. Defaults to None.
+
+    Returns:
+        list: list of state metadata
+    """
+    if fmt is None:
+        fmt = "binary" if bytes(data[:4]) == MAGIC else "json"
+    return get_serializer(fmt).loads(data)
@@ -9,10 +9,11 @@ ARgorithmToolkit library without having to import from the set module :
     >>> set1 = ARgorithmToolkit.set.Set(name='set1',algo=algo,data=data)
 """
 
-from numpy.lib.function_base import iterable
-from numpy import generic
+import sys
+from collections.abc import Iterable
 from ARgorithmToolkit.utils import ARgorithmHashable, State, StateSet, ARgorithmError, ARgorithmStructure
 from ARgorithmToolkit.encoders import serialize
+from ARgorithmToolkit.persistent import PersistentSet
 
 class SetState:
     """This class is used to generate states for various actions performed on
@@ -126,6 +127,11 @@ class SetState:
             comments=comments
         )
 
+def _is_numpy_scalar(value):
+    """Checks whether value is a numpy scalar without importing numpy."""
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(value,np.generic)
+
 @serialize
 class Set(ARgorithmStructure):
     """The Set class used to emulate set datastructure that can be rendered in
@@ -170,7 +176,7 @@ class Set(ARgorithmStructure):
         Set({1, 2, 3, 4})
     """
 
-    def __init__(self, name:str, algo:StateSet, data:iterable=None, comments= ""):
+    def __init__(self, name:str, algo:StateSet, data:Iterable=None, comments= ""):
         try:
             assert isinstance(name, str)
             self.state_generator = SetState(name, str(id(self)))
@@ -182,18 +188,20 @@ class Set(ARgorithmStructure):
         except Exception as ex:
             raise ARgorithmError("Set structure needs a reference of template to store states") from ex
 
-        self.body = set()
+        body = []
         if data:
             for x in data:
                 if isinstance(x, ARgorithmHashable):
-                    self.body.add(x.to_json())
-                elif isinstance(x, (int,str,bool,float,generic)):
-                    self.body.add(x)
+                    body.append(x.to_json())
+                elif isinstance(x, (int,str,bool,float)) or _is_numpy_scalar(x):
+                    body.append(x)
                 else:
                     raise TypeError("Invalid key error : Please provide data with ARgorithmHashable type or (int, float, bool, str)")
+        self.body = PersistentSet(body)
+        self._version = 0
         self.__working_set = set(data) if data else set()
         state = self.state_generator.set_declare(self.body, comments=comments)
-        self.algo.add_state(state)
+        self.algo.add_state(state,version=self._version)
 
     def __len__(self) -> int:
         """returns size of Set when processed by len() function.
@@ -229,13 +237,15 @@ class Set(ARgorithmStructure):
         except AssertionError as ae:
             raise TypeError("Invalid key error : Please provide data with ARgorithmHashable type or (int, float, bool, str)") from ae
         if isinstance(key, ARgorithmHashable):
-            self.body.add(key.to_json())
+            self.body = self.body.add(key.to_json())
         else:
-            self.body.add(key)
+            self.body = self.body.add(key)
 
         self.__working_set.add(key)
-        state = self.state_generator.set_add(self.body, key,comments)
-        self.algo.add_state(state)
+        self._version += 1
+        if self.algo.should_record("set_add"):
+            state = self.state_generator.set_add(self.body, key,comments)
+            self.algo.add_state(state,version=self._version)
 
 
     def remove(self, key, comments=""):
@@ -253,12 +263,14 @@ class Set(ARgorithmStructure):
         """
         try:
             if isinstance(key, ARgorithmHashable):
-                self.body.remove(key.to_json())
+                self.body = self.body.remove(key.to_json())
             else:
-                self.body.remove(key)
+                self.body = self.body.remove(key)
             self.__working_set.remove(key)
-            state = self.state_generator.set_remove(self.body, key,comments)
-            self.algo.add_state(state)
+            self._version += 1
+            if self.algo.should_record("set_remove"):
+                state = self.state_generator.set_remove(self.body, key,comments)
+                self.algo.add_state(state,version=self._version)
         except Exception as e:
             raise ARgorithmError(f"Invalid Key Error : {str(e)}") from e
 
@@ -279,8 +291,9 @@ class Set(ARgorithmStructure):
             False
         """
         found = key in self.__working_set
-        state = self.state_generator.set_find(self.body, key, found,comments)
-        self.algo.add_state(state)
+        if self.algo.should_record("set_find"):
+            state = self.state_generator.set_find(self.body, key, found,comments)
+            self.algo.add_state(state,version=self._version)
         return found
 
 
@@ -7,7 +7,7 @@ library without having to import from the stack module:
     >>> st = ARgorithmToolkit.Stack(name="st",algo=algo)
 """
 
-from ARgorithmToolkit.utils import State, StateSet, ARgorithmError, ARgorithmStructure
+from ARgorithmToolkit.utils import State, StateSet, ARgorithmError, ARgorithmStructure, state_body
 from ARgorithmToolkit.encoders import serialize
 
 class StackState():
@@ -99,7 +99,7 @@ class StackState():
         """Generates the `stack_push` state when top of stack is accessed.
 
         Args:
-            body (list): contents of stack
+            body (list or SharedBody): contents of stack
             comments (str, optional): Comments for descriptive purpose. Defaults to "".
 
         Returns:
@@ -109,7 +109,7 @@ class StackState():
         state_def = {
             "id" : self._id,
             "variable_name" : self.name,
-            "body" : list(body),
+            "body" : state_body(body,list),
         }
         return State(
             state_type=state_type,
@@ -147,8 +147,9 @@ class Stack(ARgorithmStructure):
         except AssertionError as e:
             raise ARgorithmError("Stack structure needs a reference of template to store states") from e
         self.body = []
+        self._version = 0
         state = self.state_generator.stack_declare(comments)
-        self.algo.add_state(state)
+        self.algo.add_state(state,version=self._version)
 
     def __len__(self):
         """Operator overload for len() function , returns size of stack.
@@ -188,8 +189,10 @@ class Stack(ARgorithmStructure):
             >>> st.push(4)
         """
         self.body.append(element)
-        state = self.state_generator.stack_push(self.body,element,comments)
-        self.algo.add_state(state)
+        self._version += 1
+        if self.algo.should_record("stack_push"):
+            state = self.state_generator.stack_push(self.body,element,comments)
+            self.algo.add_state(state,version=self._version)
 
     def pop(self,comments=""):
         """Pops element from stack top.
@@ -214,8 +217,10 @@ class Stack(ARgorithmStructure):
             raise ARgorithmError('Stack is empty')
         item = self.body[-1]
         self.body.pop()
-        state = self.state_generator.stack_pop(body=self.body,element=item, comments=comments)
-        self.algo.add_state(state)
+        self._version += 1
+        if self.algo.should_record("stack_pop"):
+            state = self.state_generator.stack_pop(body=self.body,element=item, comments=comments)
+            self.algo.add_state(state,version=self._version)
         return item
 
     def top(self,comments=""):
@@ -240,8 +245,10 @@ class Stack(ARgorithmStructure):
         if self.empty():
             raise ARgorithmError('Stack is empty')
         item = self.body[-1]
-        state = self.state_generator.stack_top(self.body,comments)
-        self.algo.add_state(state)
+        if self.algo.should_record("stack_top"):
+            body = self.algo.shared_body(self._id,self._version)
+            state = self.state_generator.stack_top(body or self.body,comments)
+            self.algo.add_state(state,version=self._version)
         return item
 
     def __str__(self):
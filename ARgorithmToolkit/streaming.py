@@ -0,0 +1,125 @@
+"""The streaming module provides the StreamingStateSet class, a drop-in
+replacement for ``ARgorithmToolkit.utils.StateSet`` that writes states to a
+file as newline-delimited JSON as soon as they are produced instead of holding
+the entire list of states in memory. The StreamingStateSet class can directly
+be imported from the ARgorithmToolkit library:
+
+    >>> algo = ARgorithmToolkit.StreamingStateSet("states.jsonl")
+    >>> algo = ARgorithmToolkit.streaming.StreamingStateSet("states.jsonl")
+"""
+import os
+import json
+from ARgorithmToolkit.utils import StateSet, ARgorithmError
+from ARgorithmToolkit.encoders import StateEncoder
+
+class StreamingStateSet(StateSet):
+    """The StreamingStateSet class is a StateSet that serializes each State to
+    a sink as it arrives. Only the states that have not yet been flushed are
+    kept in ``states`` , so memory stays bounded by ``buffer_size`` no matter
+    how long the ARgorithm runs.
+
+    Attributes:
+        sink (str or file-like): Path of the file to write to or any object with a ``write`` method
+        buffer_size (int, optional): Number of states buffered before they are written to sink. Defaults to 100.
+        delta (bool, optional): If True, state bodies are delta encoded. Defaults to False.
+        keyframe_interval (int, optional): Interval of full bodies in delta mode. Defaults to 50.
+        policy (RecordingPolicy or dict, optional): The policy deciding which states are recorded. Defaults to None.
+        recording (bool, optional): If False, the StateSet starts paused. Defaults to True.
+        limits (StateLimits or dict, optional): The limits on states recorded. Defaults to None.
+
+    Raises:
+        ARgorithmError: Raised if states are added after the StateSet is closed
+
+    Examples:
+        >>> with ARgorithmToolkit.StreamingStateSet("states.jsonl") as algo:
+        ...     arr = ARgorithmToolkit.Array("arr",algo,data=[3,2,1])
+        >>> states = list(ARgorithmToolkit.StreamingStateSet.load("states.jsonl"))
+    """
+    def __init__(self,sink,buffer_size=100,delta=False,keyframe_interval=50,policy=None,recording=None,limits=None):
+        super().__init__(delta=delta,keyframe_interval=keyframe_interval,policy=policy,recording=recording,limits=limits)
+        if isinstance(sink,(str,os.PathLike)):
+            self._sink = open(sink,'w',encoding="utf-8")
+            self._owned = True
+        else:
+            self._sink = sink
+            self._owned = False
+        self.buffer_size = buffer_size
+        self.closed = False
+
+    def add_state(self,state,version=None):
+        """Adds State to the buffer and writes the buffer to sink once it is
+        full.
+
+        Args:
+            state (ARgorithmToolkit.utils.State): The state that has to be added
+            version (int, optional): Number of mutations of the data structure the state belongs to. Defaults to None.
+
+        Raises:
+            ARgorithmError: Raised if StateSet is closed
+        """
+        if self.closed:
+            raise ARgorithmError("states cannot be added to closed StreamingStateSet")
+        super().add_state(state,version)
+        if len(self.states) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Writes all buffered states to sink."""
+        lines = [json.dumps(x.content,cls=StateEncoder) for x in self.states]
+        if lines:
+            self._sink.write("\n".join(lines)+"\n")
+        self.states.clear()
+        if hasattr(self._sink,'flush'):
+            self._sink.flush()
+
+    def close(self):
+        """Flushes the remaining states and closes the sink if it was opened
+        by the StateSet."""
+        if self.closed:
+            return
+        self.flush()
+        self.closed = True
+        if self._owned:
+            self._sink.close()
+
+    def __enter__(self):
+        """Allows StreamingStateSet to be used as a context manager."""
+        return self
+
+    def __exit__(self,*args):
+        """Closes the StreamingStateSet on leaving the context."""
+        self.close()
+
+    def body_at(self,index):
+        """Not supported as flushed states are not kept in memory.
+
+        Raises:
+            ARgorithmError: Raised always
+        """
+        raise ARgorithmError("StreamingStateSet does not keep states in memory, load the stream to access bodies")
+
+    def expand(self,index):
+        """Not supported as flushed states are not kept in memory.
+
+        Raises:
+            ARgorithmError: Raised always
+        """
+        raise ARgorithmError("StreamingStateSet does not keep states in memory, load the stream to access bodies")
+
+    @staticmethod
+    def load(source):
+        """Reads states written by a StreamingStateSet.
+
+        Args:
+            source (str or file-like): Path of the file or a readable file object
+
+        Yields:
+            dict: The state metadata
+        """
+        if isinstance(source,(str,os.PathLike)):
+            with open(source,'r',encoding="utf-8") as stream:
+                yield from StreamingStateSet.load(stream)
+            return
+        for line in source:
+            if line.strip():
+                yield json.loads(line)
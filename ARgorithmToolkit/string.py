@@ -156,10 +156,11 @@ class String(ARgorithmStructure, ARgorithmHashable):
         try:
             assert isinstance(body,str)
             self.body = body
+            self._version = 0
         except AssertionError as e:
             raise ARgorithmError("String body should be of type string") from e
         state = self.state_generator.string_declare(self.body,comments)
-        self.algo.add_state(state)
+        self.algo.add_state(state,version=self._version)
 
     def __len__(self):
         """The operator overload for len() function. Returns size of string.
@@ -197,8 +198,9 @@ class String(ARgorithmStructure, ARgorithmHashable):
         if isinstance(key,slice):
             name = f"{self.state_generator.name}_sub"
             return String(name , self.algo , self.body[key] , comments=f"creating new substring for {key}")
-        state = self.state_generator.string_iter(self.body,key,comments=f"accessing character at {key}")
-        self.algo.add_state(state)
+        if self.algo.should_record("string_iter"):
+            state = self.state_generator.string_iter(self.body,key,comments=f"accessing character at {key}")
+            self.algo.add_state(state,version=self._version)
         return self.body[key]
 
 
@@ -248,8 +250,10 @@ class String(ARgorithmStructure, ARgorithmHashable):
         if isinstance(value,String):
             value = value.body
         self.body += value
-        state = self.state_generator.string_append(self.body , value, comments)
-        self.algo.add_state(state)
+        self._version += 1
+        if self.algo.should_record("string_append"):
+            state = self.state_generator.string_append(self.body , value, comments)
+            self.algo.add_state(state,version=self._version)
 
     def __add__(self, value):
         """Operator overload for addition operation that work similar to append
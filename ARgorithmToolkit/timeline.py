@@ -0,0 +1,181 @@
+"""The timeline module provides the Timeline class, an index over the states of
+a StateSet that answers what a data structure looked like at any step of a run
+without replaying the states before it. The Timeline class can directly be
+imported from the ARgorithmToolkit library:
+
+    >>> timeline = ARgorithmToolkit.Timeline(algo)
+    >>> timeline = ARgorithmToolkit.timeline.Timeline(algo)
+
+The timeline keeps, for every data structure, the positions of its states in
+``StateSet.states``. Looking up a structure at a step is a binary search over
+these positions. In delta mode the body found this way may have to be rebuilt
+from deltas, so the timeline also keeps a full body of each changed structure
+every ``checkpoint_interval`` steps, which bounds the number of deltas applied
+by a lookup no matter how far apart the keyframes of the StateSet are.
+"""
+from bisect import bisect_right
+from ARgorithmToolkit.utils import StateSet, ARgorithmError
+from ARgorithmToolkit.streaming import StreamingStateSet
+from ARgorithmToolkit import delta
+
+def _key(structure):
+    """Returns the id used in states of a data structure given either the id
+    or the data structure."""
+    return structure if isinstance(structure,str) else str(id(structure))
+
+class Timeline:
+    """Index of the states of a StateSet by data structure. States already in
+    the StateSet are indexed on creation and states added later are indexed as
+    they arrive.
+
+    Attributes:
+        algo (ARgorithmToolkit.utils.StateSet): The StateSet to be indexed
+        checkpoint_interval (int, optional): Number of steps between checkpoints of full bodies. Defaults to 1000.
+        names (dict): Maps id of each data structure to its variable name
+
+    Raises:
+        ARgorithmError: Raised if algo is not a StateSet or is a StreamingStateSet
+
+    Example:
+        >>> algo = ARgorithmToolkit.StateSet(delta=True)
+        >>> timeline = ARgorithmToolkit.Timeline(algo)
+        >>> arr = ARgorithmToolkit.Array("arr",algo,data=[3,2,1])
+        >>> arr.swap(0,2)
+        >>> timeline.body_at(arr,0)
+        array([3, 2, 1])
+        >>> snapshot = timeline.snapshot_at(1)
+        >>> list(snapshot) == [str(id(arr))]
+        True
+        >>> {timeline.names[k] : v for k,v in snapshot.items()}
+        {'arr': array([1, 2, 3])}
+    """
+    def __init__(self,algo:StateSet,checkpoint_interval=1000):
+        if not isinstance(algo,StateSet):
+            raise ARgorithmError("Timeline needs a reference of StateSet to index")
+        if isinstance(algo,StreamingStateSet):
+            raise ARgorithmError("StreamingStateSet does not keep states in memory, load the stream to index it")
+        self.algo = algo
+        self.checkpoint_interval = checkpoint_interval
+        self.names = {}
+        self._positions = {}
+        self._checkpoints = {}
+        self._changed = set()
+        for index in range(len(algo.states)):
+            self.record(index)
+        algo.timeline = self
+
+    def record(self,index):
+        """Indexes the state at given position. Called by the StateSet for
+        every state added.
+
+        Args:
+            index (int): The index of state in states
+        """
+        state_def = self.algo.states[index].state_def
+        if isinstance(state_def,dict) and "id" in state_def:
+            _id = state_def["id"]
+            if _id not in self._positions:
+                self._positions[_id] = []
+                self.names[_id] = state_def.get("variable_name")
+            self._positions[_id].append(index)
+            self._changed.add(_id)
+        if (index+1) % self.checkpoint_interval == 0:
+            self._checkpoint()
+
+    def _checkpoint(self):
+        """Stores the full body of every structure that changed since the last
+        checkpoint and whose last state does not hold its full body."""
+        for _id in self._changed:
+            last = len(self._positions[_id])-1
+            state_def = self.algo.states[self._positions[_id][last]].state_def
+            if "body_delta" not in state_def:
+                continue
+            positions,bodies = self._checkpoints.setdefault(_id,([],[]))
+            bodies.append(self._body(_id,last))
+            positions.append(last)
+        self._changed.clear()
+
+    def _body(self,_id,last):
+        """Rebuilds the body of structure as of its state at position last of
+        its list of states."""
+        positions = self._positions[_id]
+        marks,bodies = self._checkpoints.get(_id,((),()))
+        mark = bisect_right(marks,last)-1
+        chain = []
+        body = None
+        for i in range(last,-1,-1):
+            if mark >= 0 and marks[mark] == i:
+                body = bodies[mark]
+                break
+            state_def = self.algo.states[positions[i]].state_def
+            if "body" in state_def:
+                body = state_def["body"]
+                break
+            if "body_delta" in state_def:
+                chain.append(state_def["body_delta"])
+            elif "value" in state_def and not chain:
+                return state_def["value"]
+        else:
+            return None
+        for delta_def in reversed(chain):
+            body = delta.patch(body,delta_def)
+        return body
+
+    def states_for(self,structure):
+        """Returns positions of the states of a data structure. The list is
+        the one kept by the index and must not be modified.
+
+        Args:
+            structure: The data structure or its id
+
+        Returns:
+            list: Indexes of states of the data structure in ``StateSet.states``
+        """
+        return self._positions.get(_key(structure),[])
+
+    def ids(self,name):
+        """Returns ids of data structures declared with given variable name.
+
+        Args:
+            name (str): The variable name
+
+        Returns:
+            list: The ids in order of declaration
+        """
+        return [_id for _id,x in self.names.items() if x == name]
+
+    def body_at(self,structure,step):
+        """Returns the body of a data structure as it was after the state at
+        given step. For variables their value is returned.
+
+        Args:
+            structure: The data structure or its id
+            step (int): The index of state in states
+
+        Returns:
+            The body, None if the data structure was not declared by that step
+        """
+        _id = _key(structure)
+        positions = self._positions.get(_id)
+        if positions is None:
+            return None
+        last = bisect_right(positions,step)-1
+        if last < 0:
+            return None
+        return self._body(_id,last)
+
+    def snapshot_at(self,step):
+        """Returns the bodies of all data structures as they were after the
+        state at given step.
+
+        Args:
+            step (int): The index of state in states
+
+        Returns:
+            dict: Maps the id of every data structure declared by that step to its body
+        """
+        snapshot = {}
+        for _id,positions in self._positions.items():
+            if positions[0] <= step:
+                snapshot[_id] = self._body(_id,bisect_right(positions,step)-1)
+        return snapshot
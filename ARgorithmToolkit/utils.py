@@ -7,6 +7,20 @@ Both work:
     >>> algo = ARgorithmToolkit.utils.StateSet()
     >>> algo = ARgorithmToolkit.StateSet()
 """
+import sys
+import time
+from itertools import islice
+from contextlib import contextmanager
+from collections.abc import Mapping, Sequence, Set as AbstractSet
+from ARgorithmToolkit import delta
+from ARgorithmToolkit.persistent import PersistentMap, PersistentSet
+
+__all__ = [
+    "ARgorithmError", "ARgorithmLimitError", "ARgorithmClientError", "State",
+    "RecordingPolicy", "estimate_size", "StateLimits", "stateset_defaults",
+    "SharedBody", "state_body", "StateSet", "ARgorithmHashable",
+    "ARgorithmStructure", "Variable",
+]
 
 class ARgorithmError(Exception):
     """The error class for ARgorithmToolkit.
@@ -26,6 +40,11 @@ class ARgorithmError(Exception):
             return f'{self.message}'
         return "There's an error within ARgorithm"
 
+class ARgorithmLimitError(ARgorithmError):
+    """The error class raised when an ARgorithm exceeds a limit set on its
+    execution, like the time it may take or the number of states it may
+    generate."""
+
 class ARgorithmClientError(Exception):
     """The error class for programmers to use in their ARgorithm.
 
@@ -45,6 +64,8 @@ class ARgorithmClientError(Exception):
             return f'{self.message}'
         return "User has entered faulty data"
 
+_MISSING = object()
+
 class State:
     """The Instance of State class can be considered as an event in the
     sequential order of events that get played out in Augmented Reality Each
@@ -52,20 +73,326 @@ class State:
 
     For example , ARgorithmToolkit.array.Array has
     ARgorithmToolkit.array.ArrayState
+
+    States are created in very large numbers so the class stores its three
+    fields in slots and only builds the ``content`` dictionary when it is
+    accessed.
+
+    Attributes:
+        state_type (str): The type of state
+        state_def (dict): The metadata of the state
+        comments (str): Comments for descriptive purpose
     """
-    def __init__(self,**kwargs):
-        self.content = {}
-        for x in ['state_type','state_def','comments']:
-            try:
-                self.content[x] = kwargs[x]
-            except KeyError as e:
-                raise ARgorithmError(f"{x} should be present in State arguments") from e
+    __slots__ = ('state_type','state_def','comments')
+
+    def __init__(self,state_type=_MISSING,state_def=_MISSING,comments=_MISSING):
+        if state_type is _MISSING:
+            raise ARgorithmError("state_type should be present in State arguments")
+        if state_def is _MISSING:
+            raise ARgorithmError("state_def should be present in State arguments")
+        if comments is _MISSING:
+            raise ARgorithmError("comments should be present in State arguments")
+        self.state_type = sys.intern(state_type)
+        self.state_def = state_def
+        self.comments = comments
+
+    @property
+    def content(self):
+        """dict: The state as a dictionary with ``state_type``, ``state_def``
+        and ``comments`` keys."""
+        return {
+            "state_type" : self.state_type,
+            "state_def" : self.state_def,
+            "comments" : self.comments
+        }
+
+    @content.setter
+    def content(self,value):
+        self.state_type = value["state_type"]
+        self.state_def = value["state_def"]
+        self.comments = value["comments"]
 
     def __str__(self):
         data = str(self.content)
         return data
 
 
+class RecordingPolicy:
+    """Decides which states are recorded by a StateSet. Data structures ask
+    the StateSet before building a state, so the work of creating states that
+    are dropped is skipped entirely.
+
+    States whose type ends with ``_declare`` are always recorded as the other
+    states of a data structure cannot be rendered without them.
+
+    Attributes:
+        every (int or dict, optional): Record only every k-th state of a state type. A dictionary maps state types to k. Defaults to None.
+        cap (int or dict, optional): Maximum number of states recorded for a state type. A dictionary maps state types to their cap. Defaults to None.
+        time_budget (float, optional): Seconds after the first recorded state beyond which states are dropped. Defaults to None.
+        keep_only (list, optional): If given, only states of these types are recorded. Defaults to None.
+
+    Examples:
+        >>> policy = ARgorithmToolkit.RecordingPolicy(every={"array_iter" : 10},cap=1000)
+        >>> algo = ARgorithmToolkit.StateSet(policy=policy)
+
+        The policy can also be given as a dictionary with the same keys, the
+        way it is declared in the ``policy`` key of ``.config.json``
+
+        >>> algo = ARgorithmToolkit.StateSet(policy={"keep_only" : ["array_swap"]})
+    """
+    def __init__(self,every=None,cap=None,time_budget=None,keep_only=None):
+        self.every = every
+        self.cap = cap
+        self.time_budget = time_budget
+        self.keep_only = None if keep_only is None else set(keep_only)
+        self.seen = {}
+        self.recorded = {}
+        self._start = None
+
+    @staticmethod
+    def _limit(value,state_type):
+        """Returns the limit that applies to a state type."""
+        if isinstance(value,dict):
+            return value.get(state_type)
+        return value
+
+    def allow(self,state_type):
+        """Checks whether the next state of a state type should be recorded
+        and counts it.
+
+        Args:
+            state_type (str): The type of state
+
+        Returns:
+            bool: True if the state should be recorded
+        """
+        if state_type.endswith("_declare"):
+            return True
+        if self.keep_only is not None and state_type not in self.keep_only:
+            return False
+        if self.time_budget is not None:
+            now = time.perf_counter()
+            if self._start is None:
+                self._start = now
+            elif now - self._start > self.time_budget:
+                return False
+        seen = self.seen.get(state_type,0)
+        self.seen[state_type] = seen + 1
+        every = self._limit(self.every,state_type)
+        if every and seen % every:
+            return False
+        recorded = self.recorded.get(state_type,0)
+        cap = self._limit(self.cap,state_type)
+        if cap is not None and recorded >= cap:
+            return False
+        self.recorded[state_type] = recorded + 1
+        return True
+
+_SAMPLE = 32
+_STATE_OVERHEAD = 64
+_REF_SIZE = 16
+_SCALAR_SIZES = {int : 8, float : 8, bool : 5, type(None) : 5}
+
+def estimate_size(value):
+    """Estimates the size of value once serialized to JSON without
+    serializing it. Numbers count as 8 bytes, numpy arrays by their number of
+    elements and collections larger than 32 elements from a sample of their
+    first elements, so the cost of an estimate does not grow with the size of
+    the value. Bodies of Map and Set are sampled by walking their trie.
+
+    Args:
+        value: The value to estimate
+
+    Returns:
+        int: The estimated number of bytes
+
+    Example:
+        >>> ARgorithmToolkit.estimate_size([1,2,"abc"])
+        26
+    """
+    cls = type(value)
+    if cls is str:
+        return len(value) + 2
+    if cls in _SCALAR_SIZES:
+        return _SCALAR_SIZES[cls]
+    if cls is list or cls is tuple:
+        return _estimate_items(islice(value,_SAMPLE),len(value))
+    if cls is PersistentMap:
+        return _estimate_pairs(islice(value.walk(),_SAMPLE),len(value))
+    if cls is PersistentSet:
+        return _estimate_items(islice(value.walk(),_SAMPLE),len(value))
+    np = sys.modules.get("numpy")
+    if np is not None:
+        if isinstance(value,np.number):
+            return 8
+        if isinstance(value,np.ndarray):
+            if value.dtype.kind in "biuf":
+                return value.size * 8 + 2
+            return _estimate_items(value.flat[:_SAMPLE],value.size)
+    if isinstance(value,(int,float)):
+        return 8
+    if isinstance(value,Mapping):
+        return _estimate_pairs(islice(value.items(),_SAMPLE),len(value))
+    if isinstance(value,(Sequence,AbstractSet)):
+        return _estimate_items(islice(value,_SAMPLE),len(value))
+    return _REF_SIZE
+
+def _estimate_items(sample,size):
+    """Estimates a collection of given size from a sample of its items."""
+    total = 0
+    count = 0
+    for item in sample:
+        total += estimate_size(item) + 1
+        count += 1
+    if count < size:
+        total = total * size // count
+    return total + 2
+
+def _estimate_pairs(sample,size):
+    """Estimates a mapping of given size from a sample of its key value
+    pairs."""
+    total = 0
+    count = 0
+    for key,item in sample:
+        total += estimate_size(key) + estimate_size(item) + 5
+        count += 1
+    if count < size:
+        total = total * size // count
+    return total + 2
+
+class StateLimits:
+    """Hard limits on the states recorded by a StateSet. A state that would
+    exceed a limit raises ``ARgorithmLimitError`` before it is added, so a
+    runaway ARgorithm stops instead of exhausting the memory of the host.
+
+    Sizes are estimated with ``estimate_size`` as states are added and kept as
+    a running total. Bodies stored as deltas count the size of the delta.
+    Bodies shared with the previous state of the same data structure count as
+    a reference only if ``shared_bodies`` is set, as the default ``json``
+    format writes every body in full.
+
+    Attributes:
+        max_states (int, optional): Maximum number of states. Defaults to None.
+        max_bytes (int, optional): Maximum estimated serialized size of all states. Defaults to None.
+        max_body_bytes (int, optional): Maximum estimated serialized size of the body of a data structure. Defaults to None.
+        shared_bodies (bool, optional): If True, bodies shared with the previous state count as a reference, for formats that write them once like ``json_refs`` and ``binary``. Defaults to False.
+        states (int): Number of states added
+        bytes (int): Estimated serialized size of the states added
+
+    Examples:
+        >>> limits = ARgorithmToolkit.StateLimits(max_states=10000,max_bytes=64*2**20)
+        >>> algo = ARgorithmToolkit.StateSet(limits=limits)
+
+        The limits can also be given as a dictionary with the same keys, the
+        way they are declared in the ``limits`` key of ``.config.json``
+
+        >>> algo = ARgorithmToolkit.StateSet(limits={"max_states" : 10000})
+    """
+    def __init__(self,max_states=None,max_bytes=None,max_body_bytes=None,shared_bodies=False):
+        self.max_states = max_states
+        self.max_bytes = max_bytes
+        self.max_body_bytes = max_body_bytes
+        self.shared_bodies = shared_bodies
+        self.states = 0
+        self.bytes = 0
+        self._last = {}
+
+    def add(self,state,body=None):
+        """Accounts for a state about to be added.
+
+        Args:
+            state (ARgorithmToolkit.utils.State): The state, after its body is delta encoded
+            body (optional): The full body of the state before it was delta encoded. Defaults to None.
+
+        Raises:
+            ARgorithmLimitError: Raised if the state exceeds a limit
+        """
+        if self.max_states is not None and self.states >= self.max_states:
+            raise ARgorithmLimitError(f"ARgorithm exceeded limit of {self.max_states} states")
+        size = _STATE_OVERHEAD + len(state.state_type) + estimate_size(state.comments)
+        state_def = state.state_def
+        if isinstance(state_def,dict):
+            for key,value in state_def.items():
+                if key != "body" and key != "body_delta":
+                    size += len(key) + 2 + (_SCALAR_SIZES.get(type(value)) or estimate_size(value))
+            if body is not None and "id" in state_def:
+                if self.shared_bodies and body is self._last.get(state_def["id"]):
+                    body_size = _REF_SIZE
+                else:
+                    body_size = estimate_size(body)
+                    if self.max_body_bytes is not None and body_size > self.max_body_bytes:
+                        raise ARgorithmLimitError(
+                            f"body of {state_def.get('variable_name',state_def['id'])} exceeded limit of {self.max_body_bytes} bytes"
+                        )
+                    self._last[state_def["id"]] = body
+                if "body_delta" in state_def:
+                    body_size = estimate_size(state_def["body_delta"])
+                size += body_size
+        else:
+            size += estimate_size(state_def)
+        if self.max_bytes is not None and self.bytes + size > self.max_bytes:
+            raise ARgorithmLimitError(f"ARgorithm exceeded limit of {self.max_bytes} bytes of states")
+        self.states += 1
+        self.bytes += size
+
+_DEFAULTS = {"policy" : None, "recording" : True, "limits" : None}
+
+@contextmanager
+def stateset_defaults(**options):
+    """Context manager that sets default arguments for every StateSet created
+    inside it. Used by the server to enforce the policy and limits declared in
+    the config of an ARgorithm and to run ARgorithms without recording states.
+
+    Args:
+        policy (dict, optional): Keyword arguments of ``RecordingPolicy`` , None for no policy
+        recording (bool, optional): If False, StateSets start paused
+        limits (dict, optional): Keyword arguments of ``StateLimits`` , None for no limits
+
+    Raises:
+        ARgorithmError: Raised if an option is not a StateSet default
+
+    Example:
+        >>> with ARgorithmToolkit.stateset_defaults(policy={"cap" : 1000}):
+        ...     algo = run(**parameters)
+    """
+    for key in options:
+        if key not in _DEFAULTS:
+            raise ARgorithmError(f"{key} is not a StateSet default")
+    previous = dict(_DEFAULTS)
+    _DEFAULTS.update(options)
+    try:
+        yield
+    finally:
+        _DEFAULTS.update(previous)
+
+class SharedBody:
+    """The body recorded for a data structure at its current version. Data
+    structures pass it to their state generator in place of their contents,
+    so that read-only states reuse the recorded body instead of copying the
+    contents again.
+
+    Attributes:
+        body: The recorded body
+    """
+    __slots__ = ('body',)
+
+    def __init__(self,body):
+        self.body = body
+
+def state_body(body,copy=None):
+    """Returns the body a state generator stores in its state.
+
+    Args:
+        body: The contents of the data structure or a SharedBody
+        copy (callable, optional): Function copying the contents. Defaults to None which stores the contents as they are.
+
+    Returns:
+        The recorded body if body is a SharedBody, otherwise the copied contents
+    """
+    if isinstance(body,SharedBody):
+        return body.body
+    return body if copy is None else copy(body)
+
 class StateSet:
     """The most important class in the entire toolkit. An object of this class
     has to exist in every algorithm. That object of StateSet is what should
@@ -75,27 +402,233 @@ class StateSet:
 
     Attributes:
         states (list): This is list of State objects that is sequentially rendered in Augmented Reality.
+        count (int): Number of states added to the StateSet.
+        delta (bool, optional): If True, state bodies are stored as differences from the previous body of the same data structure. Defaults to False.
+        keyframe_interval (int, optional): In delta mode, every ``keyframe_interval``-th state of a data structure stores its full body. Defaults to 50.
+        policy (RecordingPolicy or dict, optional): The policy deciding which states are recorded. Defaults to None which records all states.
+        recording (bool, optional): If False, no states other than declarations are recorded until recording is turned back on. Defaults to True.
+        limits (StateLimits or dict, optional): The limits on states recorded. Defaults to None which sets no limits.
+        timeline (ARgorithmToolkit.timeline.Timeline): The index of states by data structure, None until a Timeline is created for the StateSet.
 
     Examples:
         >>> algo = ARgorithmToolkit.StateSet()
+        >>> algo = ARgorithmToolkit.StateSet(delta=True)
     """
-    def __init__(self):
+    def __init__(self,delta=False,keyframe_interval=50,policy=None,recording=None,limits=None):
         self.states = []
+        self.delta = delta
+        self.keyframe_interval = keyframe_interval
+        self.count = 0
+        self._last_bodies = {}
+        self._bodies = {}
+        if policy is None:
+            policy = _DEFAULTS["policy"]
+        if isinstance(policy,dict):
+            policy = RecordingPolicy(**policy)
+        self.policy = policy
+        self.recording = _DEFAULTS["recording"] if recording is None else recording
+        if limits is None:
+            limits = _DEFAULTS["limits"]
+        if isinstance(limits,dict):
+            limits = StateLimits(**limits)
+        self.limits = limits
+        self.timeline = None
+
+    def should_record(self,state_type):
+        """Checks whether a state of given type should be recorded. Data
+        structures call this before building a state.
 
-    def add_state(self,state):
+        Args:
+            state_type (str): The type of state
+
+        Returns:
+            bool: True if the state should be built and added
+
+        Example:
+            >>> if algo.should_record("array_iter"):
+            ...     algo.add_state(state_generator.array_iter(body,index))
+        """
+        if not self.recording:
+            return False
+        return self.policy is None or self.policy.allow(state_type)
+
+    @contextmanager
+    def paused(self):
+        """Context manager that stops recording states inside it. Data
+        structures skip building states entirely, so paused sections run close
+        to the speed of plain python. States of data structures declared
+        inside are still recorded.
+
+        Example:
+            >>> arr = ARgorithmToolkit.Array("arr",algo,data=[3,2,1])
+            >>> with algo.paused():
+            ...     arr.swap(0,2)
+            >>> algo.states[-1].state_type
+            'array_declare'
+        """
+        previous = self.recording
+        self.recording = False
+        try:
+            yield self
+        finally:
+            self.recording = previous
+
+    def add_state(self,state,version=None):
         """This method adds State to the list of states.
 
+        Data structures that count their mutations pass the count as version.
+        If the data structure did not change since its last recorded state,
+        the body of the new state is replaced by the body of that state so
+        that read-only states store a reference instead of another copy. Data
+        structures that copy their contents into states check
+        ``shared_body`` first to skip building the copy.
+
         Args:
             state (ARgorithmToolkit.utils.State): The state that has to be added
+            version (int, optional): Number of mutations of the data structure the state belongs to. Defaults to None.
 
         Raises:
             ARgorithmError: Raised if state is not of type State
+            ARgorithmLimitError: Raised if the state exceeds the limits of the StateSet
 
         Example:
             >>> algo.add_state(state)
         """
         assert isinstance(state,State) , ARgorithmError("state should be of Type state")
+        if version is not None:
+            self._share_body(state,version)
+        body = None
+        if self.limits is not None and isinstance(state.state_def,dict):
+            body = state.state_def.get("body")
+        if self.delta:
+            self._encode_delta(state)
+        if self.limits is not None:
+            self.limits.add(state,body)
         self.states.append(state)
+        self.count += 1
+        if self.timeline is not None:
+            self.timeline.record(len(self.states)-1)
+
+    def shared_body(self,_id,version):
+        """Returns the body last recorded for a data structure if it was
+        recorded at given version. Data structures check it before building a
+        read-only state, so an unchanged body is not copied only to be
+        replaced by ``add_state`` .
+
+        Args:
+            _id (str): The id of the data structure
+            version (int): Number of mutations of the data structure
+
+        Returns:
+            SharedBody: The recorded body, None if the data structure changed since
+
+        Example:
+            >>> body = algo.shared_body(stack._id,stack._version)
+            >>> state = stack.state_generator.stack_top(body or stack.body)
+        """
+        last = self._bodies.get(_id)
+        if last is not None and last[0] == version:
+            return SharedBody(last[1])
+        return None
+
+    def _share_body(self,state,version):
+        """Replaces the body of state with the last body recorded for the same
+        data structure if it was recorded at the same version."""
+        state_def = state.state_def
+        if not isinstance(state_def,dict) or "body" not in state_def or "id" not in state_def:
+            return
+        last = self._bodies.get(state_def["id"])
+        if last is not None and last[0] == version:
+            state_def["body"] = last[1]
+        else:
+            self._bodies[state_def["id"]] = (version,state_def["body"])
+
+    def _encode_delta(self,state):
+        """Replaces the body of state with a delta from the last body recorded
+        for the same data structure, unless a keyframe is due."""
+        state_def = state.state_def
+        if not isinstance(state_def,dict) or "body" not in state_def or "id" not in state_def:
+            return
+        body = state_def["body"]
+        last = self._last_bodies.get(state_def["id"])
+        index = self.count
+        if last is not None and last[2] < self.keyframe_interval:
+            delta_def = delta.diff(last[0],body)
+            if delta_def is not None:
+                delta_def["base"] = last[1]
+                del state_def["body"]
+                state_def["body_delta"] = delta_def
+                self._last_bodies[state_def["id"]] = (body,index,last[2]+1)
+                return
+        self._last_bodies[state_def["id"]] = (body,index,1)
+
+    def body_at(self,index):
+        """Reconstructs the full body of the state at given index. Works for
+        both full snapshots and delta encoded states.
+
+        Args:
+            index (int): The index of state in states
+
+        Returns:
+            The body of the data structure at that state, None if the state has no body
+
+        Example:
+            >>> algo = ARgorithmToolkit.StateSet(delta=True)
+            >>> vec = ARgorithmToolkit.Vector("vec",algo,[1,2,3])
+            >>> vec[1] = 5
+            >>> algo.body_at(1)
+            [1, 5, 3]
+        """
+        state_def = self.states[index].state_def
+        if not isinstance(state_def,dict):
+            return None
+        if "body" in state_def:
+            return state_def["body"]
+        if "body_delta" not in state_def:
+            return None
+        chain = []
+        while "body" not in state_def:
+            chain.append(state_def["body_delta"])
+            state_def = self.states[state_def["body_delta"]["base"]].state_def
+        body = state_def["body"]
+        for delta_def in reversed(chain):
+            body = delta.patch(body,delta_def)
+        return body
+
+    def expand(self,index):
+        """Returns the content of state at given index with the full body
+        reconstructed.
+
+        Args:
+            index (int): The index of state in states
+
+        Returns:
+            dict: The state metadata with ``body`` in place of ``body_delta``
+        """
+        content = dict(self.states[index].content)
+        state_def = content["state_def"]
+        if isinstance(state_def,dict) and "body_delta" in state_def:
+            state_def = {k:v for k,v in state_def.items() if k != "body_delta"}
+            state_def["body"] = self.body_at(index)
+            content["state_def"] = state_def
+        return content
+
+    def dumps(self,fmt="json"):
+        """Serializes the states using the serializer registered for the
+        format in ``ARgorithmToolkit.serializers``.
+
+        Args:
+            fmt (str, optional): "json", "json_refs", "binary" or the name of a registered serializer. Defaults to "json".
+
+        Returns:
+            bytes: The serialized states
+
+        Example:
+            >>> data = algo.dumps("binary")
+            >>> states = ARgorithmToolkit.serializers.loads(data)
+        """
+        from ARgorithmToolkit.serializers import dumps # pylint: disable=import-outside-toplevel
+        return dumps(self.states,fmt)
 
     def __str__(self):
         """String representation of StateSet.
@@ -113,6 +646,8 @@ class StateSet:
         Args:
             comments (str): Comments for descriptive purpose
         """
+        if not self.should_record("comment"):
+            return
         comment_state = State(
             state_type="comment",
             state_def=None,
@@ -182,6 +717,8 @@ class Variable(ARgorithmStructure, ARgorithmHashable):
             last_value = self.value
         self.__dict__[key] = value
         if(key == 'value' and self.__flag):
+            if not self.algo.should_record("variable_highlight"):
+                return
             state_type = "variable_highlight"
             state_def = {
                 "id" : self._id,
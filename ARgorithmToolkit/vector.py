@@ -129,6 +129,85 @@ class VectorState:
             comments=comments
         )
 
+    def vector_extend(self,body,elements,comments=""):
+        """Generates the `vector_extend` state when multiple elements are added
+        to the end of vector.
+
+        Args:
+            body (list): The contents of the vector that are to be sent along with the state
+            elements (list): The elements that were added
+            comments (str, optional): Comments for descriptive purpose. Defaults to "".
+
+        Returns:
+            ARgorithmToolkit.utils.State: returns the ``vector_extend`` state for the respective vector mentioned
+        """
+        state_type = "vector_extend"
+        state_def = {
+            "id" : self._id,
+            "variable_name" : self.name,
+            "body" : list(body),
+            "elements" : list(elements)
+        }
+        return State(
+            state_type=state_type,
+            state_def=state_def,
+            comments=comments
+        )
+
+    def vector_insert_many(self,body,elements,index,comments=""):
+        """Generates the `vector_insert_many` state when multiple elements are
+        inserted at particular index of vector.
+
+        Args:
+            body (list): The contents of the vector that are to be sent along with the state
+            elements (list): The elements that were inserted
+            index (int): The index of vector at which the first element was inserted
+            comments (str, optional): Comments for descriptive purpose. Defaults to "".
+
+        Returns:
+            ARgorithmToolkit.utils.State: returns the ``vector_insert_many`` state for the respective vector mentioned
+        """
+        state_type = "vector_insert_many"
+        state_def = {
+            "id" : self._id,
+            "variable_name" : self.name,
+            "body" : list(body),
+            "elements" : list(elements),
+            "index" : index
+        }
+        return State(
+            state_type=state_type,
+            state_def=state_def,
+            comments=comments
+        )
+
+    def vector_remove_range(self,body,start,stop,comments=""):
+        """Generates the `vector_remove_range` state when elements in a range
+        of indexes are removed from vector.
+
+        Args:
+            body (list): The contents of the vector that are to be sent along with the state
+            start (int): The index of first element that was removed
+            stop (int): The index after the last element that was removed
+            comments (str, optional): Comments for descriptive purpose. Defaults to "".
+
+        Returns:
+            ARgorithmToolkit.utils.State: returns the ``vector_remove_range`` state for the respective vector mentioned
+        """
+        state_type = "vector_remove_range"
+        state_def = {
+            "id" : self._id,
+            "variable_name" : self.name,
+            "body" : list(body),
+            "start" : start,
+            "stop" : stop
+        }
+        return State(
+            state_type=state_type,
+            state_def=state_def,
+            comments=comments
+        )
+
     def vector_swap(self,body,indexes,comments=""):
         """Generates the ``vector_swap`` state when values at two indexes of
         vector are being swapped.
@@ -281,8 +360,9 @@ class Vector(ARgorithmStructure):
         if isinstance(key,slice):
             name = f"{self.state_generator.name}_sub"
             return Vector(name , self.algo , self.body[key] , comments)
-        state = self.state_generator.vector_iter(body=self.body,index=key,comments=comments)
-        self.algo.add_state(state)
+        if self.algo.should_record("vector_iter"):
+            state = self.state_generator.vector_iter(body=self.body,index=key,comments=comments)
+            self.algo.add_state(state)
         return self.body[key]
 
     def __setitem__(self, key, value):
@@ -302,9 +382,10 @@ class Vector(ARgorithmStructure):
         """
         last_value = self.body[key]
         self.body[key] = value
-        state = self.state_generator.vector_iter(body=self.body,index=key,value=value,last_value=last_value,\
-            comments=f'Writing {value} at index {key}')
-        self.algo.add_state(state)
+        if self.algo.should_record("vector_iter"):
+            state = self.state_generator.vector_iter(body=self.body,index=key,value=value,last_value=last_value,\
+                comments=f'Writing {value} at index {key}')
+            self.algo.add_state(state)
 
     def __iter__(self):
         """Returns the generator object to iterate through elements of Vector.
@@ -342,12 +423,15 @@ class Vector(ARgorithmStructure):
         """
         if index is None:
             self.body.append(value)
-            state = self.state_generator.vector_insert(self.body , value , len(self)-1 , comments)
-            self.algo.add_state(state)
+            if self.algo.should_record("vector_insert"):
+                state = self.state_generator.vector_insert(self.body , value , len(self)-1 , comments)
+                self.algo.add_state(state)
         elif index >= 0:
-            self.body = self.body[:index] + [value] + self.body[index:]
-            state = self.state_generator.vector_insert(self.body , value , index , comments)
-            self.algo.add_state(state)
+            index = min(index,len(self))
+            self.body.insert(index,value)
+            if self.algo.should_record("vector_insert"):
+                state = self.state_generator.vector_insert(self.body , value , index , comments)
+                self.algo.add_state(state)
 
     def remove(self,value=None,index=None,comments=""):
         """Removes element from vector.If value is given then first instance of
@@ -381,20 +465,96 @@ class Vector(ARgorithmStructure):
         """
         if index is None and value is None:
             self.body.pop()
-            state = self.state_generator.vector_remove(self.body,len(self)-1,comments)
-            self.algo.add_state(state)
+            if self.algo.should_record("vector_remove"):
+                state = self.state_generator.vector_remove(self.body,len(self)-1,comments)
+                self.algo.add_state(state)
         elif value is None and 0 <= index < len(self):
-            self.body = self.body[0:index] + self.body[index+1:]
-            state = self.state_generator.vector_remove(self.body,index,comments)
-            self.algo.add_state(state)
+            del self.body[index]
+            if self.algo.should_record("vector_remove"):
+                state = self.state_generator.vector_remove(self.body,index,comments)
+                self.algo.add_state(state)
         elif index is None:
             index = self.body.index(value)
             self.body.remove(value)
-            state = self.state_generator.vector_remove(self.body,index,comments)
-            self.algo.add_state(state)
+            if self.algo.should_record("vector_remove"):
+                state = self.state_generator.vector_remove(self.body,index,comments)
+                self.algo.add_state(state)
         else:
             raise ARgorithmError("Either give only a valid index or only value to be deleted , dont give both")
 
+    def extend(self,values,comments=""):
+        """Adds multiple elements to the end of vector with a single state.
+
+        Args:
+            values (iterable): The values to be added
+            comments (str, optional): Comments for descriptive purpose. Defaults to "".
+
+        Example:
+            >>> vec
+            Vector([1, 2])
+            >>> vec.extend([3, 4])
+            >>> vec
+            Vector([1, 2, 3, 4])
+        """
+        values = list(values)
+        self.body.extend(values)
+        if self.algo.should_record("vector_extend"):
+            state = self.state_generator.vector_extend(self.body,values,comments)
+            self.algo.add_state(state)
+
+    def insert_many(self,values,index,comments=""):
+        """Inserts multiple elements starting at particular index with a single
+        state.
+
+        Args:
+            values (iterable): The values to be inserted
+            index (int): The index where the first value is to be inserted
+            comments (str, optional): Comments for descriptive purpose. Defaults to "".
+
+        Raises:
+            ARgorithmError: Raised if index is out of range
+
+        Example:
+            >>> vec
+            Vector([1, 4])
+            >>> vec.insert_many([2, 3],1)
+            >>> vec
+            Vector([1, 2, 3, 4])
+        """
+        if not 0 <= index <= len(self):
+            raise ARgorithmError("index out of range")
+        values = list(values)
+        self.body[index:index] = values
+        if self.algo.should_record("vector_insert_many"):
+            state = self.state_generator.vector_insert_many(self.body,values,index,comments)
+            self.algo.add_state(state)
+
+    def remove_range(self,start,stop,comments=""):
+        """Removes elements from index start up to but not including index
+        stop with a single state.
+
+        Args:
+            start (int): The index of first element to be removed
+            stop (int): The index after the last element to be removed
+            comments (str, optional): Comments for descriptive purpose. Defaults to "".
+
+        Raises:
+            ARgorithmError: Raised if range is invalid
+
+        Example:
+            >>> vec
+            Vector([1, 2, 3, 4])
+            >>> vec.remove_range(1,3)
+            >>> vec
+            Vector([1, 4])
+        """
+        if not 0 <= start <= stop <= len(self):
+            raise ARgorithmError("invalid range")
+        del self.body[start:stop]
+        if self.algo.should_record("vector_remove_range"):
+            state = self.state_generator.vector_remove_range(self.body,start,stop,comments)
+            self.algo.add_state(state)
+
     def compare(self,index1,index2,func=None,comments=""):
         """compares elements at 2 indexes of vector.
 
@@ -415,8 +575,9 @@ class Vector(ARgorithmStructure):
         """
         item1 = self.body[index1]
         item2 = self.body[index2]
-        state = self.state_generator.vector_compare(self.body,(index1,index2),comments)
-        self.algo.add_state(state)
+        if self.algo.should_record("vector_compare"):
+            state = self.state_generator.vector_compare(self.body,(index1,index2),comments)
+            self.algo.add_state(state)
         if func is None:
             def default_comparator(item1, item2):
                 return item1-item2
@@ -441,8 +602,9 @@ class Vector(ARgorithmStructure):
         temp = self.body[index1]
         self.body[index1] = self.body[index2]
         self.body[index2] = temp
-        state = self.state_generator.vector_swap(self.body,(index1,index2),comments)
-        self.algo.add_state(state)
+        if self.algo.should_record("vector_swap"):
+            state = self.state_generator.vector_swap(self.body,(index1,index2),comments)
+            self.algo.add_state(state)
 
     def __str__(self):
         """Returns string representation of vector.
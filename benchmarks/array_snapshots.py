@@ -0,0 +1,42 @@
+"""Benchmark for Array state bodies.
+
+Walks every element of an N x N Array and compares the snapshot bodies stored
+in states against converting the array to nested lists on every access, which
+is what ArrayState did before snapshots.
+"""
+import time
+import tracemalloc
+import ARgorithmToolkit
+
+class ListArrayState(ARgorithmToolkit.array.ArrayState):
+    """ArrayState that converts the body to lists for every state."""
+    def array_iter(self,body,index,value=None,last_value=None,comments=""):
+        return super().array_iter(body.tolist(),index,value,last_value,comments)
+
+def walk(n,tolist):
+    """Reads every element of an n x n array and returns the StateSet."""
+    algo = ARgorithmToolkit.StateSet()
+    arr = ARgorithmToolkit.Array("arr",algo,shape=(n,n),fill=7)
+    if tolist:
+        arr.state_generator = ListArrayState(arr.state_generator.name,arr.state_generator._id)
+    for i in range(n):
+        for j in range(n):
+            arr[i,j] # pylint: disable=pointless-statement
+    return algo
+
+def run():
+    """Runs the benchmark and prints a table."""
+    print(f"{'n':>6}{'bodies':>10}{'us/access':>12}{'bytes/access':>14}")
+    for n in [25,50,100]:
+        for name,tolist in [("list",True),("snapshot",False)]:
+            tracemalloc.start()
+            start = time.perf_counter()
+            algo = walk(n,tolist)
+            seconds = time.perf_counter()-start
+            size,_ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del algo
+            print(f"{n:>6}{name:>10}{seconds/n**2*1e6:>12.2f}{size/n**2:>14.0f}")
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,82 @@
+"""Benchmark for looking up argorithms on the server.
+
+Runs lookups of argorithmIDs against a local stub server with a fixed latency,
+once by requesting each argorithm from the server and once from the catalogue
+cached in CACHE_DIR, and times completion of argorithmID prefixes from a
+catalogue of 10000 argorithms in a new process, the way shell completion runs.
+"""
+import os
+import sys
+import json
+import time
+import tempfile
+import threading
+import subprocess
+import contextlib
+from types import SimpleNamespace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from ARgorithmToolkit import cli
+
+LATENCY = 0.05
+LOOKUPS = 20
+SIZE = 10000
+ITEMS = [
+    {"argorithmID" : f"argorithm_{i}", "maintainer" : "test", "description" : "", "parameters" : {}, "example" : {}}
+    for i in range(SIZE)
+]
+
+class Stub(BaseHTTPRequestHandler):
+    """Answers list and view requests after LATENCY seconds."""
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self): # pylint: disable=invalid-name
+        """Sends catalogue or one argorithm."""
+        time.sleep(LATENCY)
+        if self.path == "/argorithms/list":
+            body = json.dumps(ITEMS).encode()
+        else:
+            body = json.dumps(ITEMS[int(self.path.rsplit("_",1)[1])]).encode()
+        self.send_response(200)
+        self.send_header("ETag",'"v1"')
+        self.send_header("Content-Length",str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self,*args): # pylint: disable=arguments-differ
+        pass
+
+COMPLETE = """
+import time
+start = time.perf_counter()
+from ARgorithmToolkit import cli
+cli.CACHE_DIR = {directory!r}
+ids = cli.autocomplete_id("argorithm_12")
+print(len(ids),time.perf_counter()-start)
+"""
+
+def run():
+    """Runs the benchmark and prints a table."""
+    server = ThreadingHTTPServer(("127.0.0.1",0),Stub)
+    threading.Thread(target=server.serve_forever,daemon=True).start()
+    cli.halo = SimpleNamespace(Halo=lambda **kwargs: contextlib.nullcontext())
+    print(f"{LOOKUPS} lookups, {LATENCY*1000:.0f} ms latency, {SIZE} argorithms")
+    print(f"{'mode':>22}{'seconds':>9}")
+    with tempfile.TemporaryDirectory() as directory:
+        cli.CACHE_DIR = directory
+        with open(os.path.join(directory,"config"),'w') as config:
+            config.write(f"http://127.0.0.1:{server.server_port}")
+        start = time.perf_counter()
+        for i in range(LOOKUPS):
+            cli.session().get(cli.app_settings.get_endpoint()+f"/argorithms/view/argorithm_{i}").json()
+        print(f"{'view request':>22}{time.perf_counter()-start:>9.3f}")
+        start = time.perf_counter()
+        for i in range(LOOKUPS):
+            cli.search(f"argorithm_{i}",show=False)
+        print(f"{'catalogue':>22}{time.perf_counter()-start:>9.3f}")
+        out = subprocess.run([sys.executable,"-c",COMPLETE.format(directory=directory)],capture_output=True,text=True,check=True).stdout.split()
+        print(f"{'completion process':>22}{float(out[1]):>9.3f}")
+    server.shutdown()
+
+if __name__ == "__main__":
+    run()
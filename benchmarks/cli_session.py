@@ -0,0 +1,83 @@
+"""Benchmark for requests made by authenticated CLI commands.
+
+Runs a number of commands against a local stub server that adds a fixed
+latency to every request. Each command gets the authorization header and makes
+one request, like ``ARgorithm delete`` . Without caching, every command checks
+whether the server has authentication enabled, verifies the token and opens
+new connections.
+"""
+import os
+import json
+import time
+import base64
+import tempfile
+import threading
+import contextlib
+from types import SimpleNamespace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import requests
+from ARgorithmToolkit import cli
+
+LATENCY = 0.05
+COMMANDS = 10
+
+class Stub(BaseHTTPRequestHandler):
+    """Answers every request with 200 after LATENCY seconds."""
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    hits = 0
+
+    def respond(self):
+        """Sends response."""
+        self.rfile.read(int(self.headers.get("Content-Length",0)))
+        Stub.hits += 1
+        time.sleep(LATENCY)
+        self.send_response(200)
+        self.send_header("Content-Length","2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    do_GET = respond
+    do_POST = respond
+
+    def log_message(self,*args): # pylint: disable=arguments-differ
+        pass
+
+def commands(url):
+    """Runs COMMANDS authenticated commands and returns the seconds taken."""
+    start = time.perf_counter()
+    for _ in range(COMMANDS):
+        header = cli.authmanager.get_header()
+        cli.session().post(url+"/argorithms/delete",json={"argorithmID" : "x"},headers=header)
+    return time.perf_counter()-start
+
+def run():
+    """Runs the benchmark and prints a table."""
+    server = ThreadingHTTPServer(("127.0.0.1",0),Stub)
+    threading.Thread(target=server.serve_forever,daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}"
+    payload = base64.urlsafe_b64encode(json.dumps({"exp" : time.time()+3600}).encode()).decode().rstrip("=")
+    print(f"{COMMANDS} commands, {LATENCY*1000:.0f} ms latency")
+    print(f"{'mode':>10}{'requests':>10}{'seconds':>9}")
+    cli.halo = SimpleNamespace(Halo=lambda **kwargs: contextlib.nullcontext())
+    with tempfile.TemporaryDirectory() as directory:
+        cli.CACHE_DIR = directory
+        cli.authmanager.credfile = os.path.join(directory,".credentials")
+        with open(os.path.join(directory,"config"),'w') as config:
+            config.write(url)
+        for mode in ["uncached","cached"]:
+            with open(cli.authmanager.credfile,'w') as cred:
+                cred.write(f"e30.{payload}.signature")
+            if mode == "uncached":
+                cli.VERIFY_TTL = 0
+                cli.session = requests.Session
+            else:
+                cli.VERIFY_TTL = 600
+                cli.session = cli.lru_cache(maxsize=None)(requests.Session)
+            Stub.hits = 0
+            seconds = commands(url)
+            print(f"{mode:>10}{Stub.hits:>10}{seconds:>9.2f}")
+    server.shutdown()
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,63 @@
+"""Benchmark for ARgorithmToolkit.encoders.StateEncoder.
+
+Encodes a StateSet of 100k states containing numpy values and references to
+nested ARgorithm structures with the registry based encoder and with the
+previous encoder that inspected the ARgorithmToolkit module for every object.
+"""
+import inspect
+import json
+import time
+from json import JSONEncoder
+import numpy as np
+import ARgorithmToolkit
+
+class InspectingEncoder(JSONEncoder):
+    """The encoder used before the type registry was added."""
+    def default(self, o):
+        classes = inspect.getmembers(ARgorithmToolkit,inspect.isclass)
+        classes = tuple([x for _,x in classes])
+        if isinstance(o, classes):
+            try:
+                return o.to_json()
+            except Exception as ex:
+                raise TypeError("Unserializable ARgorithm class",) from ex
+        if isinstance(o, np.integer):
+            return int(o)
+        if isinstance(o, np.floating):
+            return float(o)
+        if isinstance(o, np.ndarray):
+            return o.tolist()
+        if isinstance(o, np.bool_):
+            return bool(o)
+        return super().default(o)
+
+def build(count=100000):
+    """Creates StateSet with count states."""
+    algo = ARgorithmToolkit.StateSet()
+    arr = ARgorithmToolkit.Array("arr",algo,data=np.arange(8))
+    vec = ARgorithmToolkit.Vector("vec",algo,[arr])
+    for i in range(count):
+        algo.add_state(ARgorithmToolkit.State(
+            state_type="benchmark",
+            state_def={
+                "id" : "0",
+                "body" : [np.int64(i),np.float64(i/2),arr,vec],
+                "flag" : np.bool_(i%2)
+            },
+            comments=""
+        ))
+    return algo
+
+def run():
+    """Runs the benchmark and prints a table."""
+    algo = build()
+    contents = [x.content for x in algo.states]
+    print(f"{'encoder':<16}{'seconds':>10}{'states/s':>12}")
+    for name,cls in [("inspecting",InspectingEncoder),("registry",ARgorithmToolkit.encoders.StateEncoder)]:
+        start = time.perf_counter()
+        json.dumps(contents,cls=cls)
+        seconds = time.perf_counter()-start
+        print(f"{name:<16}{seconds:>10.2f}{len(contents)/seconds:>12.0f}")
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,51 @@
+"""Benchmark for repeated executions of ARgorithms with the execution cache.
+
+Runs the bubblesort and infix_to_postfix examples through
+``security.serialized_execution`` , which returns the JSON payload a server
+sends, ``security.execution_check`` , which returns decoded states, and the
+JSON payload loaded back into state dictionaries, which is what
+``ARgorithm execute --cache`` prints. Each is timed without a cache and with a
+cache on the first (miss) and second (hit) run. The last row of each example
+is ``ARgorithm execute`` without the cache for comparison.
+"""
+import os
+import json
+import time
+import tempfile
+from ARgorithmToolkit.cache import ExecutionCache
+from ARgorithmToolkit.security import execution_check, serialized_execution
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.abspath(__file__)),"..","examples")
+
+CASES = [
+    ("bubblesort",{"array" : list(range(300,0,-1))}),
+    ("infix_to_postfix",{"expression" : "a+b*(c^d-e)^(f+g*h)-i"*200}),
+]
+
+def loaded_payload(filename,configpath,parameters,cache=None):
+    """States printed by ARgorithm execute --cache."""
+    return json.loads(serialized_execution(filename,configpath,parameters,cache=cache))
+
+def contents(filename,configpath,parameters,cache=None):
+    """States printed by ARgorithm execute."""
+    return [x.content for x in execution_check(filename,configpath,parameters,cache=cache)]
+
+def timed(func,name,parameters,cache):
+    """Returns milliseconds taken by func."""
+    start = time.perf_counter()
+    func(os.path.join(EXAMPLES,f"{name}.py"),os.path.join(EXAMPLES,f"{name}.config.json"),parameters,cache=cache)
+    return (time.perf_counter()-start)*1e3
+
+def run():
+    """Runs the benchmark and prints a table."""
+    print(f"{'example':>18}{'function':>22}{'no cache ms':>13}{'miss ms':>10}{'hit ms':>9}")
+    with tempfile.TemporaryDirectory() as directory:
+        for name,parameters in CASES:
+            for func in [serialized_execution,execution_check,loaded_payload]:
+                cache = ExecutionCache(os.path.join(directory,func.__name__))
+                times = [timed(func,name,parameters,x) for x in (None,cache,cache)]
+                print(f"{name:>18}{func.__name__:>22}"+"".join(f"{x:>{w}.1f}" for x,w in zip(times,(13,10,9))))
+            print(f"{name:>18}{contents.__name__:>22}{timed(contents,name,parameters,None):>13.1f}")
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,54 @@
+"""Benchmark for running many ARgorithms in separate processes.
+
+Runs the infix_to_postfix example for a batch of inputs, each in a new python
+process, which is how runs are isolated without a pool, and in an Executor
+with warm workers. The time to start the Executor is reported separately as
+it is paid once.
+"""
+import os
+import sys
+import time
+import json
+import subprocess
+from ARgorithmToolkit.executor import Executor
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.abspath(__file__)),"..","examples")
+CODE = os.path.join(EXAMPLES,"infix_to_postfix.py")
+CONFIG = os.path.join(EXAMPLES,"infix_to_postfix.config.json")
+RUNS = 32
+
+SCRIPT = """
+import sys,json
+from ARgorithmToolkit.security import serialized_execution
+sys.stdout.buffer.write(serialized_execution(sys.argv[1],sys.argv[2],json.loads(sys.argv[3])))
+"""
+
+def inputs():
+    """Parameters of each run."""
+    return [{"expression" : "a+b*(c^d-e)^(f+g*h)-i"*(x % 8 + 1)} for x in range(RUNS)]
+
+def subprocesses():
+    """Runs each input in a new process."""
+    env = dict(os.environ,PYTHONPATH=os.path.join(EXAMPLES,".."))
+    for parameters in inputs():
+        subprocess.run([sys.executable,"-c",SCRIPT,CODE,CONFIG,json.dumps(parameters)],check=True,capture_output=True,env=env)
+
+def run():
+    """Runs the benchmark and prints a table."""
+    print(f"{'mode':>14}{'workers':>9}{'startup s':>11}{'runs':>6}{'seconds':>9}")
+    start = time.perf_counter()
+    subprocesses()
+    print(f"{'subprocess':>14}{1:>9}{0:>11.2f}{RUNS:>6}{time.perf_counter()-start:>9.2f}")
+    for workers in [1,4]:
+        start = time.perf_counter()
+        pool = Executor(workers=workers,timeout=30)
+        startup = time.perf_counter()-start
+        start = time.perf_counter()
+        for future in [pool.submit(CODE,CONFIG,x) for x in inputs()]:
+            future.result()
+        seconds = time.perf_counter()-start
+        pool.close()
+        print(f"{'executor':>14}{workers:>9}{startup:>11.2f}{RUNS:>6}{seconds:>9.2f}")
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,49 @@
+"""Benchmark for appending to ForwardList.
+
+Builds a ForwardList of n values at the back, once by walking from the head
+to the last node for every value as ``insert`` did before the tail pointer,
+once with ``push_back`` and once with a single ``extend`` , and reports the
+time, the number of states and the size of the states serialized to JSON.
+"""
+import time
+import ARgorithmToolkit
+from ARgorithmToolkit.serializers import dumps
+
+def walk(fl,values):
+    """Appends values by walking to the last node."""
+    for value in values:
+        curr = ARgorithmToolkit.LinkedListNode(fl.algo,value)
+        if fl.head is None:
+            fl.head = curr
+            continue
+        temp = fl.head
+        while temp.next:
+            temp = temp.next
+        temp.next = curr
+
+def push_back(fl,values):
+    """Appends values with push_back."""
+    for value in values:
+        fl.push_back(value)
+
+def extend(fl,values):
+    """Appends values with extend."""
+    fl.extend(values)
+
+def run():
+    """Runs the benchmark and prints a table."""
+    print(f"{'n':>8}{'mode':>11}{'seconds':>10}{'states':>8}{'json MB':>10}")
+    for n in [1000,5000,20000]:
+        for name,build in [("walk",walk),("push_back",push_back),("extend",extend)]:
+            if name == "walk" and n > 5000:
+                continue
+            algo = ARgorithmToolkit.StateSet()
+            fl = ARgorithmToolkit.ForwardList("fl",algo)
+            start = time.perf_counter()
+            build(fl,range(n))
+            seconds = time.perf_counter()-start
+            size = len(dumps(algo.states,"json"))/2**20
+            print(f"{n:>8}{name:>11}{seconds:>10.3f}{len(algo.states):>8}{size:>10.2f}")
+
+if __name__ == "__main__":
+    run()
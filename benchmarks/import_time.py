@@ -0,0 +1,35 @@
+"""Benchmark for the startup time of the toolkit and the CLI.
+
+Runs each command in a new interpreter and reports the best wall-clock time,
+which includes starting python itself.
+"""
+import sys
+import time
+import subprocess
+
+COMMANDS = [
+    ("python",[sys.executable,"-c","pass"]),
+    ("import toolkit",[sys.executable,"-c","import ARgorithmToolkit"]),
+    ("import cli",[sys.executable,"-c","import ARgorithmToolkit.cli"]),
+    ("ARgorithm --help",[sys.executable,"-m","ARgorithmToolkit","--help"]),
+    ("import numpy",[sys.executable,"-c","import numpy"]),
+]
+
+def measure(command,repeat=5):
+    """Returns the best time of running command."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(command,check=True,capture_output=True)
+        seconds = time.perf_counter()-start
+        best = seconds if best is None else min(best,seconds)
+    return best
+
+def run():
+    """Runs the benchmark and prints a table."""
+    print(f"{'command':>18}{'ms':>8}")
+    for name,command in COMMANDS:
+        print(f"{name:>18}{measure(command)*1000:>8.0f}")
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,86 @@
+"""Benchmark for checking code files for harmful code.
+
+Generates a corpus of ARgorithm files from the examples, each with a number of
+extra helper functions, and checks every file with the line based check the
+security module used before, the AST check and the AST check with verdicts
+cached from an earlier run, which is how CI checks files that did not change.
+"""
+import io
+import os
+import re
+import time
+import random
+import tempfile
+import tokenize
+from ARgorithmToolkit import security
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.abspath(__file__)),"..","examples")
+FILES = 500
+
+HELPER = """
+def helper_{0}(arr,n):
+    total_{0} = 0
+    for i in range(n):
+        if arr[i] % {1} == 0:
+            total_{0} += arr[i]
+    return total_{0}
+"""
+
+def legacy_check(filename):
+    """The line based check with a tokenizer pass."""
+    with open(filename,'r') as f:
+        lines = f.readlines()
+    if not any("import ARgorithmToolkit" in line or "from ARgorithmToolkit" in line for line in lines):
+        raise security.ARgorithmError("ARgorithmToolkit not imported")
+    for line in lines:
+        if line.startswith("from") and not re.search(r"^from\s+ARgorithmToolkit", line):
+            raise security.ARgorithmError("invalid module imported")
+    for line in lines:
+        if line.startswith("import") and not re.search(r"^import\s+ARgorithmToolkit", line):
+            raise security.ARgorithmError("invalid module imported")
+    text = ''.join(lines)
+    tokens = [x.string for x in tokenize.generate_tokens(io.StringIO(text).readline) if x.type == tokenize.NAME]
+    if set(tokens) & set(security.FORBIDDEN):
+        raise security.ARgorithmError('possible code injection')
+
+def corpus(directory):
+    """Writes the corpus and returns the paths of its files."""
+    rng = random.Random(0)
+    sources = []
+    for name in ["bubblesort","fibonacci","infix_to_postfix"]:
+        with open(os.path.join(EXAMPLES,f"{name}.py")) as f:
+            sources.append(f.read())
+    paths = []
+    for i in range(FILES):
+        helpers = "".join(HELPER.format(j,rng.randint(2,9)) for j in range(rng.randint(5,40)))
+        path = os.path.join(directory,f"argorithm_{i}.py")
+        with open(path,'w') as f:
+            f.write(sources[i % len(sources)] + helpers)
+        paths.append(path)
+    return paths
+
+def measure(func,paths):
+    """Returns seconds taken to check every file."""
+    start = time.perf_counter()
+    for path in paths:
+        func(path)
+    return time.perf_counter()-start
+
+def run():
+    """Runs the benchmark and prints a table."""
+    with tempfile.TemporaryDirectory() as directory:
+        paths = corpus(directory)
+        lines = sum(sum(1 for _ in open(x)) for x in paths)
+        print(f"{FILES} files, {lines} lines")
+        print(f"{'check':>14}{'seconds':>9}{'ms/file':>9}")
+        security._VERDICTS.clear() # pylint: disable=protected-access
+        for name,func in [
+            ("line based",legacy_check),
+            ("ast",security.injection_check),
+            ("ast cached",security.injection_check),
+        ]:
+            seconds = measure(func,paths)
+            print(f"{name:>14}{seconds:>9.3f}{seconds/FILES*1000:>9.3f}")
+
+if __name__ == "__main__":
+    run()
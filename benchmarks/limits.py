@@ -0,0 +1,48 @@
+"""Benchmark for limits on states.
+
+Runs the bubblesort and infix_to_postfix examples with and without limits to
+measure the cost of accounting for states, and compares the estimated size of
+their states to the size of the JSON written for them.
+"""
+import os
+import time
+import importlib.util
+import ARgorithmToolkit
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.abspath(__file__)),"..","examples")
+
+CASES = [
+    ("bubblesort",{"array" : list(range(300,0,-1))}),
+    ("infix_to_postfix",{"expression" : "a+b*(c^d-e)^(f+g*h)-i"*200}),
+]
+
+def load(name):
+    """Imports the example ARgorithm."""
+    spec = importlib.util.spec_from_file_location(name,os.path.join(EXAMPLES,f"{name}.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def measure(func,limits,repeat=3):
+    """Returns the result and best time of func run with given limits."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with ARgorithmToolkit.stateset_defaults(limits=limits):
+            result = func()
+        seconds = time.perf_counter()-start
+        best = seconds if best is None else min(best,seconds)
+    return result,best
+
+def run():
+    """Runs the benchmark and prints a table."""
+    print(f"{'example':>18}{'states':>8}{'no limits s':>13}{'limits s':>10}{'estimate MB':>13}{'json MB':>9}")
+    for name,parameters in CASES:
+        module = load(name)
+        algo,plain = measure(lambda: module.run(**parameters),None)
+        limited,seconds = measure(lambda: module.run(**parameters),{})
+        json_size = len(algo.dumps("json"))
+        print(f"{name:>18}{len(algo.states):>8}{plain:>13.3f}{seconds:>10.3f}{limited.limits.bytes/2**20:>13.2f}{json_size/2**20:>9.2f}")
+
+if __name__ == "__main__":
+    run()
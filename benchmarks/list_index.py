@@ -0,0 +1,45 @@
+"""Benchmark for positional operations of List.
+
+Reads the values at 2000 random indexes of a List of n values, once walking
+from the head for every index as ``insert`` did before and once with
+``__getitem__`` , which walks from the nearer end like ``insert`` and
+``erase`` , and reports the time and the number of nodes visited.
+"""
+import time
+import random
+import ARgorithmToolkit
+
+def head_walk(lis,index):
+    """Returns the node at index walking from the head."""
+    curr = lis.head
+    for _ in range(index):
+        curr = curr.next
+    return curr
+
+def run():
+    """Runs the benchmark and prints a table."""
+    print(f"{'n':>8}{'mode':>9}{'seconds':>10}{'visited':>12}")
+    for n in [1000,5000,20000]:
+        rng = random.Random(0)
+        indexes = [rng.randrange(n) for _ in range(2000)]
+        algo = ARgorithmToolkit.StateSet()
+        lis = ARgorithmToolkit.List("lis",algo)
+        with algo.paused():
+            for x in range(n):
+                lis.push_back(x)
+        for mode in ["head","nearest"]:
+            start = time.perf_counter()
+            for index in indexes:
+                if mode == "head":
+                    head_walk(lis,index).value
+                else:
+                    lis[index]
+            seconds = time.perf_counter()-start
+            if mode == "head":
+                visited = sum(indexes)
+            else:
+                visited = sum(min(x,n-1-x) for x in indexes)
+            print(f"{n:>8}{mode:>9}{seconds:>10.3f}{visited:>12}")
+
+if __name__ == "__main__":
+    run()
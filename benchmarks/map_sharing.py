@@ -0,0 +1,51 @@
+"""Benchmark for memory used by Map states.
+
+Fills a Map with keys and looks keys up, keeping all the states in memory.
+Compares the persistent bodies used by Map against storing a copy of a
+dictionary in every state, which is what MapState did before.
+"""
+import time
+import random
+import tracemalloc
+import ARgorithmToolkit
+
+def copied(keys,lookups):
+    """States with a dictionary copy as body."""
+    algo = ARgorithmToolkit.StateSet()
+    generator = ARgorithmToolkit.map.MapState("map","0")
+    body = {}
+    for key in range(keys):
+        body[key] = key
+        algo.add_state(generator.map_set(body,key,key))
+    for _ in range(lookups):
+        key = random.randrange(keys)
+        algo.add_state(generator.map_get(body,key,body[key]))
+    return algo
+
+def persistent(keys,lookups):
+    """States of ARgorithmToolkit.Map."""
+    algo = ARgorithmToolkit.StateSet()
+    _map = ARgorithmToolkit.Map("map",algo)
+    for key in range(keys):
+        _map[key] = key
+    for _ in range(lookups):
+        _map[random.randrange(keys)] # pylint: disable=pointless-statement
+    return algo
+
+def run():
+    """Runs the benchmark and prints a table."""
+    print(f"{'keys':>7}{'lookups':>9}{'bodies':>12}{'seconds':>9}{'MB':>9}")
+    for keys,lookups,cases in [(1000,10000,[copied,persistent]),(10000,100000,[persistent])]:
+        for func in cases:
+            random.seed(0)
+            tracemalloc.start()
+            start = time.perf_counter()
+            algo = func(keys,lookups)
+            seconds = time.perf_counter()-start
+            size,_ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del algo
+            print(f"{keys:>7}{lookups:>9}{func.__name__:>12}{seconds:>9.2f}{size/1e6:>9.1f}")
+
+if __name__ == "__main__":
+    run()
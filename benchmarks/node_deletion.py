@@ -0,0 +1,49 @@
+"""Benchmark for deletion of linked list nodes.
+
+Builds a List of n values, pops half of them from the front and drops the
+list, in rounds with automatic garbage collection turned off. Reports the
+time, the peak memory traced by tracemalloc, the number of ``dllnode_delete``
+states recorded by the end of the run and the number of objects a full
+collection still finds unreachable afterwards. Nodes that are only reclaimed
+by the collector show up as missing deletion states and unreachable objects.
+"""
+import gc
+import time
+import tracemalloc
+import ARgorithmToolkit
+
+def churn(n,rounds):
+    """Builds, half empties and drops a list of n values rounds times and
+    returns the StateSet."""
+    algo = ARgorithmToolkit.StateSet()
+    for _ in range(rounds):
+        lis = ARgorithmToolkit.List("lis",algo)
+        for x in range(n):
+            lis.push_back(x)
+        for _ in range(n//2):
+            lis.pop_front()
+        del lis
+    return algo
+
+def run():
+    """Runs the benchmark and prints a table."""
+    print(f"{'n':>8}{'seconds':>10}{'peak MB':>10}{'deletes':>9}{'unreachable':>13}")
+    for n in [1000,10000]:
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        algo = churn(n,5)
+        seconds = time.perf_counter()-start
+        deletes = sum(1 for x in algo.states if x.state_type == "dllnode_delete")
+        unreachable = gc.collect()
+        del algo
+        tracemalloc.start()
+        churn(n,5)
+        peak = tracemalloc.get_traced_memory()[1]/2**20
+        tracemalloc.stop()
+        gc.collect()
+        gc.enable()
+        print(f"{n:>8}{seconds:>10.3f}{peak:>10.1f}{deletes:>9}{unreachable:>13}")
+
+if __name__ == "__main__":
+    run()
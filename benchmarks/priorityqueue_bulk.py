@@ -0,0 +1,38 @@
+"""Benchmark for bulk construction of PriorityQueue.
+
+Seeds a PriorityQueue with n (distance, vertex) pairs the way a Dijkstra demo
+does, once by calling offer for every vertex and once by passing the pairs as
+data, and reports the time, the number of states and the size of the states
+serialized to JSON.
+"""
+import time
+import random
+import ARgorithmToolkit
+from ARgorithmToolkit.serializers import dumps
+
+def seed(n,bulk):
+    """Seeds a priority queue with n vertices and returns the StateSet."""
+    algo = ARgorithmToolkit.StateSet()
+    pairs = [(random.randint(0,10*n),x) for x in range(n)]
+    if bulk:
+        ARgorithmToolkit.PriorityQueue("pq",algo,data=pairs)
+    else:
+        pq = ARgorithmToolkit.PriorityQueue("pq",algo)
+        for pair in pairs:
+            pq.offer(pair)
+    return algo
+
+def run():
+    """Runs the benchmark and prints a table."""
+    random.seed(0)
+    print(f"{'n':>8}{'mode':>8}{'seconds':>10}{'states':>8}{'json MB':>10}")
+    for n in [1000,3000,10000]:
+        for mode in ["offer","bulk"]:
+            start = time.perf_counter()
+            algo = seed(n,mode == "bulk")
+            seconds = time.perf_counter()-start
+            size = len(dumps(algo.states,"json"))/2**20
+            print(f"{n:>8}{mode:>8}{seconds:>10.3f}{len(algo.states):>8}{size:>10.2f}")
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,76 @@
+"""Benchmark for indexed PriorityQueue.
+
+Runs Dijkstra on a random graph with n vertices and 8n edges, once pushing a
+new (distance, vertex) pair for every relaxed edge and skipping stale pairs
+when they are polled, and once with an indexed PriorityQueue keyed by the
+distances that is updated with decrease_key. Reports the time, the largest
+size of the heap, the number of states and the size of the states serialized
+to JSON.
+"""
+import time
+import random
+import ARgorithmToolkit
+from ARgorithmToolkit.serializers import dumps
+
+def graph(n):
+    """Returns adjacency lists of a random connected graph."""
+    rng = random.Random(0)
+    edges = [[] for _ in range(n)]
+    for v in range(1,n):
+        edges[rng.randrange(v)].append((v,rng.randint(1,100)))
+    for _ in range(7*n):
+        edges[rng.randrange(n)].append((rng.randrange(n),rng.randint(1,100)))
+    return edges
+
+def lazy(edges):
+    """Dijkstra pushing duplicate pairs."""
+    algo = ARgorithmToolkit.StateSet()
+    dist = [float("inf")]*len(edges)
+    dist[0] = 0
+    pq = ARgorithmToolkit.PriorityQueue("pq",algo,data=[(0,0)])
+    largest = 1
+    while not pq.empty():
+        d,u = pq.poll()
+        if d > dist[u]:
+            continue
+        for v,w in edges[u]:
+            if d + w < dist[v]:
+                dist[v] = d + w
+                pq.offer((dist[v],v))
+                largest = max(largest,len(pq))
+    return algo,largest
+
+def indexed(edges):
+    """Dijkstra with decrease_key."""
+    algo = ARgorithmToolkit.StateSet()
+    dist = [float("inf")]*len(edges)
+    dist[0] = 0
+    pq = ARgorithmToolkit.PriorityQueue("pq",algo,data=[0],key=dist.__getitem__,indexed=True)
+    largest = 1
+    while not pq.empty():
+        u = pq.poll()
+        for v,w in edges[u]:
+            if dist[u] + w < dist[v]:
+                if v in pq:
+                    dist[v] = dist[u] + w
+                    pq.decrease_key(v)
+                else:
+                    dist[v] = dist[u] + w
+                    pq.offer(v)
+                    largest = max(largest,len(pq))
+    return algo,largest
+
+def run():
+    """Runs the benchmark and prints a table."""
+    print(f"{'n':>8}{'mode':>9}{'seconds':>10}{'heap':>8}{'states':>8}{'json MB':>10}")
+    for n in [500,2000,5000]:
+        edges = graph(n)
+        for name,dijkstra in [("lazy",lazy),("indexed",indexed)]:
+            start = time.perf_counter()
+            algo,largest = dijkstra(edges)
+            seconds = time.perf_counter()-start
+            size = len(dumps(algo.states,"json"))/2**20
+            print(f"{n:>8}{name:>9}{seconds:>10.3f}{largest:>8}{len(algo.states):>8}{size:>10.2f}")
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,25 @@
+"""Scaling benchmark for Queue.
+
+Pushes n elements into a Queue and pops all of them, for n from 10^3 to 10^6.
+The time per operation should stay flat as n grows.
+"""
+import time
+import ARgorithmToolkit
+
+def run():
+    """Runs the benchmark and prints a table."""
+    print(f"{'n':>10}{'seconds':>10}{'us/op':>8}")
+    for n in [10**3,10**4,10**5,10**6]:
+        algo = ARgorithmToolkit.StateSet()
+        queue = ARgorithmToolkit.Queue("q",algo)
+        start = time.perf_counter()
+        for x in range(n):
+            queue.push(x)
+        for _ in range(n):
+            queue.pop()
+        seconds = time.perf_counter()-start
+        print(f"{n:>10}{seconds:>10.2f}{seconds/(2*n)*1e6:>8.2f}")
+        del algo,queue
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,43 @@
+"""Benchmark for read-only states of unchanged data structures.
+
+Pushes elements to a Stack and reads its top many times, keeping all the
+states in memory. Compares states that share the body of the last state of the
+stack against a copy per state, which is what StateSet did before, and the
+size of the serialized states in each format.
+"""
+import time
+import tracemalloc
+import ARgorithmToolkit
+
+class CopyingStateSet(ARgorithmToolkit.StateSet):
+    """StateSet that does not share bodies between states."""
+
+    def add_state(self,state,version=None):
+        super().add_state(state)
+
+def build(cls,size,reads):
+    """Stack of given size read reads times."""
+    algo = cls()
+    stack = ARgorithmToolkit.Stack("st",algo)
+    for x in range(size):
+        stack.push(x)
+    for _ in range(reads):
+        stack.top()
+    return algo
+
+def run():
+    """Runs the benchmark and prints a table."""
+    print(f"{'size':>6}{'reads':>7}{'bodies':>8}{'seconds':>9}{'MB':>8}{'json':>11}{'json_refs':>11}{'binary':>11}")
+    for size,reads in [(100,10000),(1000,10000)]:
+        for name,cls in [("copied",CopyingStateSet),("shared",ARgorithmToolkit.StateSet)]:
+            tracemalloc.start()
+            start = time.perf_counter()
+            algo = build(cls,size,reads)
+            seconds = time.perf_counter()-start
+            memory,_ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            sizes = [len(algo.dumps(fmt))/1e6 for fmt in ("json","json_refs","binary")]
+            print(f"{size:>6}{reads:>7}{name:>8}{seconds:>9.2f}{memory/1e6:>8.1f}"+"".join(f"{x:>11.2f}" for x in sizes))
+
+if __name__ == "__main__":
+    run()
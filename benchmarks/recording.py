@@ -0,0 +1,52 @@
+"""Benchmark for running ARgorithms with recording turned off.
+
+Runs the bubblesort and infix_to_postfix examples with states recorded and
+with every StateSet paused, which is how an ARgorithm is run when only its
+result is needed.
+"""
+import os
+import time
+import importlib.util
+import ARgorithmToolkit
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.abspath(__file__)),"..","examples")
+
+CASES = [
+    ("bubblesort",{"array" : list(range(300,0,-1))}),
+    ("infix_to_postfix",{"expression" : "a+b*(c^d-e)^(f+g*h)-i"*200}),
+]
+
+def load(name):
+    """Imports the example ARgorithm."""
+    spec = importlib.util.spec_from_file_location(name,os.path.join(EXAMPLES,f"{name}.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def measure(func,repeat=3):
+    """Returns the result and best time of func."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        seconds = time.perf_counter()-start
+        best = seconds if best is None else min(best,seconds)
+    return result,best
+
+def paused(func):
+    """Runs func with recording turned off."""
+    with ARgorithmToolkit.stateset_defaults(recording=False):
+        return func()
+
+def run():
+    """Runs the benchmark and prints a table."""
+    print(f"{'example':<18}{'recording':<11}{'states':>8}{'ms':>10}")
+    for name,parameters in CASES:
+        module = load(name)
+        for label,func in [("on",lambda m=module,p=parameters: m.run(**p)),
+                           ("off",lambda m=module,p=parameters: paused(lambda: m.run(**p)))]:
+            algo,seconds = measure(func)
+            print(f"{name:<18}{label:<11}{len(algo.states):>8}{seconds*1e3:>10.1f}")
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,47 @@
+"""Benchmark for the StateSet serializers.
+
+Runs the ARgorithms in the examples folder and compares the size, encoding and
+decoding time of the JSON and binary formats.
+"""
+import os
+import time
+import importlib.util
+import ARgorithmToolkit
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.abspath(__file__)),"..","examples")
+
+CASES = [
+    ("bubblesort",{"array" : list(range(300,0,-1))}),
+    ("infix_to_postfix",{"expression" : "a+b*(c^d-e)^(f+g*h)-i"*20}),
+    ("fibonacci",{"n" : 2000}),
+]
+
+def load(name):
+    """Imports the example ARgorithm."""
+    spec = importlib.util.spec_from_file_location(name,os.path.join(EXAMPLES,f"{name}.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def measure(func,repeat=3):
+    """Returns the result and best time of func."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        seconds = time.perf_counter()-start
+        best = seconds if best is None else min(best,seconds)
+    return result,best
+
+def run():
+    """Runs the benchmark and prints a table."""
+    print(f"{'example':<18}{'format':<8}{'states':>8}{'bytes':>12}{'encode ms':>12}{'decode ms':>12}")
+    for name,parameters in CASES:
+        algo = load(name).run(**parameters)
+        for fmt in ["json","binary"]:
+            data,encode = measure(lambda fmt=fmt: algo.dumps(fmt))
+            _,decode = measure(lambda data=data: ARgorithmToolkit.serializers.loads(data))
+            print(f"{name:<18}{fmt:<8}{len(algo.states):>8}{len(data):>12}{encode*1e3:>12.1f}{decode*1e3:>12.1f}")
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,44 @@
+"""Microbenchmark for construction of ARgorithmToolkit.utils.State objects.
+
+Compares the slots based State against the previous implementation that built
+a content dictionary for every state.
+"""
+import timeit
+import tracemalloc
+import ARgorithmToolkit
+
+class DictState:
+    """The dictionary based State implementation used before slots."""
+    def __init__(self,**kwargs):
+        self.content = {}
+        for x in ['state_type','state_def','comments']:
+            try:
+                self.content[x] = kwargs[x]
+            except KeyError as e:
+                raise ARgorithmToolkit.ARgorithmError(f"{x} should be present in State arguments") from e
+
+STATE_DEF = {"id" : "1", "variable_name" : "arr", "body" : [1,2,3], "index" : 1}
+
+def construct(cls):
+    """Creates a single state."""
+    return cls(state_type="array_iter",state_def=STATE_DEF,comments="")
+
+def allocation(cls,count=100000):
+    """Returns bytes allocated per state when count states are kept alive."""
+    tracemalloc.start()
+    states = [construct(cls) for _ in range(count)]
+    size,_ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del states
+    return size/count
+
+def run():
+    """Runs the benchmark and prints a table."""
+    number = 200000
+    print(f"{'implementation':<16}{'ns/state':>12}{'bytes/state':>14}")
+    for name,cls in [("dict",DictState),("slots",ARgorithmToolkit.State)]:
+        seconds = min(timeit.repeat(lambda cls=cls: construct(cls),number=number,repeat=5))
+        print(f"{name:<16}{seconds/number*1e9:>12.1f}{allocation(cls):>14.1f}")
+
+if __name__ == "__main__":
+    run()
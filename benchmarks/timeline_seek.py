@@ -0,0 +1,41 @@
+"""Benchmark for random access into a long delta encoded trace.
+
+Records random swaps on an Array in a delta encoded StateSet whose keyframes
+are far apart and seeks to random steps. Compares rebuilding the body with
+``StateSet.body_at`` , which applies every delta back to the last keyframe,
+against the checkpoints of ``ARgorithmToolkit.Timeline``.
+"""
+import time
+import random
+import ARgorithmToolkit
+
+def record(size,steps,keyframe_interval):
+    """Delta encoded StateSet of random swaps with a timeline."""
+    algo = ARgorithmToolkit.StateSet(delta=True,keyframe_interval=keyframe_interval)
+    timeline = ARgorithmToolkit.Timeline(algo)
+    arr = ARgorithmToolkit.Array("arr",algo,data=list(range(size)))
+    for _ in range(steps):
+        arr.swap(random.randrange(size),random.randrange(size))
+    return algo,timeline,arr
+
+def run():
+    """Runs the benchmark and prints a table."""
+    print(f"{'steps':>8}{'keyframes':>11}{'record s':>10}{'body_at ms':>12}{'timeline ms':>13}")
+    for steps,keyframe_interval in [(10000,10000),(100000,100000)]:
+        random.seed(0)
+        start = time.perf_counter()
+        algo,timeline,arr = record(1000,steps,keyframe_interval)
+        recorded = time.perf_counter()-start
+        seeks = [random.randrange(len(algo.states)) for _ in range(20)]
+        start = time.perf_counter()
+        for step in seeks:
+            algo.body_at(step)
+        body_at = (time.perf_counter()-start)/len(seeks)
+        start = time.perf_counter()
+        for step in seeks:
+            timeline.body_at(arr,step)
+        seek = (time.perf_counter()-start)/len(seeks)
+        print(f"{steps:>8}{keyframe_interval:>11}{recorded:>10.2f}{body_at*1e3:>12.2f}{seek*1e3:>13.2f}")
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,33 @@
+"""Benchmark for Vector insertion and removal.
+
+Runs insertion sort on a reversed Vector by removing each element and
+inserting it back at its position, so that every step mutates the middle of
+the vector. The StateSet is delta encoded so that the time is spent in Vector
+and not in storing full bodies.
+"""
+import time
+import bisect
+import ARgorithmToolkit
+
+def insertion_sort(n):
+    """Sorts a reversed vector of size n and returns the StateSet."""
+    algo = ARgorithmToolkit.StateSet(delta=True)
+    vec = ARgorithmToolkit.Vector("vec",algo,list(range(n,0,-1)))
+    for i in range(1,n):
+        value = vec.body[i]
+        position = bisect.bisect(vec.body,value,0,i)
+        vec.remove(index=i)
+        vec.insert(value,position)
+    return algo
+
+def run():
+    """Runs the benchmark and prints a table."""
+    print(f"{'n':>8}{'seconds':>10}{'us/op':>10}")
+    for n in [1000,5000,10000]:
+        start = time.perf_counter()
+        insertion_sort(n)
+        seconds = time.perf_counter()-start
+        print(f"{n:>8}{seconds:>10.2f}{seconds/(2*n)*1e6:>10.1f}")
+
+if __name__ == "__main__":
+    run()
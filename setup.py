@@ -19,15 +19,14 @@ setuptools.setup(
         "License :: OSI Approved :: Apache Software License",
         'Programming Language :: Python :: 3',
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.7',
     include_package_data=True,
     install_requires=[
         'typer>=0.3.2', # For CLI
         'requests>=2.25.1' , #For CLI
         'numpy>=1.19.5',
         'halo>=0.0.31',
-        'jsonschema>=3.2.0',
-        'pyflakes>=2.2.0'
+        'jsonschema>=3.2.0'
     ],
     project_urls={  # Optional
         'Source': 'https://github.com/ARgorithm/toolkit',
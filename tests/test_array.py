@@ -115,3 +115,20 @@ def test_dimension_check():
         assert False
     except ARgorithmToolkit.ARgorithmError:
         pass
+
+def test_snapshots():
+    """Test states share read-only copies of array until it is modified
+    """
+    algo = ARgorithmToolkit.StateSet()
+    arr = ARgorithmToolkit.Array(name='arr',algo=algo,shape=(3,3),fill=1)
+    arr[0,0]
+    arr[1,1]
+    first = algo.states[-2].content["state_def"]["body"]
+    assert first is algo.states[-1].content["state_def"]["body"]
+    assert not first.flags.writeable
+    arr[2,2] = 5
+    assert first[2,2] == 1
+    assert algo.states[-1].content["state_def"]["body"][2,2] == 5
+    states = ARgorithmToolkit.serializers.loads(algo.dumps())
+    assert states[-1]["state_def"]["body"] == arr.tolist()
+    assert states[0]["state_def"]["body"] == [[1,1,1]]*3
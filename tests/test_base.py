@@ -39,3 +39,13 @@ def test_comment_state():
     assert last_state.content['state_type'] == 'comment'
     assert last_state.content['comments'] == 'Hello world'
     assert last_state.content['state_def'] is None
+
+def test_state_content():
+    """Test State fields and lazily built content
+    """
+    state = ARgorithmToolkit.State(state_type="comment",state_def=None,comments="hello")
+    assert not hasattr(state,'__dict__')
+    assert state.state_type == "comment"
+    assert state.content == {"state_type" : "comment", "state_def" : None, "comments" : "hello"}
+    state.content = {"state_type" : "comment", "state_def" : None, "comments" : "world"}
+    assert state.comments == "world"
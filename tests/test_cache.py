@@ -0,0 +1,120 @@
+"""Testing execution cache
+"""
+import os
+import json
+import shutil
+import numpy as np
+from ARgorithmToolkit.cache import ExecutionCache
+from ARgorithmToolkit.utils import ARgorithmLimitError
+from ARgorithmToolkit.security import execution_check, serialized_execution
+from ARgorithmToolkit.serializers import dumps
+
+EXAMPLES = os.path.join(os.path.dirname(__file__),"..","examples")
+
+def test_execution_cache(tmp_path):
+    """Test repeated executions are read from the cache
+    """
+    codepath = str(tmp_path / "bubblesort.py")
+    configpath = os.path.join(EXAMPLES,"bubblesort.config.json")
+    shutil.copy(os.path.join(EXAMPLES,"bubblesort.py"),codepath)
+    cache = ExecutionCache(str(tmp_path / "cache"))
+    parameters = {"array" : [6,3,2,4,5,1]}
+    states = execution_check(codepath,configpath,parameters,cache=cache)
+    assert len(os.listdir(cache.directory)) == 1
+    with open(codepath,'a') as codefile:
+        codefile.write("\nraise Exception\n")
+    try:
+        execution_check(codepath,configpath,parameters,cache=cache)
+        assert False
+    except Exception: # pylint: disable=broad-except
+        pass
+    with open(codepath) as codefile:
+        code = codefile.read().replace("\nraise Exception\n","")
+    with open(codepath,'w') as codefile:
+        codefile.write(code)
+    cached = execution_check(codepath,configpath,parameters,cache=cache)
+    assert json.loads(dumps(cached)) == json.loads(dumps(states))
+    execution_check(codepath,configpath,{"array" : [2,1]},cache=cache)
+    assert len(os.listdir(cache.directory)) == 2
+    data = serialized_execution(codepath,configpath,parameters,cache=cache)
+    assert [x["comments"] for x in json.loads(data)] == [x.comments for x in states]
+    assert serialized_execution(codepath,configpath,parameters,cache=cache) == data
+    assert len(os.listdir(cache.directory)) == 3
+
+CODE = """import ARgorithmToolkit
+
+def run(values):
+    algo = ARgorithmToolkit.StateSet()
+    vec = ARgorithmToolkit.Vector("vec",algo,list(values))
+    st = ARgorithmToolkit.Stack("st",algo)
+    arr = ARgorithmToolkit.Array("arr",algo,data=values)
+    for x in values:
+        st.push(x)
+    vec.insert(7)
+    arr.swap(0,1)
+    st.top()
+    return algo
+"""
+
+def _same(a,b):
+    """Checks values are equal and of the same type."""
+    if isinstance(a,np.ndarray):
+        return isinstance(b,np.ndarray) and np.array_equal(a,b)
+    if isinstance(a,dict):
+        return isinstance(b,dict) and a.keys() == b.keys() and all(_same(a[k],b[k]) for k in a)
+    if isinstance(a,list):
+        return isinstance(b,list) and len(a) == len(b) and all(_same(x,y) for x,y in zip(a,b))
+    return type(a) == type(b) and a == b # pylint: disable=unidiomatic-typecheck
+
+def test_cached_states(tmp_path):
+    """Test cached states equal the states of an uncached execution
+    """
+    codepath = str(tmp_path / "structures.py")
+    configpath = str(tmp_path / "structures.config.json")
+    with open(codepath,'w') as codefile:
+        codefile.write(CODE)
+    with open(configpath,'w') as configfile:
+        json.dump({"function" : "run"},configfile)
+    cache = ExecutionCache(str(tmp_path / "cache"))
+    parameters = {"values" : [5,4,3,2,1]}
+    states = execution_check(codepath,configpath,parameters,cache=cache)
+    cached = execution_check(codepath,configpath,parameters,cache=cache)
+    assert len(cached) == len(states)
+    for state,other in zip(states,cached):
+        assert _same(state.content,other.content)
+
+def test_cache_limits(tmp_path):
+    """Test results cached without limits are not returned to runs with limits
+    """
+    codepath = os.path.join(EXAMPLES,"bubblesort.py")
+    configpath = os.path.join(EXAMPLES,"bubblesort.config.json")
+    cache = ExecutionCache(str(tmp_path))
+    parameters = {"array" : [6,3,2,4,5,1]}
+    states = execution_check(codepath,configpath,parameters,cache=cache)
+    assert len(states) > 5
+    for run in [execution_check,serialized_execution]:
+        try:
+            run(codepath,configpath,parameters,cache=cache,limits={"max_states" : 5})
+            assert False
+        except ARgorithmLimitError:
+            pass
+    limits = {"max_states" : 10**6}
+    execution_check(codepath,configpath,parameters,cache=cache,limits=limits)
+    assert len(os.listdir(cache.directory)) == 2
+    execution_check(codepath,configpath,parameters,cache=cache,limits=limits)
+    assert len(os.listdir(cache.directory)) == 2
+
+def test_eviction(tmp_path):
+    """Test least recently used entries are evicted and corrupt entries ignored
+    """
+    cache = ExecutionCache(str(tmp_path),max_entries=2)
+    for key in "ab":
+        cache.put(key,[])
+        os.utime(os.path.join(str(tmp_path),key+".binary.states"),(0,ord(key)))
+    assert cache.get("a") == []
+    cache.put("c",[])
+    assert cache.get("b") is None and cache.get("a") == []
+    with open(os.path.join(str(tmp_path),"c.binary.states"),'wb') as entry:
+        entry.write(b"ARGS\x01\x05\x02")
+    assert cache.get("c") is None
+    assert sorted(os.listdir(str(tmp_path))) == ["a.binary.states"]
@@ -0,0 +1,176 @@
+"""Testing CLI requests against a local stub server
+"""
+import os
+import json
+import time
+import base64
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from ARgorithmToolkit import cli, security
+
+EXAMPLES = os.path.join(os.path.dirname(__file__),"..","examples")
+
+class Stub(BaseHTTPRequestHandler):
+    """Answers every request with 200 and records it, /flaky answers 503 on
+    every other request
+    """
+    protocol_version = "HTTP/1.1"
+    hits = []
+
+    def respond(self):
+        """Records request and sends response
+        """
+        length = int(self.headers.get("Content-Length",0))
+        self.rfile.read(length)
+        self.hits.append((self.path,self.client_address[1]))
+        status = 200
+        if self.path == "/flaky" and sum(1 for x,_ in self.hits if x == "/flaky") % 2:
+            status = 503
+        body = b"{}"
+        self.send_response(status)
+        self.send_header("Content-Length",str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = respond
+    do_POST = respond
+
+    def log_message(self,*args): # pylint: disable=arguments-differ
+        pass
+
+def token(expiry):
+    """Creates unsigned JWT with given expiry
+    """
+    payload = base64.urlsafe_b64encode(json.dumps({"exp" : expiry}).encode()).decode().rstrip("=")
+    return f"e30.{payload}.signature"
+
+def test_session(tmp_path,monkeypatch):
+    """Test token verification is cached and connections are reused
+    """
+    server = ThreadingHTTPServer(("127.0.0.1",0),Stub)
+    threading.Thread(target=server.serve_forever,daemon=True).start()
+    try:
+        monkeypatch.setattr(cli,"CACHE_DIR",str(tmp_path))
+        monkeypatch.setattr(cli.authmanager,"credfile",str(tmp_path / ".credentials"))
+        (tmp_path / "config").write_text(f"http://127.0.0.1:{server.server_port}")
+        valid = token(time.time()+3600)
+        (tmp_path / ".credentials").write_text(valid)
+        Stub.hits.clear()
+        assert cli.authmanager.get_header() == {"authorization" : "Bearer "+valid}
+        assert [x for x,_ in Stub.hits] == ["/auth","/programmers/verify"]
+        assert cli.authmanager.get_header() == {"authorization" : "Bearer "+valid}
+        assert len(Stub.hits) == 2
+        assert len({port for _,port in Stub.hits}) == 1
+
+        assert cli.session().get(f"http://127.0.0.1:{server.server_port}/flaky").status_code == 200
+        assert [x for x,_ in Stub.hits[2:]] == ["/flaky","/flaky"]
+
+        cli.authmanager.write(token=token(time.time()-10),verified=time.time())
+        monkeypatch.setattr(cli.authmanager,"login_prompt",lambda: "renewed")
+        assert cli.authmanager.get_token() == "renewed"
+        assert len(Stub.hits) == 4
+    finally:
+        server.shutdown()
+        server.server_close()
+
+class CatalogueStub(BaseHTTPRequestHandler):
+    """Serves list of argorithms with an ETag and answers 304 to requests
+    for the current version
+    """
+    protocol_version = "HTTP/1.1"
+    version = 1
+    requests = []
+
+    def do_GET(self): # pylint: disable=invalid-name
+        """Sends list of argorithms
+        """
+        self.requests.append((self.path,self.headers.get("If-None-Match")))
+        etag = f'"v{self.version}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("Content-Length","0")
+            self.end_headers()
+            return
+        items = [{"argorithmID" : name, "maintainer" : "test", "description" : "", "parameters" : {}, "example" : {}}
+            for name in ["bubblesort","binarysearch","fibonacci"][:self.version+1]]
+        body = json.dumps(items).encode()
+        self.send_response(200)
+        self.send_header("ETag",etag)
+        self.send_header("Content-Length",str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self,*args): # pylint: disable=arguments-differ
+        pass
+
+def test_catalogue(tmp_path,monkeypatch):
+    """Test catalogue is revalidated once stale and used offline
+    """
+    server = ThreadingHTTPServer(("127.0.0.1",0),CatalogueStub)
+    threading.Thread(target=server.serve_forever,daemon=True).start()
+    monkeypatch.setattr(cli,"CACHE_DIR",str(tmp_path))
+    monkeypatch.setattr(cli,"RETRIES",0)
+    cli.session.cache_clear()
+    (tmp_path / "config").write_text(f"http://127.0.0.1:{server.server_port}")
+    catalogue = cli.Catalogue()
+    try:
+        assert [x["argorithmID"] for x in catalogue.items()] == ["bubblesort","binarysearch"]
+        assert catalogue.items() is catalogue.items()
+        assert CatalogueStub.requests == [("/argorithms/list",None)]
+        assert catalogue.prefix("b") == ["binarysearch","bubblesort"]
+        assert cli.search("binarysearch",show=False)["argorithmID"] == "binarysearch"
+        assert len(CatalogueStub.requests) == 1
+
+        monkeypatch.setattr(cli,"CATALOGUE_TTL",0)
+        catalogue.items()
+        assert CatalogueStub.requests[-1] == ("/argorithms/list",'"v1"')
+        CatalogueStub.version = 2
+        assert cli.Catalogue().prefix("") == ["binarysearch","bubblesort"]
+        assert len(cli.Catalogue().items()) == 3
+        assert CatalogueStub.requests[-1] == ("/argorithms/list",'"v1"')
+        assert len(CatalogueStub.requests) == 3
+    finally:
+        server.shutdown()
+        server.server_close()
+        cli.session().close()
+    assert len(catalogue.items()) == 3
+    assert cli.autocomplete_id("fib") == ["fibonacci"]
+    cli.session.cache_clear()
+
+def test_autocomplete_offline(tmp_path,monkeypatch):
+    """Test completion without stored catalogue makes a single short request
+    """
+    calls = []
+    class Unreachable:
+        """Session of a server that cannot be reached
+        """
+        def get(self,url,**kwargs):
+            """Records request and fails
+            """
+            calls.append(kwargs["timeout"])
+            raise cli.requests.ConnectionError(url)
+    def session(retries=None):
+        calls.append(retries)
+        return Unreachable()
+    monkeypatch.setattr(cli,"CACHE_DIR",str(tmp_path))
+    monkeypatch.setattr(cli,"session",session)
+    (tmp_path / "config").write_text("http://127.0.0.1:1")
+    monkeypatch.setattr(cli,"catalogue",cli.Catalogue())
+    assert cli.autocomplete_id("fib") == []
+    assert calls == [0,cli.COMPLETION_TIMEOUT]
+    assert cli.COMPLETION_TIMEOUT < 1
+
+def test_execute_cache(tmp_path,monkeypatch):
+    """Test execute caches the JSON payload only when asked to and serves it without executing
+    """
+    monkeypatch.setattr(cli,"CACHE_DIR",str(tmp_path))
+    code = cli.CodeManager(os.path.join(EXAMPLES,"fibonacci.py"))
+    states = code.test()
+    assert not (tmp_path / "executions").exists()
+    cached = code.test(use_cache=True)
+    assert [x["state_type"] for x in cached] == [x["state_type"] for x in states]
+    assert [x.suffix for x in (tmp_path / "executions").iterdir()] == [".states"]
+    def execute(*args):
+        assert False, "cached execution executed again"
+    monkeypatch.setattr(security,"_execute",execute)
+    assert code.test(use_cache=True) == cached
@@ -0,0 +1,74 @@
+"""Testing delta encoded StateSet
+"""
+import numpy as np
+import ARgorithmToolkit
+
+def test_diff_patch():
+    """Test delta generation and application
+    """
+    pairs = [
+        ([1,2,3,4],[1,9,3,4]),
+        ([1,2,3,4],[1,2,7,3,4]),
+        ([1,2,3,4],[1,2,4]),
+        ("hello world","hello, world"),
+        ({"a":1,"b":2,"c":3},{"a":1,"b":5,"c":3}),
+        ({"a":1,"b":2,"c":3},{"a":1,"c":3}),
+        (set([1,2,3,4]),set([1,2,3,5])),
+        (list(range(1000)),list(range(500))+[-1]+list(range(500,1000))),
+        (list(range(1000)),list(range(600))+list(range(601,1000))),
+        (list(range(1000)),[x if x%300 else -x for x in range(1000)]),
+    ]
+    for prev,curr in pairs:
+        delta = ARgorithmToolkit.delta.diff(prev,curr)
+        assert delta is not None
+        assert ARgorithmToolkit.delta.patch(prev,delta) == curr
+    prev = np.arange(16).reshape(4,4)
+    curr = prev.copy()
+    curr[1,2],curr[3,0] = 0,0
+    delta = ARgorithmToolkit.delta.diff(prev,curr)
+    assert delta == {"set" : [[[1,2],0],[[3,0],0]]}
+    assert np.array_equal(ARgorithmToolkit.delta.patch(prev,delta),curr)
+    assert ARgorithmToolkit.delta.diff([1,2],[3,4]) is None
+    view = ARgorithmToolkit.queue.QueueBody([0,1,2,3,4],1,5)
+    delta = ARgorithmToolkit.delta.diff(view,ARgorithmToolkit.queue.QueueBody([0,1,2,9,4],1,5))
+    assert ARgorithmToolkit.delta.patch(view,delta) == [1,2,9,4]
+    assert ARgorithmToolkit.delta.diff([1,2],"12") is None
+
+def sort_array(algo,data):
+    """Sorts array using the bubblesort example algorithm
+    """
+    arr = ARgorithmToolkit.Array('arr',algo,data=data)
+    for i in range(len(arr)):
+        for j in range(i+1,len(arr)):
+            if arr.compare(i,j) > 0:
+                arr.swap(i,j)
+
+def test_array_delta():
+    """Test reconstruction of array bodies from deltas
+    """
+    test_data = [5,4,3,2,1,0,9,8,7,6]
+    full = ARgorithmToolkit.StateSet()
+    algo = ARgorithmToolkit.StateSet(delta=True,keyframe_interval=4)
+    sort_array(full,test_data)
+    sort_array(algo,test_data)
+    assert algo.states[0].content["state_def"]["body"].tolist() == test_data
+    assert any("body_delta" in x.content["state_def"] for x in algo.states)
+    for index,state in enumerate(full.states):
+        assert np.array_equal(algo.body_at(index),state.content["state_def"]["body"])
+    state = algo.expand(len(algo.states)-1)
+    assert state["state_def"]["body"].tolist() == sorted(test_data)
+    assert "body_delta" not in state["state_def"]
+
+def test_mixed_structures():
+    """Test deltas across interleaved structures
+    """
+    algo = ARgorithmToolkit.StateSet(delta=True)
+    vec = ARgorithmToolkit.Vector('vec',algo,[1,2,3,4,5,6])
+    st = ARgorithmToolkit.Stack('st',algo)
+    algo.add_comment("comment state")
+    for x in [4,5,6,7,8]:
+        st.push(x)
+        vec.insert(x,2)
+    assert algo.body_at(2) is None
+    assert algo.body_at(len(algo.states)-1) == vec.body
+    assert algo.body_at(len(algo.states)-2) == st.body
@@ -1,5 +1,7 @@
 """Testing Doubly linked list
 """
+import gc
+import weakref
 import ARgorithmToolkit
 from .utils import last_state
 algo = ARgorithmToolkit.StateSet()
@@ -100,8 +102,8 @@ def test_list():
     assert k == 3
     assert len(dl) == 0
     assert dl.tail is None
-    assert last_state(algo)['state_type'] == "dll_tail"
     assert last_state(algo)['state_type'] == "dllnode_delete"
+    assert last_state(algo)['state_type'] == "dll_tail"
     assert last_state(algo)['state_type'] == "dll_head"
 
     dl.push_front(3)
@@ -115,8 +117,8 @@ def test_list():
 
     k = dl.pop_back()
     assert k == 4
-    assert last_state(algo)['state_type'] == "dll_head"
     assert last_state(algo)['state_type'] == "dllnode_delete"
+    assert last_state(algo)['state_type'] == "dll_head"
     assert last_state(algo)['state_type'] == "dll_tail"
 
     try:
@@ -124,3 +126,92 @@ def test_list():
         raise AssertionError("Error not raised")
     except ARgorithmToolkit.ARgorithmError:
         pass
+
+def test_list_index():
+    """Test positional operations of List
+    """
+    algo = ARgorithmToolkit.StateSet()
+    dl = ARgorithmToolkit.List("dl",algo)
+    for x in range(8):
+        dl.push_back(x)
+    assert [dl[i] for i in range(8)] == list(range(8))
+    assert dl[-1] == 7 and dl[-8] == 0
+    for index in [8,-9]:
+        try:
+            dl[index]
+            raise AssertionError("Error not raised")
+        except ARgorithmToolkit.ARgorithmError:
+            pass
+    assert list(reversed(dl)) == list(range(7,-1,-1))
+
+    dl.insert(10,6)
+    dl.insert(11,1)
+    dl.insert(12,10)
+    assert dl.tolist() == [0,11,1,2,3,4,5,10,6,7,12]
+    assert dl.tail.value == 12
+    assert list(reversed(dl)) == dl.tolist()[::-1]
+
+    assert dl.erase(7) == 10
+    assert dl.erase(1) == 11
+    assert dl.erase(-1) == 12
+    assert dl.erase(0) == 0
+    assert dl.tolist() == [1,2,3,4,5,6,7]
+    assert list(reversed(dl)) == [7,6,5,4,3,2,1]
+    for index in [7,-8,-9,-14]:
+        try:
+            dl.erase(index)
+            raise AssertionError("Error not raised")
+        except ARgorithmToolkit.ARgorithmError:
+            pass
+    assert dl.tolist() == [1,2,3,4,5,6,7]
+    assert last_state(algo)['state_type'] == "dllnode_delete"
+    while len(dl):
+        dl.erase(len(dl)//2)
+    assert dl.head is None and dl.tail is None
+    try:
+        dl.erase(0)
+        raise AssertionError("Error not raised")
+    except ARgorithmToolkit.ARgorithmError:
+        pass
+
+def test_deterministic_delete():
+    """Test deletion states do not depend on garbage collection
+    """
+    gc.disable()
+    try:
+        algo = ARgorithmToolkit.StateSet()
+        dl = ARgorithmToolkit.List("dl",algo)
+        for x in range(5):
+            dl.push_back(x)
+        assert dl.tail.prev.value == 3
+        refs = []
+        curr = dl.head
+        while curr:
+            refs.append(weakref.ref(curr))
+            curr = curr.next
+        del dl
+        assert all(x() is None for x in refs)
+        deleted = [x for x in algo.states if x.content['state_type'] == "dllnode_delete"]
+        assert len(deleted) == 5
+
+        dl = ARgorithmToolkit.List("dl",algo)
+        dl.push_back(1)
+        dl.push_back(2)
+        kept = dl.head
+        dl.pop_front()
+        assert last_state(algo)['state_type'] == "dllnode_delete"
+        count = len(algo.states)
+        del kept
+        assert len(algo.states) == count
+
+        dl.push_back(3)
+        dl.remove(2)
+        assert dl.tolist() == [3] and dl.head is dl.tail
+        assert last_state(algo)['state_type'] == "dllnode_delete"
+
+        tail = ARgorithmToolkit.DoublyLinkedListNode(algo,3)
+        tail.prev = ARgorithmToolkit.DoublyLinkedListNode(algo,2)
+        assert tail.prev.value == 2
+        assert last_state(algo)['state_type'] == "dllnode_prev"
+    finally:
+        gc.enable()
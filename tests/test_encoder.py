@@ -1,6 +1,7 @@
 """Testing JSON Encoder for ARgorithm containers
 """
 import json
+import numpy as np
 import ARgorithmToolkit
 
 algo = ARgorithmToolkit.StateSet()
@@ -41,3 +42,22 @@ def test_encoder():
             raise AssertionError("Should have raised type error")
         except TypeError:
             pass
+
+def test_type_registry():
+    """Tests numpy values, Variables and custom types in the registry
+    """
+    var = ARgorithmToolkit.Variable("var",algo,np.int32(5))
+    values = [var,np.int64(3),np.float32(1.5),np.bool_(True),np.array([[1,2],[3,4]])]
+    json_string = json.dumps(values,cls=ARgorithmToolkit.encoders.StateEncoder)
+    assert json.loads(json_string) == [5,3,1.5,True,[[1,2],[3,4]]]
+
+    assert ARgorithmToolkit.encoders.handler_for(ARgorithmToolkit.ForwardList) is not None
+    assert ARgorithmToolkit.encoders.handler_for(ARgorithmToolkit.StateSet) is None
+
+    class Point:
+        """Custom class to be registered"""
+        def __init__(self,x,y):
+            self.x = x
+            self.y = y
+    ARgorithmToolkit.encoders.register(Point,lambda o: [o.x,o.y])
+    assert json.dumps(Point(1,2),cls=ARgorithmToolkit.encoders.StateEncoder) == "[1, 2]"
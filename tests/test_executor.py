@@ -0,0 +1,48 @@
+"""Testing process pool executor
+"""
+import os
+import json
+import ARgorithmToolkit
+from ARgorithmToolkit.executor import Executor
+
+EXAMPLES = os.path.join(os.path.dirname(__file__),"..","examples")
+
+CODE = """import ARgorithmToolkit
+
+def run(**kwargs):
+    algo = ARgorithmToolkit.StateSet()
+    arr = ARgorithmToolkit.Array("arr",algo,data=[0])
+    if kwargs["mode"] == "loop":
+        while True:
+            arr[0] = arr[0] + 1
+    if kwargs["mode"] == "fail":
+        raise ARgorithmToolkit.ARgorithmClientError("invalid input")
+    for i in range(kwargs["n"]):
+        arr[0] = i
+    return algo
+"""
+
+def test_executor(tmp_path):
+    """Test runs, errors and limits of executor
+    """
+    codepath = tmp_path / "counter.py"
+    codepath.write_text(CODE)
+    configpath = tmp_path / "counter.config.json"
+    configpath.write_text(json.dumps({"argorithmID" : "counter", "file" : "counter.py", "function" : "run"}))
+    with Executor(workers=1,timeout=1,max_states=1000) as pool:
+        bubblesort = pool.submit(os.path.join(EXAMPLES,"bubblesort.py"),os.path.join(EXAMPLES,"bubblesort.config.json"),{"array" : [3,2,1]})
+        data = pool.run(str(codepath),str(configpath),{"mode" : "count", "n" : 10})
+        assert len(json.loads(data)) == 11
+        assert json.loads(bubblesort.result())[0]["state_def"]["body"] == [3,2,1]
+        for parameters,error in [
+            ({"mode" : "fail"},ARgorithmToolkit.ARgorithmClientError),
+            ({"mode" : "count", "n" : 10**9},ARgorithmToolkit.ARgorithmLimitError),
+            ({"mode" : "loop"},ARgorithmToolkit.ARgorithmLimitError),
+        ]:
+            try:
+                pool.run(str(codepath),str(configpath),parameters)
+                assert False
+            except error as ex:
+                assert parameters.get("n") != 10**9 or "states" in str(ex)
+        data = pool.run(str(codepath),str(configpath),{"mode" : "count", "n" : 1})
+        assert len(json.loads(data)) == 2
@@ -0,0 +1,59 @@
+"""Testing modules imported by the toolkit and CLI
+"""
+import sys
+import json
+import subprocess
+
+HEAVY = ["numpy","requests","halo","jsonschema"]
+# microseconds, about 30 times the import time measured on a laptop
+IMPORT_CEILING = 500000
+
+def run(code):
+    """Runs code in a new interpreter and returns its output
+    """
+    return subprocess.run([sys.executable,"-c",code],capture_output=True,text=True,check=True).stdout
+
+def import_time(module):
+    """Imports module in a new interpreter and returns its cumulative import
+    time in microseconds as reported by ``-X importtime``
+    """
+    result = subprocess.run([sys.executable,"-X","importtime","-c",f"import {module}"],capture_output=True,text=True,check=True)
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and line.count("|") == 2:
+            _,cumulative,name = line.split("|")
+            if name.strip() == module:
+                return int(cumulative)
+    raise AssertionError(f"{module} not in import times")
+
+def loaded(modules):
+    """Code printing which of modules are imported
+    """
+    return f"import sys,json;print(json.dumps([x for x in {modules!r} if x in sys.modules]))"
+
+def test_lazy_numpy():
+    """Test numpy is imported only once Array is used
+    """
+    out = run("import ARgorithmToolkit;algo = ARgorithmToolkit.StateSet();ARgorithmToolkit.Stack('st',algo).push(1);"+loaded(HEAVY))
+    assert json.loads(out) == []
+    out = run("import ARgorithmToolkit;ARgorithmToolkit.Array('arr',ARgorithmToolkit.StateSet(),data=[1]);"+loaded(["numpy"]))
+    assert json.loads(out) == ["numpy"]
+
+def test_import_time():
+    """Test CLI and toolkit import no heavy modules and the toolkit imports
+    within a generous ceiling
+    """
+    out = run("import ARgorithmToolkit.cli;"+loaded(HEAVY))
+    assert json.loads(out) == []
+    out = run("import ARgorithmToolkit;"+loaded(["numpy"]))
+    assert json.loads(out) == []
+    assert import_time("ARgorithmToolkit") < IMPORT_CEILING
+
+def test_namespace():
+    """Test only the public names of utils are exported by the toolkit
+    """
+    import ARgorithmToolkit # pylint: disable=import-outside-toplevel
+    from ARgorithmToolkit import utils # pylint: disable=import-outside-toplevel
+    for name in utils.__all__:
+        assert getattr(ARgorithmToolkit,name) is getattr(utils,name)
+    for name in ["sys","time","islice","contextmanager","Mapping","Sequence","AbstractSet","PersistentMap","PersistentSet"]:
+        assert not hasattr(ARgorithmToolkit,name)
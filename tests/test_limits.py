@@ -0,0 +1,164 @@
+"""Testing limits on states
+"""
+import os
+import json
+import tracemalloc
+import numpy as np
+import ARgorithmToolkit
+from ARgorithmToolkit import security, persistent
+from ARgorithmToolkit.security import execution_check
+from ARgorithmToolkit.parser import validateconfig
+
+EXAMPLES = os.path.join(os.path.dirname(__file__),"..","examples")
+
+PEEK = """import ARgorithmToolkit
+
+def run():
+    algo = ARgorithmToolkit.StateSet()
+    stack = ARgorithmToolkit.Stack("st",algo)
+    for i in range(100):
+        stack.push(i)
+    for i in range(50):
+        stack.top()
+    return algo
+"""
+
+def test_estimate_size():
+    """Test estimates of serialized size
+    """
+    assert ARgorithmToolkit.estimate_size([1,2,"abc"]) == 26
+    assert ARgorithmToolkit.estimate_size(np.zeros(1000)) == 8002
+    assert ARgorithmToolkit.estimate_size({"a" : None}) == 15
+    assert ARgorithmToolkit.estimate_size(list(range(3200))) == 100 * ARgorithmToolkit.estimate_size(list(range(32))) - 198
+
+def test_max_states():
+    """Test states stop being added once limit is reached
+    """
+    algo = ARgorithmToolkit.StateSet(limits={"max_states" : 5})
+    arr = ARgorithmToolkit.Array("arr",algo,data=[0])
+    try:
+        for i in range(10):
+            arr[0] = i
+        assert False
+    except ARgorithmToolkit.ARgorithmLimitError:
+        pass
+    assert len(algo.states) == 5
+    assert algo.limits.states == 5
+
+def test_max_bytes():
+    """Test estimated bytes of states and of bodies
+    """
+    algo = ARgorithmToolkit.StateSet(limits=ARgorithmToolkit.StateLimits(max_body_bytes=1000))
+    ARgorithmToolkit.Array("arr",algo,data=list(range(100)))
+    try:
+        ARgorithmToolkit.Array("big",algo,data=list(range(1000)))
+        assert False
+    except ARgorithmToolkit.ARgorithmLimitError as ex:
+        assert "big" in str(ex)
+    sizes = []
+    for delta in [False,True]:
+        algo = ARgorithmToolkit.StateSet(delta=delta,limits={"shared_bodies" : True})
+        stack = ARgorithmToolkit.Stack("st",algo)
+        for i in range(100):
+            stack.push(i)
+        before = algo.limits.bytes
+        for i in range(10):
+            stack.top()
+        assert algo.limits.bytes - before < 10 * 200
+        sizes.append(algo.limits.bytes)
+    assert sizes[1] < sizes[0] / 2
+    algo = ARgorithmToolkit.StateSet(limits={})
+    stack = ARgorithmToolkit.Stack("st",algo)
+    for i in range(100):
+        stack.push(i)
+    before = algo.limits.bytes
+    for i in range(10):
+        stack.top()
+    assert algo.limits.bytes - before > 10 * ARgorithmToolkit.estimate_size(list(range(100)))
+    algo = ARgorithmToolkit.StateSet(limits={"max_bytes" : sizes[0] // 2})
+    stack = ARgorithmToolkit.Stack("st",algo)
+    try:
+        for i in range(100):
+            stack.push(i)
+        assert False
+    except ARgorithmToolkit.ARgorithmLimitError:
+        assert algo.limits.bytes <= sizes[0] // 2
+
+def test_config_limits(tmp_path):
+    """Test limits declared in config are enforced on execution
+    """
+    with open(os.path.join(EXAMPLES,"bubblesort.config.json")) as f:
+        config = json.load(f)
+    config["limits"] = {"max_states" : 10}
+    configpath = tmp_path / "bubblesort.config.json"
+    configpath.write_text(json.dumps(config))
+    assert validateconfig(str(configpath))["limits"] == config["limits"]
+    codepath = os.path.join(EXAMPLES,"bubblesort.py")
+    assert len(execution_check(codepath,str(configpath),{"array" : [1]})) <= 10
+    for limits in [None,{"max_states" : 100}]:
+        try:
+            execution_check(codepath,str(configpath),config["example"],limits=limits)
+            assert False
+        except ARgorithmToolkit.ARgorithmLimitError:
+            pass
+    try:
+        execution_check(codepath,os.path.join(EXAMPLES,"bubblesort.config.json"),config["example"],limits={"max_states" : 10})
+        assert False
+    except ARgorithmToolkit.ARgorithmLimitError:
+        pass
+    assert ARgorithmToolkit.StateSet().limits is None
+
+def test_format_limits(tmp_path):
+    """Test shared bodies count as a reference only in formats writing them once
+    """
+    with open(os.path.join(EXAMPLES,"bubblesort.config.json")) as f:
+        config = json.load(f)
+    assert security.execution_options(config,{"max_states" : 10})["limits"] == {"max_states" : 10}
+    for fmt in ["json_refs","binary"]:
+        assert security.execution_options(config,{"max_states" : 10},fmt)["limits"]["shared_bodies"]
+    assert security.execution_options(config,None,"binary")["limits"] is None
+    codepath = tmp_path / "peek.py"
+    codepath.write_text(PEEK)
+    configpath = tmp_path / "peek.config.json"
+    configpath.write_text(json.dumps({"function" : "run"}))
+    limits = {"max_bytes" : 75 * ARgorithmToolkit.estimate_size(list(range(100)))}
+    for fmt in ["json_refs","binary"]:
+        security.serialized_execution(str(codepath),str(configpath),{},fmt,limits=limits)
+    try:
+        security.serialized_execution(str(codepath),str(configpath),{},"json",limits=limits)
+        assert False
+    except ARgorithmToolkit.ARgorithmLimitError:
+        pass
+
+def test_map_limits(monkeypatch):
+    """Test limits on a large Map sample its body instead of iterating it
+    """
+    def ordered(node):
+        assert False, "body of Map iterated"
+    algo = ARgorithmToolkit.StateSet(limits={"max_bytes" : 2**40})
+    arg_map = ARgorithmToolkit.Map("m",algo)
+    for i in range(2000):
+        arg_map[i] = i
+    monkeypatch.setattr(persistent,"_ordered",ordered)
+    tracemalloc.start()
+    try:
+        for i in range(2000):
+            arg_map[i] = -i
+        _,peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < 8 * 2**20
+    assert algo.limits.bytes > 4000 * ARgorithmToolkit.estimate_size({"key" : 0})
+
+def test_module_limits(tmp_path):
+    """Test limits apply to a StateSet created when the code file is imported
+    """
+    codepath = tmp_path / "module_level.py"
+    codepath.write_text(PEEK.replace("def run():\n    algo = ARgorithmToolkit.StateSet()\n","algo = ARgorithmToolkit.StateSet()\n\ndef run():\n"))
+    configpath = tmp_path / "module_level.config.json"
+    configpath.write_text(json.dumps({"function" : "run", "limits" : {"max_states" : 10}}))
+    try:
+        execution_check(str(codepath),str(configpath),{})
+        assert False
+    except ARgorithmToolkit.ARgorithmLimitError:
+        pass
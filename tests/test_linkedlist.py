@@ -53,9 +53,12 @@ def test_forwardlist():
     fl.push_front(4)
     assert len(fl) == 1
     assert isinstance(fl.head,ARgorithmToolkit.LinkedListNode)
+    assert last_state(algo)['state_type'] == "ll_tail"
     assert last_state(algo)['state_type'] == "ll_head"
+    assert fl.tail is fl.head
 
     fl.push_front(3)
+    assert last_state(algo)['state_type'] == "ll_head"
     assert fl.tolist() == [3,4]
 
     fl.insert(5,1)
@@ -93,3 +96,59 @@ def test_forwardlist():
         raise AssertionError("Error not raised")
     except ARgorithmToolkit.ARgorithmError:
         pass
+
+def test_forwardlist_tail():
+    """Testing tail pointer of forwardlist
+    """
+    algo = ARgorithmToolkit.StateSet()
+    fl = ARgorithmToolkit.ForwardList("fl",algo)
+    fl.push_back(1)
+    assert fl.head is fl.tail
+    fl.push_back(2)
+    state = last_state(algo)
+    assert state['state_type'] == "ll_tail"
+    assert state['state_def']['tail'] == fl.tail.name
+    fl.insert(3,10)
+    assert fl.tolist() == [1,2,3]
+    assert fl.tail.value == 3
+
+    count = len(algo.states)
+    fl.extend(range(4,8),comments="extend")
+    assert len(algo.states) == count + 1
+    state = last_state(algo)
+    assert state['state_type'] == "ll_extend"
+    assert [x['value'] for x in state['state_def']['nodes']] == [4,5,6,7]
+    assert state['state_def']['nodes'][-1]['next'] == "none"
+    assert state['state_def']['tail'] == fl.tail.name
+    assert fl.tolist() == [1,2,3,4,5,6,7] and len(fl) == 7
+    fl.push_back(8)
+    assert fl.tolist()[-2:] == [7,8]
+
+    fl.remove(8)
+    assert fl.tail.value == 7
+    fl.push_back(9)
+    assert fl.tolist()[-2:] == [7,9]
+    while len(fl):
+        fl.pop_front()
+    assert fl.tail is None
+    fl.extend([1,2])
+    assert fl.tolist() == [1,2] and fl.head.value == 1 and fl.tail.value == 2
+    fl.remove(1)
+    fl.remove(2)
+    assert fl.head is None and fl.tail is None
+
+def test_forwardlist_release():
+    """Testing deletion states of nodes removed from forwardlist
+    """
+    algo = ARgorithmToolkit.StateSet()
+    fl = ARgorithmToolkit.ForwardList("fl",algo)
+    fl.extend([1,2,2,3])
+    kept = fl.head
+    fl.pop_front()
+    assert last_state(algo)['state_type'] == "llnode_delete"
+    count = len(algo.states)
+    del kept
+    assert len(algo.states) == count
+    fl.remove(2)
+    deleted = [x for x in algo.states if x.content['state_type'] == "llnode_delete"]
+    assert len(deleted) == 2
@@ -18,6 +18,9 @@ def test_map():
     assert map1[str1] == 456
     assert map1.get("123",-1) == -1
     assert algo.states[-1].content['state_def']['value'] == -1
+    map1["str"] = str1
+    assert algo.states[-1].content['state_def']['body']["str"] == str1.to_json()
+    del map1["str"]
 
 def test_remove():
     """Tests map item deletion
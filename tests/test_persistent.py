@@ -0,0 +1,121 @@
+"""Testing persistent bodies of Map and Set
+"""
+import gc
+import json
+import random
+import tracemalloc
+import ARgorithmToolkit
+from ARgorithmToolkit.persistent import PersistentMap, PersistentSet
+
+class Colliding:
+    """Key whose hash collides with other keys
+    """
+    def __init__(self,value):
+        self.value = value
+
+    def __hash__(self):
+        return self.value % 3
+
+    def __eq__(self,other):
+        return isinstance(other,Colliding) and other.value == self.value
+
+def test_persistent_map():
+    """Test persistent map against dict including older versions
+    """
+    random.seed(0)
+    body = PersistentMap()
+    data = {}
+    versions = []
+    for step in range(5000):
+        key = random.choice([random.randrange(300),str(random.randrange(50)),Colliding(random.randrange(20))])
+        if key in data and random.random() < 0.4:
+            del data[key]
+            new_body = body.delete(key)
+        else:
+            data[key] = random.randrange(5)
+            new_body = body.set(key,data[key])
+        changes,removed = body.changes(new_body)
+        expected = dict(body.to_dict())
+        for k in removed:
+            del expected[k]
+        expected.update(changes)
+        assert expected == data
+        assert list(new_body.to_dict().items()) == list(data.items())
+        body = new_body
+        if step % 500 == 0:
+            versions.append((body,dict(data)))
+    for body,data in versions:
+        assert body == data and len(body) == len(data)
+    try:
+        PersistentMap().delete(1)
+        assert False
+    except KeyError:
+        pass
+
+def test_persistent_set():
+    """Test persistent set operations
+    """
+    body = PersistentSet([1,2,3])
+    new_body = body.add(4).remove(1)
+    assert body == {1,2,3} and new_body == {2,3,4}
+    assert body.add(2) is body
+    assert body.changes(new_body) == ([4],[1])
+
+def test_structure_bodies():
+    """Test states of Map and Set share bodies and serialize as plain values
+    """
+    algo = ARgorithmToolkit.StateSet()
+    _map = ARgorithmToolkit.Map("map",algo)
+    for x in range(100):
+        _map[x] = x*x
+    _map[5] # pylint: disable=pointless-statement
+    _map[7] # pylint: disable=pointless-statement
+    assert algo.states[-1].state_def["body"] is algo.states[-2].state_def["body"]
+    del _map[0]
+    assert 0 in algo.states[-3].state_def["body"] and 0 not in algo.states[-1].state_def["body"]
+    myset = ARgorithmToolkit.Set("set",algo,[3,1,2])
+    myset.add(0)
+    states = json.loads(algo.dumps())
+    assert states[-1]["state_def"]["body"] == [3,1,2,0]
+    assert states[-2]["state_def"]["body"] == [3,1,2]
+    assert states[-3]["state_def"]["body"] == {str(x) : x*x for x in range(1,100)}
+
+def test_delta():
+    """Test delta encoding of persistent bodies
+    """
+    algo = ARgorithmToolkit.StateSet(delta=True)
+    full = ARgorithmToolkit.StateSet()
+    for stateset in [algo,full]:
+        _map = ARgorithmToolkit.Map("map",stateset)
+        myset = ARgorithmToolkit.Set("set",stateset)
+        for x in range(50):
+            _map[x % 7] = x
+            myset.add(x % 11)
+        _map.remove(3)
+        myset.remove(4)
+    assert any("body_delta" in x.state_def for x in algo.states)
+    for index,state in enumerate(full.states):
+        assert algo.body_at(index) == state.state_def["body"]
+
+def test_dumped_memory():
+    """Test serializing every version of a map keeps no copies of the versions alive
+    """
+    algo = ARgorithmToolkit.StateSet()
+    arg_map = ARgorithmToolkit.Map("m",algo)
+    for i in range(200):
+        arg_map[i] = i
+    for i in range(200):
+        arg_map[i] = -i
+    ARgorithmToolkit.serializers.dumps([])
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before,_ = tracemalloc.get_traced_memory()
+        data = algo.dumps("json")
+        assert len(json.loads(data)) == 401
+        del data
+        gc.collect()
+        after,_ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert after - before < 2**20
@@ -0,0 +1,83 @@
+"""Testing recording policies
+"""
+import os
+import json
+import ARgorithmToolkit
+from ARgorithmToolkit.security import execution_check
+from ARgorithmToolkit.parser import validateconfig
+
+EXAMPLES = os.path.join(os.path.dirname(__file__),"..","examples")
+
+def walk(algo,size=10):
+    """Reads every element of an array twice
+    """
+    arr = ARgorithmToolkit.Array('arr',algo,data=list(range(size)))
+    for _ in range(2):
+        for i in range(size):
+            arr[i] # pylint: disable=pointless-statement
+    arr.swap(0,1)
+    return arr
+
+def state_types(algo):
+    """List of state types in stateset
+    """
+    return [x.state_type for x in algo.states]
+
+def test_every():
+    """Test recording every k-th state
+    """
+    algo = ARgorithmToolkit.StateSet(policy={"every" : {"array_iter" : 5}})
+    walk(algo)
+    assert state_types(algo) == ["array_declare"] + ["array_iter"]*4 + ["array_swap"]
+    assert [x.state_def["index"] for x in algo.states[1:5]] == [0,5,0,5]
+
+def test_cap_and_keep_only():
+    """Test capping states and keeping only some types
+    """
+    algo = ARgorithmToolkit.StateSet(policy=ARgorithmToolkit.RecordingPolicy(cap=3))
+    walk(algo)
+    assert state_types(algo) == ["array_declare"] + ["array_iter"]*3 + ["array_swap"]
+    algo = ARgorithmToolkit.StateSet(policy={"keep_only" : ["array_swap"]})
+    walk(algo)
+    algo.add_comment("dropped")
+    assert state_types(algo) == ["array_declare","array_swap"]
+
+def test_time_budget():
+    """Test states are dropped once time budget is exhausted
+    """
+    algo = ARgorithmToolkit.StateSet(policy={"time_budget" : 1e-9})
+    walk(algo)
+    assert state_types(algo) == ["array_declare","array_iter"]
+
+def test_config_policy(tmp_path):
+    """Test policy declared in config is applied on execution
+    """
+    with open(os.path.join(EXAMPLES,"bubblesort.config.json")) as f:
+        config = json.load(f)
+    config["policy"] = {"keep_only" : ["array_swap"]}
+    configpath = tmp_path / "bubblesort.config.json"
+    configpath.write_text(json.dumps(config))
+    assert validateconfig(str(configpath))["policy"] == config["policy"]
+    states = execution_check(os.path.join(EXAMPLES,"bubblesort.py"),str(configpath),config["example"])
+    assert {x.state_type for x in states} == {"array_declare","array_swap"}
+    assert ARgorithmToolkit.StateSet().policy is None
+
+def test_paused():
+    """Test no states are recorded while paused
+    """
+    algo = ARgorithmToolkit.StateSet()
+    with algo.paused():
+        arr = walk(algo)
+        algo.add_comment("dropped")
+        with algo.paused():
+            arr.swap(1,2)
+        arr.swap(2,3)
+    assert state_types(algo) == ["array_declare"]
+    arr.swap(0,3)
+    assert state_types(algo) == ["array_declare","array_swap"]
+    assert algo.states[-1].state_def["body"].tolist() == [0,2,3,1]+list(range(4,10))
+    with ARgorithmToolkit.stateset_defaults(recording=False):
+        algo = ARgorithmToolkit.StateSet()
+        walk(algo)
+    assert state_types(algo) == ["array_declare"]
+    assert ARgorithmToolkit.StateSet().recording
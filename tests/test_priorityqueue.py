@@ -1,5 +1,6 @@
 """Test priority queue
 """
+import random
 import ARgorithmToolkit
 
 algo = ARgorithmToolkit.StateSet()
@@ -56,3 +57,146 @@ def test_size():
     """Test priorityqueue size
     """
     assert queue.empty() and len(queue)==0
+
+def test_positional_comments():
+    """Test comments are still the third positional argument
+    """
+    algo = ARgorithmToolkit.StateSet()
+    pq = ARgorithmToolkit.PriorityQueue("pq",algo,"costs")
+    assert len(pq) == 0
+    assert algo.states[-1].content["comments"] == "costs"
+    state = pq.state_generator.priorityqueue_declare("declared")
+    assert state.content["comments"] == "declared"
+    assert state.content["state_def"]["body"] == []
+
+def test_bulk():
+    """Test priority queue created with data and offer_many
+    """
+    algo = ARgorithmToolkit.StateSet()
+    data = [9, 4, 7, 1, 8, 2]
+    pq = ARgorithmToolkit.PriorityQueue("pq",algo,data=data)
+    assert data == [9, 4, 7, 1, 8, 2]
+    assert len(algo.states) == 1
+    last_state = algo.states[-1]
+    assert last_state.content["state_type"] == "priorityqueue_declare"
+    assert last_state.content["state_def"]["body"] == pq.body
+    assert pq.body[0] == 1
+
+    pq.offer_many([6, 0, 3])
+    assert len(algo.states) == 2
+    last_state = algo.states[-1]
+    assert last_state.content["state_type"] == "priorityqueue_offer_many"
+    assert last_state.content["state_def"]["elements"] == [6, 0, 3]
+    assert last_state.content["state_def"]["body"] == pq.body
+    pq.offer_many([])
+    assert len(algo.states) == 2
+    assert [pq.poll() for _ in range(len(pq))] == [0, 1, 2, 3, 4, 6, 7, 8, 9]
+
+def test_heapify_trace():
+    """Test sift states generated while heapifying
+    """
+    algo = ARgorithmToolkit.StateSet()
+    pq = ARgorithmToolkit.PriorityQueue("pq",algo,data=[5, 4, 3, 2, 1],trace=True)
+    assert algo.states[0].content["state_def"]["body"] == [5, 4, 3, 2, 1]
+    sifts = algo.states[1:]
+    assert [x.content["state_type"] for x in sifts] == ["priorityqueue_sift"]*len(sifts)
+    body = [5, 4, 3, 2, 1]
+    for state in sifts:
+        i,j = state.content["state_def"]["index1"],state.content["state_def"]["index2"]
+        assert j in (2*i+1,2*i+2)
+        body[i],body[j] = body[j],body[i]
+        assert state.content["state_def"]["body"] == body
+    assert body == pq.body
+    assert all(pq.body[(i-1)//2] <= pq.body[i] for i in range(1,len(pq)))
+
+    count = len(algo.states)
+    pq.offer_many([0, -1],trace=True)
+    assert algo.states[count].content["state_type"] == "priorityqueue_offer_many"
+    assert algo.states[-1].content["state_type"] == "priorityqueue_sift"
+    assert [pq.poll() for _ in range(len(pq))] == [-1, 0, 1, 2, 3, 4, 5]
+
+def test_bulk_delta():
+    """Test bulk construction in delta mode
+    """
+    algo = ARgorithmToolkit.StateSet(delta=True,keyframe_interval=100)
+    pq = ARgorithmToolkit.PriorityQueue("pq",algo,data=[3, 1, 2])
+    pq.offer_many([5, 0],trace=True)
+    pq.offer(4)
+    assert algo.body_at(len(algo.states)-1) == pq.body
+
+def test_indexed():
+    """Test indexed priority queue with key function
+    """
+    algo = ARgorithmToolkit.StateSet()
+    dist = {"a" : 5, "b" : 2, "c" : 8, "d" : 4}
+    pq = ARgorithmToolkit.PriorityQueue("pq",algo,data=dist,key=dist.get,indexed=True)
+    assert pq.peek() == "b"
+    assert "c" in pq and "e" not in pq
+
+    dist["c"] = 1
+    pq.decrease_key("c")
+    last_state = algo.states[-1]
+    assert last_state.content["state_type"] == "priorityqueue_update"
+    assert last_state.content["state_def"]["element"] == "c"
+    assert last_state.content["state_def"]["index"] == 0
+    assert pq.peek() == "c"
+
+    dist["c"] = 9
+    try:
+        pq.decrease_key("c")
+        assert False
+    except ARgorithmToolkit.ARgorithmError:
+        pass
+    pq.update("c")
+    assert pq.peek() == "b"
+
+    pq.remove("d")
+    last_state = algo.states[-1]
+    assert last_state.content["state_type"] == "priorityqueue_remove"
+    assert last_state.content["state_def"]["element"] == "d"
+    assert "d" not in pq
+    for method in [pq.update,pq.remove]:
+        try:
+            method("d")
+            assert False
+        except ARgorithmToolkit.ARgorithmError:
+            pass
+    try:
+        pq.offer("a")
+        assert False
+    except ARgorithmToolkit.ARgorithmError:
+        pass
+    assert [pq.poll() for _ in range(len(pq))] == ["b", "a", "c"]
+    assert not pq._positions
+
+def test_indexed_random():
+    """Test indexed priority queue against sorting
+    """
+    rng = random.Random(0)
+    algo = ARgorithmToolkit.StateSet()
+    priority = {x : rng.randint(0,50) for x in range(200)}
+    pq = ARgorithmToolkit.PriorityQueue("pq",algo,data=range(100),key=priority.get,indexed=True)
+    pq.offer_many(range(100,150))
+    for x in range(150,200):
+        pq.offer(x)
+    for x in rng.sample(range(200),60):
+        priority[x] = rng.randint(0,50)
+        pq.update(x)
+    removed = set(rng.sample(range(200),40))
+    for x in removed:
+        pq.remove(x)
+    for i,x in enumerate(pq.body):
+        assert pq._positions[x] == i
+    order = [pq.poll() for _ in range(len(pq))]
+    assert sorted(order) == sorted(set(range(200)) - removed)
+    assert [priority[x] for x in order] == sorted(priority[x] for x in order)
+
+def test_remove_plain():
+    """Test removing from priority queue without index
+    """
+    algo = ARgorithmToolkit.StateSet()
+    pq = ARgorithmToolkit.PriorityQueue("pq",algo,data=[7, 3, 9, 1, 5])
+    pq.remove(3)
+    assert 3 not in pq and 9 in pq
+    pq.offer(2)
+    assert [pq.poll() for _ in range(len(pq))] == [1, 2, 5, 7, 9]
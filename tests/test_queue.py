@@ -48,3 +48,36 @@ def test_size():
     """Test queue size
     """
     assert queue.empty() and len(queue)==0
+
+def test_state_bodies():
+    """Test bodies stored in states are not affected by later operations
+    """
+    algo = ARgorithmToolkit.StateSet()
+    queue = ARgorithmToolkit.Queue("q",algo)
+    for x in range(1200):
+        queue.push(x)
+    first = algo.states[-1].content["state_def"]["body"]
+    for x in range(1100):
+        assert queue.pop() == x
+    assert len(queue) == 100 and queue.front() == 1100 and queue.back() == 1199
+    assert first == list(range(1200))
+    assert algo.states[-3].content["state_def"]["body"] == list(range(1100,1200))
+    states = ARgorithmToolkit.serializers.loads(algo.dumps())
+    assert states[1200]["state_def"]["body"] == list(range(1200))
+    assert states[-1]["state_def"]["body"] == queue.body
+
+def test_read_only_body():
+    """Test body of queue cannot be changed in place
+    """
+    algo = ARgorithmToolkit.StateSet()
+    queue = ARgorithmToolkit.Queue("q",algo)
+    queue.push(1)
+    for change in [lambda x: x.append(2),lambda x: x.__setitem__(0,2)]:
+        try:
+            change(queue.body)
+            assert False
+        except (AttributeError,TypeError):
+            pass
+    assert queue.body == [1]
+    queue.body = [4,5]
+    assert queue.pop() == 4 and queue.body == [5]
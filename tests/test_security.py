@@ -0,0 +1,70 @@
+"""Testing injection check
+"""
+import os
+from ARgorithmToolkit import security
+from ARgorithmToolkit.security import inspect_code, check_file, injection_check, ARgorithmInjectionError
+
+EXAMPLES = os.path.join(os.path.dirname(__file__),"..","examples")
+
+CODE = """import ARgorithmToolkit
+from ARgorithmToolkit.utils import StateSet
+
+def run(**kwargs):
+    algo = StateSet()
+    x = ().__class__.__bases__[0].__subclasses__()
+    __import__("os")
+    def inner():
+        import subprocess
+    return eval("algo")
+"""
+
+def test_examples():
+    """Test examples pass the injection check
+    """
+    for name in ["bubblesort","fibonacci","infix_to_postfix","sample"]:
+        injection_check(os.path.join(EXAMPLES,f"{name}.py"))
+
+def test_diagnostics():
+    """Test every problem is reported with its position
+    """
+    assert [(x.line,x.code) for x in inspect_code(CODE)] == [
+        (6,"forbidden-attribute"),
+        (6,"forbidden-attribute"),
+        (7,"forbidden-name"),
+        (9,"invalid-import"),
+        (10,"forbidden-name"),
+    ]
+    assert [x.code for x in inspect_code("from os import path\nconfig = 1")] == ["no-toolkit","invalid-import","forbidden-name"]
+    assert [x.code for x in inspect_code("import ARgorithmToolkit\ndef run(:")] == ["syntax-error"]
+
+def test_cached_verdict(tmp_path):
+    """Test verdicts are cached by content and rejected files raise
+    """
+    codepath = tmp_path / "harmful.py"
+    codepath.write_text(CODE)
+    diagnostics = check_file(str(codepath))
+    key = list(security._VERDICTS)[-1] # pylint: disable=protected-access
+    assert list(security._VERDICTS[key]) == diagnostics # pylint: disable=protected-access
+    other = tmp_path / "copy.py"
+    other.write_text(CODE)
+    assert check_file(str(other)) == diagnostics
+    assert list(security._VERDICTS)[-1] == key # pylint: disable=protected-access
+    try:
+        injection_check(str(codepath))
+        assert False
+    except ARgorithmInjectionError as ex:
+        assert ex.diagnostics == diagnostics
+        assert "10:" in str(ex)
+
+def test_invalid_utf8(tmp_path):
+    """Test files that are not utf-8 are rejected with a diagnostic
+    """
+    codepath = tmp_path / "latin1.py"
+    codepath.write_bytes("import ARgorithmToolkit\nname = 'café'\n".encode("latin-1"))
+    diagnostics = check_file(str(codepath))
+    assert [(x.line,x.column,x.code) for x in diagnostics] == [(2,11,"syntax-error")]
+    try:
+        injection_check(str(codepath))
+        assert False
+    except ARgorithmInjectionError as ex:
+        assert "0xe9" in str(ex)
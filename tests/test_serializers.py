@@ -0,0 +1,93 @@
+"""Testing StateSet serializers
+"""
+import json
+import numpy as np
+import ARgorithmToolkit
+
+def build():
+    """Creates StateSet using multiple structures
+    """
+    algo = ARgorithmToolkit.StateSet()
+    arr = ARgorithmToolkit.Array("arr",algo,data=[[1,2,3],[4,5,6]])
+    arr.swap((0,0),(1,2))
+    farr = ARgorithmToolkit.Array("farr",algo,data=[0.5,1.5,2.5,3.5,4.5])
+    farr[2] = 7.25
+    vec = ARgorithmToolkit.Vector("vec",algo,[1,"a",None,True,2**70])
+    vec.insert(arr)
+    mp = ARgorithmToolkit.Map("map",algo)
+    mp["key"] = 3
+    ARgorithmToolkit.Variable("var",algo,np.int64(4))
+    algo.add_comment("done")
+    return algo
+
+def test_binary_roundtrip():
+    """Test binary format decodes to the same states as JSON
+    """
+    algo = build()
+    expected = json.loads(algo.dumps("json"))
+    data = algo.dumps("binary")
+    assert data[:4] == b"ARGS"
+    assert ARgorithmToolkit.serializers.loads(data) == expected
+    assert ARgorithmToolkit.serializers.loads(algo.dumps()) == expected
+
+def test_typed_buffers():
+    """Test numeric bodies are stored as typed buffers
+    """
+    algo = ARgorithmToolkit.StateSet()
+    ARgorithmToolkit.Array("arr",algo,data=list(range(1000)))
+    binary = algo.dumps("binary")
+    assert len(binary) < 1000*8 + 200
+    serializer = ARgorithmToolkit.serializers.BinarySerializer(arrays=True)
+    body = serializer.loads(binary)[0]["state_def"]["body"]
+    assert isinstance(body,np.ndarray)
+    assert body.tolist() == list(range(1000))
+
+def test_body_refs():
+    """Test repeated bodies are written once and expanded on load
+    """
+    algo = ARgorithmToolkit.StateSet()
+    queue = ARgorithmToolkit.Queue("q",algo)
+    for x in range(100):
+        queue.push(x)
+    for _ in range(20):
+        queue.front()
+        queue.back()
+    expected = json.loads(algo.dumps("json"))
+    data = algo.dumps("json_refs")
+    state_defs = [x["state_def"] for x in json.loads(data)]
+    assert [x["body_ref"] for x in state_defs[-40:]] == [100]*40
+    assert all("body" not in x for x in state_defs[-40:])
+    assert state_defs[100]["body"] == list(range(100))
+    assert ARgorithmToolkit.serializers.loads(data,"json_refs") == expected
+    assert ARgorithmToolkit.serializers.loads(algo.dumps("binary")) == expected
+
+def test_map_bodies():
+    """Test bodies shaped like references and non string keys load the same in every format
+    """
+    algo = ARgorithmToolkit.StateSet()
+    ref = ARgorithmToolkit.Map("ref",algo)
+    ref["$ref"] = 0
+    ref.get("$ref")
+    ref.get("$ref")
+    keys = ARgorithmToolkit.Map("keys",algo)
+    keys[1] = "int"
+    keys[2.5] = "float"
+    keys[True] = "bool"
+    expected = json.loads(algo.dumps("json"))
+    assert expected[2]["state_def"]["body"] == {"$ref" : 0}
+    for fmt in ["json_refs","binary"]:
+        assert ARgorithmToolkit.serializers.loads(algo.dumps(fmt),fmt) == expected
+
+def test_registry():
+    """Test serializer registration and errors
+    """
+    try:
+        ARgorithmToolkit.StateSet().dumps("unknown")
+        assert False
+    except ARgorithmToolkit.ARgorithmError:
+        pass
+    try:
+        ARgorithmToolkit.serializers.loads(b"ARGS\x09","binary")
+        assert False
+    except ARgorithmToolkit.ARgorithmError:
+        pass
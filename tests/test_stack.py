@@ -42,3 +42,23 @@ def test_size():
     """Test size operations
     """
     assert stack.empty() and len(stack)==0
+
+def test_shared_bodies():
+    """Test read states share the body of the last state while the stack is unchanged
+    """
+    algo = ARgorithmToolkit.StateSet()
+    stack = ARgorithmToolkit.Stack("st",algo)
+    stack.push(1)
+    stack.top()
+    stack.top()
+    assert algo.states[-1].state_def["body"] is algo.states[-3].state_def["body"]
+    stack.push(2)
+    stack.top()
+    assert algo.states[-1].state_def["body"] is algo.states[-2].state_def["body"]
+    assert algo.states[-1].state_def["body"] is not algo.states[-3].state_def["body"]
+    assert algo.states[-1].state_def["body"] == [1,2]
+    assert algo.states[-3].state_def["body"] == [1]
+    assert algo.shared_body(stack._id,stack._version).body is algo.states[-1].state_def["body"]
+    assert algo.shared_body(stack._id,stack._version-1) is None
+    shared = ARgorithmToolkit.SharedBody([1,2])
+    assert stack.state_generator.stack_top(shared).state_def["body"] is shared.body
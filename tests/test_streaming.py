@@ -0,0 +1,50 @@
+"""Testing StreamingStateSet
+"""
+import io
+import ARgorithmToolkit
+
+def test_stream_buffer():
+    """Test states are flushed to sink in batches
+    """
+    sink = io.StringIO()
+    algo = ARgorithmToolkit.StreamingStateSet(sink,buffer_size=4)
+    assert isinstance(algo,ARgorithmToolkit.StateSet)
+    vec = ARgorithmToolkit.Vector("vec",algo,[3,1,2])
+    for i in range(5):
+        vec.insert(i)
+    assert len(algo.states) < 4
+    assert algo.count == 6
+    algo.close()
+    assert len(algo.states) == 0
+    sink.seek(0)
+    states = list(ARgorithmToolkit.StreamingStateSet.load(sink))
+    assert len(states) == 6
+    assert states[0]["state_type"] == "vector_declare"
+    assert states[-1]["state_def"]["body"] == [3,1,2,0,1,2,3,4]
+    try:
+        algo.add_comment("closed")
+        assert False
+    except ARgorithmToolkit.ARgorithmError:
+        pass
+
+def test_stream_file(tmp_path):
+    """Test streaming states to a file
+    """
+    path = tmp_path / "states.jsonl"
+    with ARgorithmToolkit.StreamingStateSet(str(path)) as algo:
+        arr = ARgorithmToolkit.Array("arr",algo,data=[[1,2],[3,4]])
+        arr.swap((0,0),(1,1))
+        algo.add_comment("done")
+    states = list(ARgorithmToolkit.StreamingStateSet.load(str(path)))
+    assert [x["state_type"] for x in states] == ["array_declare","array_swap","comment"]
+    assert states[1]["state_def"]["body"] == [[4,2],[3,1]]
+
+def test_stream_encoding(tmp_path):
+    """Test streamed files are utf-8 whatever the locale
+    """
+    path = tmp_path / "states.jsonl"
+    with ARgorithmToolkit.StreamingStateSet(str(path)) as algo:
+        algo.add_comment("triée ✓")
+    path.read_bytes().decode("utf-8")
+    states = list(ARgorithmToolkit.StreamingStateSet.load(str(path)))
+    assert states[0]["comments"] == "triée ✓"
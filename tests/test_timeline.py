@@ -0,0 +1,58 @@
+"""Testing timeline index of StateSet
+"""
+import numpy as np
+import ARgorithmToolkit
+
+def run(algo):
+    """Runs operations on multiple structures
+    """
+    arr = ARgorithmToolkit.Array("arr",algo,data=list(range(20,0,-1)))
+    st = ARgorithmToolkit.Stack("st",algo)
+    var = ARgorithmToolkit.Variable("var",algo,0)
+    algo.add_comment("start")
+    for i in range(len(arr)):
+        for j in range(i+1,len(arr)):
+            if arr.compare(i,j) > 0:
+                arr.swap(i,j)
+                st.push(j)
+        var.value = i
+    return arr,st,var
+
+def test_lookup():
+    """Test bodies found by timeline match full snapshots
+    """
+    full = ARgorithmToolkit.StateSet()
+    run(full)
+    algo = ARgorithmToolkit.StateSet(delta=True,keyframe_interval=10000)
+    timeline = ARgorithmToolkit.Timeline(algo,checkpoint_interval=50)
+    arr,st,var = run(algo)
+    assert timeline.states_for(arr)[:2] == [0,4]
+    assert timeline.ids("st") == [st._id]
+    assert timeline.body_at(st,0) is None and timeline.body_at(st,2) == []
+    assert timeline.body_at(var,3) == 0
+    for step in range(0,len(full.states),7):
+        expected = {}
+        for index in range(step+1):
+            state_def = full.states[index].state_def
+            if state_def is not None:
+                expected[state_def["variable_name"]] = state_def.get("body",state_def.get("value"))
+        snapshot = {timeline.names[k]:v for k,v in timeline.snapshot_at(step).items()}
+        assert snapshot.keys() == expected.keys()
+        for key,body in expected.items():
+            assert np.array_equal(snapshot[key],body)
+    assert timeline.body_at(arr,len(algo.states)).tolist() == list(range(1,21))
+
+def test_existing_states():
+    """Test timeline indexes states added before its creation
+    """
+    algo = ARgorithmToolkit.StateSet()
+    arr,st,_ = run(algo)
+    timeline = ARgorithmToolkit.Timeline(algo)
+    st.pop()
+    assert timeline.states_for(st)[-1] == len(algo.states)-1
+    assert timeline.body_at(arr,len(algo.states)).tolist() == list(range(1,21))
+    try:
+        ARgorithmToolkit.Timeline(ARgorithmToolkit.StreamingStateSet([]))
+        assert False
+    except ARgorithmToolkit.ARgorithmError:
+        pass
@@ -106,3 +106,35 @@ def test_swap():
     assert last_state.content["state_def"]["index1"] == 0
     assert last_state.content["state_def"]["index2"] == 1
     assert last_state.content["state_def"]["body"] == arr.body
+
+def test_bulk_operations():
+    """Test bulk insertion and removal
+    """
+    algo = ARgorithmToolkit.StateSet()
+    vec = ARgorithmToolkit.Vector("vec",algo,[1,6])
+    vec.extend(range(7,10))
+    assert vec.body == [1,6,7,8,9]
+    last_state = algo.states[-1]
+    assert last_state.content["state_type"] == "vector_extend"
+    assert last_state.content["state_def"]["elements"] == [7,8,9]
+
+    vec.insert_many([2,3,4,5],1)
+    assert vec.body == list(range(1,10))
+    last_state = algo.states[-1]
+    assert last_state.content["state_type"] == "vector_insert_many"
+    assert last_state.content["state_def"]["index"] == 1
+    assert last_state.content["state_def"]["body"] == vec.body
+
+    vec.remove_range(2,7)
+    assert vec.body == [1,2,8,9]
+    last_state = algo.states[-1]
+    assert last_state.content["state_type"] == "vector_remove_range"
+    assert (last_state.content["state_def"]["start"],last_state.content["state_def"]["stop"]) == (2,7)
+    assert len(algo.states) == 4
+
+    for args in [(0,5),(3,2),(-1,2)]:
+        try:
+            vec.remove_range(*args)
+            assert False
+        except ARgorithmToolkit.ARgorithmError:
+            pass